@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmarks
+Run BlogOrchestrator end to end against the local stand-in server (no API spend)
+
+Each scenario runs in its own process (fresh config, own peak memory) with
+N planned articles, a throwaway git repository for the worktrees and every
+endpoint (Perplexity, Azure OpenAI, Zapier) pointed at the stand-in. Results
+are stored in benchmarks/results/ and compared with the latest stored run of
+another commit with the same settings.
+
+Usage:
+    python benchmarks/run_benchmarks.py                             # 3, 30 and 300 articles
+    python benchmarks/run_benchmarks.py --sizes 3 30 --latency 0.2 --latency-sigma 0.5
+    python benchmarks/run_benchmarks.py --route-latency responses=2 perplexity=1
+    python benchmarks/run_benchmarks.py --error-rate 0.02 --throttle-rate 0.05 --fail-on-regression
+"""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCHMARKS_DIR)
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+
+sys.path.insert(0, SRC_DIR)
+
+# Metrics compared between runs (lower is better)
+COMPARED_METRICS = ["wall_seconds", "peak_memory_mb", "requests_total"]
+
+
+def build_env(workdir: str, base_url: str, articles: int, args: argparse.Namespace) -> Dict[str, str]:
+    """
+    Environment of one scenario process
+
+    Args:
+        workdir: Scenario scratch directory (caches, reports, traces)
+        base_url: Stand-in base URL
+        articles: Planned articles
+        args: Suite options
+
+    Returns:
+        Environment with every endpoint on the stand-in and all state under workdir
+    """
+    plan_path = os.path.join(workdir, "run_plan.json")
+    with open(plan_path, "w", encoding="utf-8") as f:
+        json.dump({"articles": plan_articles(articles)}, f)
+
+    env = {
+        **os.environ,
+        "AZURE_OPENAI_ENDPOINT": base_url,
+        "AZURE_OPENAI_KEY": "benchmark",
+        "PERPLEXITY_ENDPOINT": f"{base_url}chat/completions",
+        "PERPLEXITY_API_KEY": "benchmark",
+        "ZAPIER_WEBHOOK_URL": f"{base_url}hooks/zapier",
+        "RUN_PLAN_PATH": plan_path,
+        # Every run starts cold and is not cut short
+        "LLM_CACHE_ENABLED": "false",
+        "RESEARCH_CACHE_ENABLED": "false",
+        "CHECKPOINT_ENABLED": "false",
+        "RUN_DEADLINE_SECONDS": "0",
+        "REPORTS_DIR": os.path.join(workdir, "reports"),
+        "TRACE_DIR": os.path.join(workdir, "traces"),
+        "LATENCY_STATS_PATH": os.path.join(workdir, "latency_stats.json"),
+        "BACKGROUND_JOBS_PATH": os.path.join(workdir, "background_jobs.json"),
+        "BATCH_LOCAL_DIR": os.path.join(workdir, "batches")
+    }
+    if not args.keep_quotas:
+        # Measure the pipeline, not the configured Azure quota
+        env.update({"GPT5_RPM": "0", "GPT5_TPM": "0", "GPT5_PRO_RPM": "0", "GPT5_PRO_TPM": "0"})
+    return env
+
+
+def plan_articles(count: int) -> List[Dict]:
+    """
+    Run plan of `count` articles cycling through the instrument universe
+
+    Every article gets its own plan id, so repeated assets still have distinct
+    checkpoint and delivery keys instead of being deduplicated.
+    """
+    from services.asset_ranking import load_universe
+    from services.image_manager import ImageManager
+    from config.credentials import ASSET_UNIVERSE_PATH
+
+    universe = load_universe(ASSET_UNIVERSE_PATH, ImageManager().asset_folders)
+    assets = [(category, asset) for category, names in universe.items() for asset in names]
+    articles = []
+    for i in range(count):
+        category, asset = assets[i % len(assets)]
+        articles.append({"category": category, "asset": asset, "id": f"{asset}-{i + 1}"})
+    return articles
+
+
+def init_repo(path: str) -> None:
+    """Throwaway git repository on main for the worktrees"""
+    os.makedirs(path)
+    for cmd in (
+        ["git", "init", "-q", "-b", "main"],
+        ["git", "-c", "user.name=benchmark", "-c", "user.email=benchmark@localhost",
+         "commit", "-q", "--allow-empty", "-m", "benchmark"]
+    ):
+        subprocess.run(cmd, cwd=path, check=True)
+
+
+async def run_suite(args: argparse.Namespace) -> Dict:
+    """
+    Run every scenario against one stand-in server
+
+    Args:
+        args: Suite options
+
+    Returns:
+        Dict article count -> scenario result
+    """
+    from utils.standin_server import StandinServer
+
+    server = StandinServer(
+        latency=args.latency,
+        latency_sigma=args.latency_sigma,
+        route_latency=args.route_latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        background_duration=args.background_duration,
+        seed=args.seed
+    )
+    base_url = await server.start()
+
+    scenarios = {}
+    try:
+        for articles in args.sizes:
+            print(f"▶ {articles} articles...", flush=True)
+            requests_before = dict(server.request_counts)
+            injected_before = dict(server.injected)
+
+            with tempfile.TemporaryDirectory(prefix="blog-benchmark-") as workdir:
+                repo = os.path.join(workdir, "repo")
+                init_repo(repo)
+                result_path = os.path.join(workdir, "result.json")
+
+                process = await asyncio.create_subprocess_exec(
+                    sys.executable, os.path.abspath(__file__), "--scenario", str(articles), "--result", result_path,
+                    cwd=repo,
+                    env=build_env(workdir, base_url, articles, args)
+                )
+                await process.wait()
+
+                if process.returncode != 0 or not os.path.exists(result_path):
+                    result = {"articles": articles, "success": False, "error": f"exit code {process.returncode}"}
+                else:
+                    with open(result_path, "r", encoding="utf-8") as f:
+                        result = json.load(f)
+
+            requests = {
+                route: count - requests_before.get(route, 0)
+                for route, count in server.request_counts.items()
+                if count > requests_before.get(route, 0)
+            }
+            result["requests"] = requests
+            result["requests_total"] = sum(requests.values())
+            result["injected_faults"] = {k: v - injected_before.get(k, 0) for k, v in server.injected.items()}
+            scenarios[str(articles)] = result
+            print(
+                f"  {result.get('articles_generated', 0)}/{articles} articles in {result.get('wall_seconds', 0):.1f}s, "
+                f"{result['requests_total']} requests ({result['injected_faults']['429']} throttled, "
+                f"{result['injected_faults']['503']} failed), peak {result.get('peak_memory_mb', 0):.0f} MB",
+                flush=True
+            )
+    finally:
+        await server.stop()
+
+    return scenarios
+
+
+def run_scenario(articles: int, result_path: str) -> None:
+    """
+    Child process: run the orchestrator once and write its measurements
+
+    Args:
+        articles: Planned articles (for the result record)
+        result_path: Where the result JSON goes
+    """
+    import resource
+    from loguru import logger
+
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    from main_orchestrator import BlogOrchestrator
+    from utils.trace_waterfall import latest_trace, load_spans
+    from config.credentials import REPORTS_DIR
+
+    started = time.monotonic()
+    outcome = asyncio.run(BlogOrchestrator().run())
+    wall_seconds = time.monotonic() - started
+
+    trace = latest_trace()
+    spans = load_spans(trace) if trace else []
+    reports = sorted(glob.glob(os.path.join(REPORTS_DIR, "run_*.json")))
+    metadata = {}
+    if reports:
+        with open(reports[-1], "r", encoding="utf-8") as f:
+            metadata = json.load(f).get("metadata", {})
+
+    scheduler = metadata.get("scheduler") or {}
+    result = {
+        "articles": articles,
+        "success": outcome.get("success", False),
+        "error": outcome.get("error"),
+        "articles_generated": outcome.get("articles_generated", 0),
+        "wall_seconds": round(wall_seconds, 2),
+        # ru_maxrss is in KB on Linux
+        "peak_memory_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "articles_per_minute": scheduler.get("articles_per_minute"),
+        "peak_in_flight": scheduler.get("peak_in_flight"),
+        "phases": span_percentiles(spans, "phase", "phase"),
+        "llm_calls": span_percentiles(spans, "llm.call", "deployment"),
+        "delivery": metadata.get("delivery")
+    }
+
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+
+def span_percentiles(spans: List[Dict], name: str, attribute: str) -> Dict[str, Dict]:
+    """
+    p50/p95/max duration of spans with a name, per value of an attribute
+
+    Args:
+        spans: Spans from trace_waterfall.load_spans
+        name: Span name (phase, llm.call)
+        attribute: Attribute to group by (phase, deployment)
+
+    Returns:
+        Dict attribute value -> {"count", "p50", "p95", "max"} in seconds
+    """
+    from services.latency_stats import RollingLatencyWindow
+
+    selected = [span for span in spans if span["name"] == name]
+    window = RollingLatencyWindow(window=max(1, len(selected)))
+    for span in selected:
+        window.record(str(span["attributes"].get(attribute, "unknown")), span["end"] - span["start"])
+
+    return {
+        key: {
+            "count": window.count(key),
+            "p50": round(window.percentile(key, 0.5), 3),
+            "p95": round(window.percentile(key, 0.95), 3),
+            "max": round(window.percentile(key, 1.0), 3)
+        }
+        for key in window.keys()
+    }
+
+
+def compare(current: Dict, previous: Dict, threshold: float) -> List[str]:
+    """
+    Find metrics that got worse by more than the threshold
+
+    Args:
+        current: Scenarios of this run
+        previous: Scenarios of the stored run
+        threshold: Allowed relative increase (0.2 = 20%)
+
+    Returns:
+        Regression descriptions
+    """
+    regressions = []
+    for size, result in current.items():
+        before = previous.get(size)
+        if not before or not before.get("success"):
+            continue
+
+        metrics = {metric: (result.get(metric), before.get(metric)) for metric in COMPARED_METRICS}
+        for phase, stats in result.get("phases", {}).items():
+            metrics[f"phase {phase} p95"] = (stats["p95"], before.get("phases", {}).get(phase, {}).get("p95"))
+
+        for metric, (now, then) in metrics.items():
+            # Sub-50 ms phase differences are noise, not regressions
+            if not then or now is None or now - then < 0.05:
+                continue
+            if now > then * (1 + threshold):
+                regressions.append(f"{size} articles: {metric} {then} → {now} (+{(now / then - 1) * 100:.0f}%)")
+        if before.get("articles_generated", 0) > result.get("articles_generated", 0):
+            regressions.append(
+                f"{size} articles: articles generated {before['articles_generated']} → {result.get('articles_generated', 0)}"
+            )
+    return regressions
+
+
+def git_commit() -> Dict:
+    """Current commit and whether the tree has uncommitted changes"""
+    def git(*cmd):
+        return subprocess.run(["git", *cmd], cwd=PROJECT_ROOT, capture_output=True, text=True).stdout.strip()
+    return {"commit": git("rev-parse", "HEAD") or "unknown", "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def previous_result(settings: Dict, commit: str) -> Optional[Dict]:
+    """Latest stored run of another commit with the same settings"""
+    for path in sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")), reverse=True):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if stored.get("settings") == settings and stored.get("commit") != commit:
+            return {**stored, "path": path}
+    return None
+
+
+def _route_latency(values: List[str]) -> Dict[str, float]:
+    """Parse route=seconds pairs"""
+    routes = {}
+    for value in values:
+        route, _, seconds = value.partition("=")
+        routes[route] = float(seconds)
+    return routes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmarks against the local stand-in")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 30, 300], help="Articles per scenario")
+    parser.add_argument("--latency", type=float, default=0.05, help="Median stand-in latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.3, help="Log-normal latency spread")
+    parser.add_argument("--route-latency", nargs="*", default=[], metavar="ROUTE=SECONDS",
+                        help="Median latency per route (chat, responses, perplexity, zapier)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds of injected 429s")
+    parser.add_argument("--background-duration", type=float, default=2.0, help="Seconds per background job")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for latency and fault injection")
+    parser.add_argument("--keep-quotas", action="store_true", help="Keep the configured Azure RPM/TPM quotas")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Relative increase reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 when a regression is found")
+    parser.add_argument("--no-save", action="store_true", help="Do not store the results")
+    parser.add_argument("--scenario", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario is not None:
+        run_scenario(args.scenario, args.result)
+        return 0
+
+    args.route_latency = _route_latency(args.route_latency)
+    settings = {
+        "latency": args.latency,
+        "latency_sigma": args.latency_sigma,
+        "route_latency": args.route_latency,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after,
+        "background_duration": args.background_duration,
+        "seed": args.seed,
+        "keep_quotas": args.keep_quotas
+    }
+    commit = git_commit()
+    scenarios = asyncio.run(run_suite(args))
+
+    record = {**commit, "created_at": datetime.now().isoformat(), "settings": settings, "scenarios": scenarios}
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d_%H%M%S}_{commit['commit'][:8]}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+        print(f"Results written to {path}")
+
+    previous = previous_result(settings, commit["commit"])
+    if previous is None:
+        print("No stored run of another commit with these settings to compare against")
+        return 0
+
+    regressions = compare(scenarios, previous["scenarios"], args.threshold)
+    print(f"Compared with {previous['commit'][:8]} ({os.path.basename(previous['path'])})")
+    for regression in regressions:
+        print(f"  ⚠️  {regression}")
+    if not regressions:
+        print("  No regressions")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Phase Pipeline
+Small dependency-graph executor: phases declare their inputs and run as soon as those are ready
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from services.checkpoints import ArticleCheckpoints, fingerprint
+from services.tracing import span
+
+
+class PhaseFailed(Exception):
+    """Raised by a phase to stop the pipeline (the message becomes the agent's error)"""
+
+
+class Provisional:
+    """
+    Phase result that is passed on but not checkpointed
+
+    For results a resumed run should redo rather than reuse: failed or
+    unreviewed translations, skipped phases and fallback values.
+    """
+
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class Pipeline:
+    """
+    Runs async phases in dependency order, independent phases concurrently
+
+    A phase is called with the results of the phases it requires as keyword
+    arguments and its return value becomes its own result. Phases can only
+    require phases added before them, so the graph is acyclic by construction.
+    The first failing phase cancels everything still running.
+
+    With checkpoints, every result is stored along with a fingerprint of its
+    inputs, and a resumed run returns the stored result instead of running
+    a phase whose inputs are unchanged. A phase returning Provisional(value)
+    passes value on without storing it, so a resumed run runs it again.
+    """
+
+    def __init__(self, checkpoints: Optional[ArticleCheckpoints] = None):
+        """
+        Initialize pipeline
+
+        Args:
+            checkpoints: Where phase results are stored and resumed from (None = not stored)
+        """
+        self.checkpoints = checkpoints
+        self._phases: Dict[str, Tuple[Callable[..., Awaitable[Any]], Tuple[str, ...]]] = {}
+        self._started = 0.0
+        self.timings: Dict[str, Dict] = {}
+
+    def add(self, name: str, func: Callable[..., Awaitable[Any]], requires: Sequence[str] = ()) -> "Pipeline":
+        """
+        Add a phase
+
+        Args:
+            name: Phase name (also the keyword its result is passed as)
+            func: Async callable taking the required results as keyword arguments
+            requires: Names of the phases whose results it needs
+
+        Returns:
+            The pipeline (for chaining)
+        """
+        unknown = [r for r in requires if r not in self._phases]
+        if unknown:
+            raise ValueError(f"Phase {name} requires unknown phases {unknown}")
+        self._phases[name] = (func, tuple(requires))
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run every phase
+
+        Returns:
+            Dict phase name -> result
+
+        Raises:
+            PhaseFailed (or any exception a phase raised)
+        """
+        self._started = time.monotonic()
+        self.timings = {}
+        results: Dict[str, Any] = {}
+        pending = dict(self._phases)
+        running: Dict[asyncio.Task, str] = {}
+
+        try:
+            while pending or running:
+                ready = [name for name, (_, requires) in pending.items() if all(r in results for r in requires)]
+                for name in ready:
+                    func, requires = pending.pop(name)
+                    task = asyncio.create_task(self._run_phase(name, func, {r: results[r] for r in requires}))
+                    running[task] = name
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    results[running.pop(task)] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        return results
+
+    async def _run_phase(self, name: str, func: Callable[..., Awaitable[Any]], inputs: Dict[str, Any]) -> Any:
+        """Run one phase and record when it started and finished"""
+        start = time.monotonic() - self._started
+        timing = self.timings[name] = {
+            "started_at": datetime.now().isoformat(),
+            "start_seconds": round(start, 3),
+            "requires": list(self._phases[name][1])
+        }
+        try:
+            with span("phase", phase=name) as phase_span:
+                if self.checkpoints is None:
+                    return _unwrap(await func(**inputs))
+
+                inputs_hash = fingerprint(inputs)
+                stored = self.checkpoints.load(name, inputs_hash)
+                if stored is not None:
+                    timing["resumed"] = True
+                    phase_span.set(resumed=True)
+                    return stored["value"]
+
+                result = await func(**inputs)
+                if isinstance(result, Provisional):
+                    timing["provisional"] = True
+                    phase_span.set(provisional=True)
+                    return result.value
+
+                self.checkpoints.save(name, inputs_hash, result)
+                return result
+        finally:
+            finish = time.monotonic() - self._started
+            timing["finish_seconds"] = round(finish, 3)
+            timing["seconds"] = round(finish - start, 3)
+
+    def critical_path(self) -> List[str]:
+        """
+        Chain of phases that determined the total run time
+
+        Walks back from the last phase to finish, each time to the input
+        that finished last (the one the phase was waiting on).
+
+        Returns:
+            Phase names, first to last
+        """
+        finished = {name: t for name, t in self.timings.items() if "finish_seconds" in t}
+        if not finished:
+            return []
+
+        # Ties (instant phases) go to the later-started phase, i.e. the dependent one
+        def last(names):
+            return max(names, key=lambda name: (finished[name]["finish_seconds"], finished[name]["start_seconds"]))
+
+        path = [last(finished)]
+        while True:
+            inputs = [r for r in finished[path[-1]]["requires"] if r in finished]
+            if not inputs:
+                break
+            path.append(last(inputs))
+        return path[::-1]
+
+    def report(self) -> Dict:
+        """Per-phase timings plus the critical path (for the article package)"""
+        return {
+            "phases": self.timings,
+            "critical_path": self.critical_path(),
+            "total_seconds": max((t.get("finish_seconds", 0.0) for t in self.timings.values()), default=0.0)
+        }
+
+
+def _unwrap(result: Any) -> Any:
+    """Value of a phase result (see Provisional)"""
+    return result.value if isinstance(result, Provisional) else result
@@ -0,0 +1,268 @@
+"""
+Article Scheduler
+Fans a run plan (articles x languages) out to content generation agents with bounded concurrency
+"""
+
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+from loguru import logger
+
+from services.service_container import ServiceContainer
+from services.checkpoints import CheckpointStore
+from services.html_formatter import LANGUAGES
+from services.tracing import span
+from config.credentials import (
+    RUN_PLAN_CATEGORIES,
+    RUN_PLAN_ARTICLES_PER_CATEGORY,
+    RUN_PLAN_LANGUAGES,
+    MAX_ARTICLES_IN_FLIGHT
+)
+from agents.content_generation_agent import ContentGenerationAgent
+
+
+class RunPlan:
+    """
+    Articles to write in a run and the languages each one is translated to
+
+    Each article is {"category", "asset", "rank", "id"}: a fixed asset, or
+    (asset None) the rank-th best asset of the category's ranking. The
+    optional id tells apart several articles on the same asset.
+    """
+
+    def __init__(self, articles: List[Dict], languages: List[str]):
+        """
+        Initialize plan
+
+        Args:
+            articles: Article specs in run order
+            languages: Translation languages (keys of html_formatter.LANGUAGES)
+        """
+        self.articles = articles
+        self.languages = languages
+
+    @property
+    def categories(self) -> List[str]:
+        """Categories in the plan, in first-seen order"""
+        return list(dict.fromkeys(article["category"] for article in self.articles))
+
+    @staticmethod
+    def article_key(article: Dict) -> str:
+        """Stable name of a planned article (checkpoint folder), e.g. forex-eur-usd or forex-ranked-2"""
+        if article.get("id"):
+            return f"{article['category']}-{article['id']}"
+        return f"{article['category']}-{article['asset'] or 'ranked-' + str(article['rank'] + 1)}"
+
+    def describe(self) -> Dict:
+        """Plan summary for run metadata"""
+        return {
+            "articles": [
+                {"category": a["category"], "asset": a["asset"] or f"ranked #{a['rank'] + 1}"}
+                for a in self.articles
+            ],
+            "languages": self.languages
+        }
+
+
+def load_run_plan(
+    path: Optional[str],
+    universe: Dict[str, Dict[str, Dict]],
+    categories: List[str] = RUN_PLAN_CATEGORIES,
+    per_category: int = RUN_PLAN_ARTICLES_PER_CATEGORY,
+    languages: List[str] = RUN_PLAN_LANGUAGES
+) -> RunPlan:
+    """
+    Load the run plan
+
+    Args:
+        path: JSON file {"articles": [{"category", "asset"?, "id"?}], "languages": [...]} (None/missing = built from the defaults)
+        universe: Ranked instrument universe (caps ranked articles per category)
+        categories: Categories of the default plan
+        per_category: Ranked articles per category in the default plan
+        languages: Languages of the default plan
+
+    Returns:
+        RunPlan
+    """
+    specs = [{"category": category} for category in categories for _ in range(per_category)]
+
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            specs = raw.get("articles", specs)
+            languages = raw.get("languages", languages)
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable run plan {path}: {e}")
+
+    # Ranked picks are numbered per category; a category has only so many assets
+    articles, ranks = [], {}
+    for spec in specs:
+        category, asset = spec["category"], spec.get("asset")
+        rank = 0
+        if not asset:
+            rank = ranks.get(category, 0)
+            if rank >= len(universe.get(category, {})):
+                logger.warning(f"Run plan: no asset left to rank for another {category} article, dropped")
+                continue
+            ranks[category] = rank + 1
+        articles.append({"category": category, "asset": asset, "rank": rank, "id": spec.get("id")})
+
+    unknown = [language for language in languages if language not in LANGUAGES]
+    if unknown:
+        logger.warning(f"Run plan: unsupported languages {unknown} dropped")
+
+    return RunPlan(articles, [language for language in languages if language in LANGUAGES])
+
+
+class ArticleScheduler:
+    """
+    Runs one agent per planned article, at most max_in_flight at a time
+
+    Provider calls are additionally capped by the container's ProviderLimits,
+    so the plan can grow without sending more requests at Perplexity or a
+    deployment than it is configured to take.
+    """
+
+    def __init__(
+        self,
+        services: ServiceContainer,
+        plan: RunPlan,
+        max_in_flight: int = MAX_ARTICLES_IN_FLIGHT,
+        checkpoints: Optional[CheckpointStore] = None,
+        on_result: Optional[Callable[[Dict, Dict], Awaitable[None]]] = None
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            services: Shared service clients
+            plan: Articles and languages to produce
+            max_in_flight: Agents running at once (0 = all)
+            checkpoints: Run checkpoint store (None = phases are not checkpointed)
+            on_result: Awaited with (article spec, agent result) as each agent finishes
+        """
+        self.services = services
+        self.plan = plan
+        self.checkpoints = checkpoints
+        self.on_result = on_result
+        self.max_in_flight = max_in_flight if max_in_flight > 0 else max(1, len(plan.articles))
+
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._durations: List[float] = []
+        self._results: List[Dict] = []
+        self._elapsed = 0.0
+
+    async def run(self, worktrees: Dict[str, str]) -> List[Dict]:
+        """
+        Generate every planned article
+
+        Args:
+            worktrees: Dict mapping category to worktree path
+
+        Returns:
+            Agent results in plan order (failures included)
+        """
+        logger.info(
+            f"Scheduling {len(self.plan.articles)} articles x {len(self.plan.languages) + 1} languages, "
+            f"{self.max_in_flight} in flight"
+        )
+        slots = asyncio.Semaphore(self.max_in_flight)
+        started = time.monotonic()
+
+        self._results = await asyncio.gather(*(
+            self._run_article(spec, worktrees.get(spec["category"], ""), slots)
+            for spec in self.plan.articles
+        ))
+
+        self._elapsed = time.monotonic() - started
+        stats = self.stats()
+        logger.info(
+            f"Generated {stats['articles_succeeded']}/{stats['articles_planned']} articles "
+            f"in {self._elapsed:.0f}s ({stats['articles_per_minute']} articles/min)"
+        )
+        return self._results
+
+    async def _run_article(self, spec: Dict, worktree_path: str, slots: asyncio.Semaphore) -> Dict:
+        """Run one agent once a slot is free"""
+        label = f"{spec['category']}/{spec['asset'] or '#' + str(spec['rank'] + 1)}"
+        queued = time.monotonic()
+        async with slots:
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            started = time.monotonic()
+
+            agent = ContentGenerationAgent(
+                spec["category"],
+                worktree_path,
+                self.services,
+                asset=spec["asset"],
+                rank=spec["rank"],
+                languages=self.plan.languages,
+                checkpoints=self.checkpoints.scope(RunPlan.article_key(spec)) if self.checkpoints else None,
+                article_id=spec.get("id")
+            )
+            with span(
+                "agent",
+                article=RunPlan.article_key(spec),
+                category=spec["category"],
+                queued_seconds=round(started - queued, 3)
+            ) as agent_span:
+                try:
+                    result = await agent.generate_article()
+                except Exception as e:
+                    logger.error(f"❌ {label} agent exception: {e}")
+                    result = {"success": False, "error": str(e)}
+                finally:
+                    await agent.close()
+                    self._in_flight -= 1
+                    self._durations.append(time.monotonic() - started)
+
+                if result.get("success"):
+                    agent_span.set(asset=result["package"].get("asset"), languages=len(result["package"]["languages"]))
+                else:
+                    agent_span.fail(str(result.get("error")))
+
+        if result.get("success"):
+            logger.success(f"✅ {label} agent completed successfully")
+        else:
+            logger.error(f"❌ {label} agent failed: {result.get('error')}")
+
+        # Outside the agent slot: delivering one article must not hold up the next agent
+        if self.on_result:
+            try:
+                await self.on_result(spec, result)
+            except Exception as e:
+                logger.error(f"❌ {label} result handler failed: {e}")
+        return result
+
+    def stats(self) -> Dict:
+        """
+        Throughput of the last run
+
+        Returns:
+            Dict with planned/succeeded counts, elapsed time, articles and
+            localized pages per minute, concurrency and per-provider limits
+        """
+        succeeded = [r["package"] for r in self._results if r.get("success") and "package" in r]
+        minutes = self._elapsed / 60
+        pages = sum(len(package["languages"]) for package in succeeded)
+        durations = sorted(self._durations)
+
+        return {
+            "articles_planned": len(self.plan.articles),
+            "articles_succeeded": len(succeeded),
+            "languages": len(self.plan.languages) + 1,
+            "elapsed_seconds": round(self._elapsed, 1),
+            "articles_per_minute": round(len(succeeded) / minutes, 2) if minutes else 0.0,
+            "pages_per_minute": round(pages / minutes, 2) if minutes else 0.0,
+            "article_seconds_p50": round(durations[len(durations) // 2], 1) if durations else None,
+            "article_seconds_max": round(durations[-1], 1) if durations else None,
+            "max_in_flight": self.max_in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "providers": self.services.limits.stats()
+        }
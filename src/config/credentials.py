@@ -6,6 +6,15 @@ Loaded from environment variables or GitHub Actions secrets
 import os
 from typing import Dict
 
+# Project root (3 levels up from this file: src/config/credentials.py)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output")
+
+
+def _env_flag(name: str, default: str) -> bool:
+    """Read a boolean environment variable (1/true/yes)"""
+    return os.getenv(name, default).strip().lower() in ("1", "true", "yes")
+
 # Azure OpenAI Configuration
 AZURE_OPENAI_KEY = os.getenv("AZURE_OPENAI_KEY")
 AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT", "https://brn-azai.cognitiveservices.azure.com/")
@@ -15,9 +24,132 @@ GPT5_DEPLOYMENT = os.getenv("GPT5_DEPLOYMENT", "gpt-5")
 GPT5_PRO_DEPLOYMENT = os.getenv("GPT5_PRO_DEPLOYMENT", "gpt-5-pro")
 GPT5_CODEX_DEPLOYMENT = os.getenv("GPT5_CODEX_DEPLOYMENT", "gpt-5-codex")
 
+
+# Stream GPT-5-Pro article generation over SSE (reports time to first token)
+LLM_STREAMING_ENABLED = _env_flag("LLM_STREAMING_ENABLED", "false")
+
+# Responses API background mode for GPT-5-Pro (see services/background_jobs.py)
+LLM_BACKGROUND_ENABLED = _env_flag("LLM_BACKGROUND_ENABLED", "false")
+BACKGROUND_JOBS_PATH = os.getenv("BACKGROUND_JOBS_PATH", os.path.join(OUTPUT_DIR, "cache", "background_jobs.json"))
+BACKGROUND_POLL_INTERVAL = float(os.getenv("BACKGROUND_POLL_INTERVAL", "5"))  # Seconds between status polls
+BACKGROUND_HEARTBEAT_INTERVAL = float(os.getenv("BACKGROUND_HEARTBEAT_INTERVAL", "30"))  # Seconds between progress logs
+BACKGROUND_MAX_WAIT_SECONDS = float(os.getenv("BACKGROUND_MAX_WAIT_SECONDS", "1800"))  # Give up polling (job is kept)
+
+# Batch mode for translations and translation reviews (see services/batch_jobs.py)
+LLM_BATCH_ENABLED = _env_flag("LLM_BATCH_ENABLED", "false")
+BATCH_BACKEND = os.getenv("BATCH_BACKEND", "azure")  # azure (Batch API) or local (file-based, lines sent to AZURE_OPENAI_ENDPOINT)
+GPT5_BATCH_DEPLOYMENT = os.getenv("GPT5_BATCH_DEPLOYMENT", GPT5_DEPLOYMENT)  # Global Batch deployment
+BATCH_COLLECT_SECONDS = float(os.getenv("BATCH_COLLECT_SECONDS", "10"))  # Wait for more requests before submitting
+BATCH_POLL_INTERVAL = float(os.getenv("BATCH_POLL_INTERVAL", "30"))  # Seconds between status polls
+BATCH_MAX_WAIT_SECONDS = float(os.getenv("BATCH_MAX_WAIT_SECONDS", "86400"))  # Completion window
+BATCH_LOCAL_DIR = os.getenv("BATCH_LOCAL_DIR", os.path.join(OUTPUT_DIR, "cache", "batches"))
+BATCH_PRICE_RATIO = float(os.getenv("BATCH_PRICE_RATIO", "0.5"))  # Batch price relative to interactive
+
+# Hedged translation/SEO calls (see services/hedging.py)
+HEDGING_ENABLED = _env_flag("HEDGING_ENABLED", "false")
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "0.9"))  # Fire a hedge after this latency percentile
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "5"))  # Samples needed before hedging starts
+HEDGE_MAX_RATIO = float(os.getenv("HEDGE_MAX_RATIO", "0.25"))  # Max hedges as a fraction of calls
+HEDGE_MIN_BUDGET = int(os.getenv("HEDGE_MIN_BUDGET", "1"))  # Hedges allowed before the ratio applies
+
+# Adaptive per-call timeouts from persisted latency history (see services/adaptive_timeout.py)
+ADAPTIVE_TIMEOUTS_ENABLED = _env_flag("ADAPTIVE_TIMEOUTS_ENABLED", "true")
+LATENCY_STATS_PATH = os.getenv("LATENCY_STATS_PATH", os.path.join(OUTPUT_DIR, "cache", "latency_stats.json"))
+LATENCY_WINDOW = int(os.getenv("LATENCY_WINDOW", "500"))  # Samples kept per (deployment, call type)
+TIMEOUT_PERCENTILE = float(os.getenv("TIMEOUT_PERCENTILE", "0.99"))  # Latency percentile the timeout is based on
+TIMEOUT_HEADROOM = float(os.getenv("TIMEOUT_HEADROOM", "1.5"))  # Multiplier on that percentile
+TIMEOUT_MIN_SAMPLES = int(os.getenv("TIMEOUT_MIN_SAMPLES", "20"))  # Samples needed before fixed timeouts are replaced
+TIMEOUT_MIN_SECONDS = float(os.getenv("TIMEOUT_MIN_SECONDS", "10"))
+TIMEOUT_MAX_SECONDS = float(os.getenv("TIMEOUT_MAX_SECONDS", "600"))
+
+# Circuit breaker per deployment, with fallback routing while open (empty = fail fast)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))  # Consecutive failures to open
+CIRCUIT_RECOVERY_SECONDS = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "120"))  # Open time before a probe
+CIRCUIT_FALLBACKS = {
+    GPT5_PRO_DEPLOYMENT: os.getenv("GPT5_PRO_FALLBACK_DEPLOYMENT", GPT5_DEPLOYMENT)
+}
+
+# Per-deployment quotas (requests/min, tokens/min) for the shared rate limiter, 0 = unlimited
+AZURE_RATE_LIMITS = {
+    GPT5_DEPLOYMENT: (
+        int(os.getenv("GPT5_RPM", "250")),
+        int(os.getenv("GPT5_TPM", "250000"))
+    ),
+    GPT5_PRO_DEPLOYMENT: (
+        int(os.getenv("GPT5_PRO_RPM", "60")),
+        int(os.getenv("GPT5_PRO_TPM", "100000"))
+    )
+}
+
+# Token prices in USD per 1M tokens (input, output) for the per-run usage report
+LLM_PRICING = {
+    GPT5_DEPLOYMENT: (
+        float(os.getenv("GPT5_INPUT_PRICE", "1.25")),
+        float(os.getenv("GPT5_OUTPUT_PRICE", "10.0"))
+    ),
+    GPT5_PRO_DEPLOYMENT: (
+        float(os.getenv("GPT5_PRO_INPUT_PRICE", "15.0")),
+        float(os.getenv("GPT5_PRO_OUTPUT_PRICE", "120.0"))
+    )
+}
+CACHED_INPUT_PRICE_RATIO = float(os.getenv("CACHED_INPUT_PRICE_RATIO", "0.1"))  # Prompt-cache hits vs input price
+REPORTS_DIR = os.getenv("REPORTS_DIR", os.path.join(OUTPUT_DIR, "reports"))
+
+# Run-wide deadline carried through agents and clients (see services/deadline.py), 0 = unbounded
+RUN_DEADLINE_SECONDS = float(os.getenv("RUN_DEADLINE_SECONDS", "3600"))
+DEADLINE_DELIVERY_RESERVE_SECONDS = float(os.getenv("DEADLINE_DELIVERY_RESERVE_SECONDS", "120"))  # Kept for merge + delivery
+DEADLINE_OPTIONAL_PHASE_SECONDS = float(os.getenv("DEADLINE_OPTIONAL_PHASE_SECONDS", "600"))  # Skip validation/improvement below this
+
+# Run plan: which articles and languages a run produces (see agents/scheduler.py)
+RUN_PLAN_PATH = os.getenv("RUN_PLAN_PATH", os.path.join(PROJECT_ROOT, "data", "run_plan.json"))  # Missing = built from the values below
+RUN_PLAN_CATEGORIES = [c.strip() for c in os.getenv("RUN_PLAN_CATEGORIES", "forex,crypto,commodities").split(",") if c.strip()]
+RUN_PLAN_ARTICLES_PER_CATEGORY = int(os.getenv("RUN_PLAN_ARTICLES_PER_CATEGORY", "1"))  # Top-ranked assets per category
+RUN_PLAN_LANGUAGES = [l.strip() for l in os.getenv("RUN_PLAN_LANGUAGES", "arabic_gcc,spanish,portuguese").split(",") if l.strip()]
+
+# Concurrency caps for a run, 0 = unlimited
+MAX_ARTICLES_IN_FLIGHT = int(os.getenv("MAX_ARTICLES_IN_FLIGHT", "8"))  # Agents running at once
+PROVIDER_CONCURRENCY = {
+    "perplexity": int(os.getenv("PERPLEXITY_MAX_CONCURRENCY", "2")),
+    GPT5_DEPLOYMENT: int(os.getenv("GPT5_MAX_CONCURRENCY", "16")),
+    GPT5_PRO_DEPLOYMENT: int(os.getenv("GPT5_PRO_MAX_CONCURRENCY", "4"))
+}
+
+# Debug mode: report event loop stalls with the blocking stack (see services/loop_monitor.py)
+LOOP_MONITOR_ENABLED = _env_flag("LOOP_MONITOR_ENABLED", "false")
+LOOP_STALL_THRESHOLD_SECONDS = float(os.getenv("LOOP_STALL_THRESHOLD_SECONDS", "0.25"))
+
+# Phase checkpoints for resuming a failed run with --resume (see services/checkpoints.py)
+CHECKPOINT_ENABLED = _env_flag("CHECKPOINT_ENABLED", "true")
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", os.path.join(OUTPUT_DIR, "cache", "checkpoints"))
+CHECKPOINT_RETENTION_DAYS = int(os.getenv("CHECKPOINT_RETENTION_DAYS", "7"))  # Older run folders are deleted
+
+# Span tracing of runs, agents, phases and provider calls, exported as OTLP JSON (see services/tracing.py)
+TRACE_ENABLED = _env_flag("TRACE_ENABLED", "true")
+TRACE_DIR = os.getenv("TRACE_DIR", os.path.join(OUTPUT_DIR, "traces"))
+
 # Perplexity API
 PERPLEXITY_API_KEY = os.getenv("PERPLEXITY_API_KEY")
 PERPLEXITY_ENDPOINT = os.getenv("PERPLEXITY_ENDPOINT", "https://api.perplexity.ai/chat/completions")
+PERPLEXITY_COMBINED_RESEARCH = _env_flag("PERPLEXITY_COMBINED_RESEARCH", "true")  # One schema-constrained call for all categories
+
+# Local OHLC price files (<asset slug>.csv/.parquet) for computed technical indicators (see services/indicators.py)
+PRICE_DATA_DIR = os.getenv("PRICE_DATA_DIR", os.path.join(PROJECT_ROOT, "data", "prices"))
+PRICE_DATA_MAX_AGE_HOURS = float(os.getenv("PRICE_DATA_MAX_AGE_HOURS", "72"))  # Ignore older series (0 = no limit)
+INDICATOR_LOOKBACK_BARS = int(os.getenv("INDICATOR_LOOKBACK_BARS", "500"))  # Most recent bars used per asset
+
+# Asset ranking for article subjects (see services/asset_ranking.py)
+ASSET_UNIVERSE_PATH = os.getenv("ASSET_UNIVERSE_PATH", os.path.join(PROJECT_ROOT, "data", "asset_universe.json"))  # Missing = image assets
+RANKING_TOP_N = int(os.getenv("RANKING_TOP_N", "3"))  # Ranked assets kept per category
+RANK_WEIGHT_VOLATILITY = float(os.getenv("RANK_WEIGHT_VOLATILITY", "1.0"))
+RANK_WEIGHT_VOLUME = float(os.getenv("RANK_WEIGHT_VOLUME", "0.5"))
+RANK_WEIGHT_GAP = float(os.getenv("RANK_WEIGHT_GAP", "0.5"))
+RANK_WEIGHT_MENTIONS = float(os.getenv("RANK_WEIGHT_MENTIONS", "1.0"))
+
+# Intraday research cache per (category, market session) with stale-while-revalidate (see services/research_cache.py)
+RESEARCH_CACHE_ENABLED = _env_flag("RESEARCH_CACHE_ENABLED", "true")
+RESEARCH_CACHE_PATH = os.getenv("RESEARCH_CACHE_PATH", os.path.join(OUTPUT_DIR, "cache", "research_cache.json"))
+RESEARCH_CACHE_TTL_SECONDS = float(os.getenv("RESEARCH_CACHE_TTL_SECONDS", "1800"))  # Fresh for this long
+RESEARCH_CACHE_MAX_STALE_SECONDS = float(os.getenv("RESEARCH_CACHE_MAX_STALE_SECONDS", "14400"))  # Served stale (and refreshed) until this age
 
 # GitHub
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
@@ -26,6 +158,20 @@ GITHUB_IMAGES_REPO = os.getenv("GITHUB_IMAGES_REPO", "n8n-trading-images")
 
 # Zapier Webhook
 ZAPIER_WEBHOOK_URL = os.getenv("ZAPIER_WEBHOOK_URL")
+ZAPIER_DELIVERY_MODE = os.getenv("ZAPIER_DELIVERY_MODE", "batch")  # batch (one payload) or incremental (per article + summary)
+
+# Shared HTTP connection pools (see services/http_transport.py)
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))  # Per-host pools kept (sync)
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))  # Keep-alive connections per host (sync)
+HTTP_ASYNC_LIMIT = int(os.getenv("HTTP_ASYNC_LIMIT", "512"))  # Total async connections (0 = unlimited)
+HTTP_ASYNC_LIMIT_PER_HOST = int(os.getenv("HTTP_ASYNC_LIMIT_PER_HOST", "256"))  # Async connections per host
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", "60"))  # Idle seconds before closing
+
+# LLM response cache (see services/llm_cache.py)
+LLM_CACHE_ENABLED = _env_flag("LLM_CACHE_ENABLED", "true")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(OUTPUT_DIR, "cache", "llm_responses.sqlite3"))
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(24 * 3600)))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_MB", "256")) * 1024 * 1024
 
 # Trading Images Repository
 TRADING_IMAGES_PATH = "/tmp/n8n-trading-images"
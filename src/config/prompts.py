@@ -4,18 +4,18 @@ GPT-5 Prompt Templates for Content Generation
 
 from datetime import date
 
-def get_article_generation_prompt(category: str, asset: str, market_data: dict) -> str:
-    """Generate prompt for article creation"""
+from services.prompt_budget import fit_to_budget, SEO_EXCERPT_BUDGET
 
-    prompts = {
-        "forex": f"""Generate a professional 500-word forex trading article about {asset}.
+# Prompts are laid out as a static prefix followed by the per-call data, so the
+# provider-side prompt cache can reuse the prefix. Each category (and each
+# translation language) has its own prefix: shared instructions, then only that
+# category's guide. Keep the prefixes free of interpolated values.
 
-MARKET DATA:
-- Current Price: {market_data.get('price', 'N/A')}
-- 24h Change: {market_data.get('change', 'N/A')}
-- Key Drivers: {market_data.get('drivers', 'Economic data')}
+ARTICLE_WRITING_INSTRUCTIONS = """You write professional 500-word trading articles for Seekapa.
+Follow the structure, tone and rules of the guide below."""
 
-ARTICLE STRUCTURE:
+ARTICLE_GUIDES = {
+    "forex": """ARTICLE STRUCTURE:
 1. Headline (compelling, SEO-optimized)
 2. Introduction (50-75 words) - Brief overview of current market conditions
 3. Market Highlights (150-200 words):
@@ -38,19 +38,9 @@ ARTICLE STRUCTURE:
 TONE: Professional, informative, trader-focused
 BRAND: Seekapa - professional excellence, trustworthy
 INCLUDE: Real-time data, concrete numbers, actionable insights
-AVOID: Guaranteed profits, gambling language, unrealistic expectations
-
-Write the article now.""",
-
-        "crypto": f"""Generate a professional 500-word cryptocurrency trading article about {asset}.
-
-MARKET DATA:
-- Current Price: {market_data.get('price', 'N/A')}
-- Market Cap: {market_data.get('market_cap', 'N/A')}
-- 24h Change: {market_data.get('change', 'N/A')}
-- Key Catalysts: {market_data.get('catalysts', 'Market sentiment')}
+AVOID: Guaranteed profits, gambling language, unrealistic expectations""",
 
-ARTICLE STRUCTURE:
+    "crypto": """ARTICLE STRUCTURE:
 1. Headline (compelling, crypto-focused)
 2. Introduction (50-75 words) - Current market status
 3. Market Highlights (150-200 words):
@@ -74,18 +64,9 @@ ARTICLE STRUCTURE:
 TONE: Professional, tech-savvy, opportunity-focused
 BRAND: Seekapa - transparent, educational
 INCLUDE: Real prices, market data, factual analysis
-AVOID: FOMO language, pump/dump implications, financial advice
-
-Write the article now.""",
-
-        "commodities": f"""Generate a professional 500-word commodities trading article about {asset}.
+AVOID: FOMO language, pump/dump implications, financial advice""",
 
-MARKET DATA:
-- Current Price: {market_data.get('price', 'N/A')}
-- 24h Change: {market_data.get('change', 'N/A')}
-- Key Drivers: {market_data.get('drivers', 'Supply/demand factors')}
-
-ARTICLE STRUCTURE:
+    "commodities": """ARTICLE STRUCTURE:
 1. Headline (commodity-specific, impactful)
 2. Introduction (50-75 words) - Market overview
 3. Price Movement (150-200 words):
@@ -109,19 +90,75 @@ ARTICLE STRUCTURE:
 TONE: Professional, analytical, balanced
 BRAND: Seekapa - reliable, data-driven
 INCLUDE: Real market data, fundamental analysis, technical levels
-AVOID: Speculative claims, emotional language
+AVOID: Speculative claims, emotional language"""
+}
 
-Write the article now."""
+
+def get_article_generation_prompt(category: str, asset: str, market_data: dict) -> str:
+    """Generate prompt for article creation"""
+
+    market_lines = {
+        "forex": [
+            f"- Current Price: {market_data.get('price', 'N/A')}",
+            f"- 24h Change: {market_data.get('change', 'N/A')}",
+            f"- Key Drivers: {market_data.get('drivers', 'Economic data')}"
+        ],
+        "crypto": [
+            f"- Current Price: {market_data.get('price', 'N/A')}",
+            f"- Market Cap: {market_data.get('market_cap', 'N/A')}",
+            f"- 24h Change: {market_data.get('change', 'N/A')}",
+            f"- Key Catalysts: {market_data.get('catalysts', 'Market sentiment')}"
+        ],
+        "commodities": [
+            f"- Current Price: {market_data.get('price', 'N/A')}",
+            f"- 24h Change: {market_data.get('change', 'N/A')}",
+            f"- Key Drivers: {market_data.get('drivers', 'Supply/demand factors')}"
+        ]
     }
+    if category not in market_lines:
+        category = "forex"
 
-    return prompts.get(category, prompts["forex"])
+    return f"""{ARTICLE_WRITING_INSTRUCTIONS}
 
+=== {category.upper()} ARTICLES ===
+{ARTICLE_GUIDES[category]}
 
-def get_translation_prompt(text: str, target_language: str, category: str) -> str:
-    """Generate prompt for professional translation"""
+=== THIS ARTICLE ===
+ASSET: {asset}
+
+MARKET DATA:
+{chr(10).join(market_lines[category])}
+{_technical_lines(market_data.get("technicals"))}
+Write the article now."""
+
+
+def _technical_lines(technicals: dict) -> str:
+    """Computed indicator block for the article prompt (empty without price data)"""
+    if not technicals:
+        return ""
+
+    def value(key: str) -> str:
+        return "N/A" if technicals.get(key) is None else str(technicals[key])
 
-    language_instructions = {
-        "arabic_gcc": """Translate to GCC/Gulf Arabic dialect (Khaleeji):
+    lines = [
+        f"TECHNICAL INDICATORS (computed from price data as of {technicals['as_of']}; quote these exact figures):",
+        f"- SMA 20 / 50 / 200: {value('sma_20')} / {value('sma_50')} / {value('sma_200')}",
+        f"- EMA 12 / 26: {value('ema_12')} / {value('ema_26')}",
+        f"- RSI (14): {value('rsi_14')}",
+        f"- MACD (12, 26, 9): {value('macd')}, signal {value('macd_signal')}, histogram {value('macd_histogram')}",
+        f"- ATR (14): {value('atr_14')}",
+        f"- Pivot: {value('pivot')}",
+        f"- Support: S1 {value('support_1')}, S2 {value('support_2')}",
+        f"- Resistance: R1 {value('resistance_1')}, R2 {value('resistance_2')}"
+    ]
+    return "\n" + "\n".join(lines) + "\n"
+
+
+TRANSLATION_INSTRUCTIONS = """You translate Seekapa trading articles. Follow the guide for the target language below.
+Return only the translated article."""
+
+TRANSLATION_GUIDES = {
+    "arabic_gcc": """Translate to GCC/Gulf Arabic dialect (Khaleeji):
 
 REQUIREMENTS:
 - Use Gulf Arabic dialect (not Modern Standard Arabic)
@@ -141,11 +178,9 @@ CULTURAL CONSIDERATIONS:
 - Respectful tone for GCC audience
 - Family security and financial stability messaging
 - Islamic finance principles compliance
-- Use local currency examples (AED, SAR) when relevant
+- Use local currency examples (AED, SAR) when relevant""",
 
-Translate now:""",
-
-        "spanish": """Translate to Latin American Spanish:
+    "spanish": """Translate to Latin American Spanish:
 
 REQUIREMENTS:
 - Use neutral Latin American Spanish (not Castilian)
@@ -161,11 +196,9 @@ REQUIREMENTS:
 - Emphasize forex as opportunity and wealth protection
 
 TONE: Dynamic, supportive, professional
-TARGET: Mexican, Colombian, Argentine, Chilean traders
-
-Translate now:""",
+TARGET: Mexican, Colombian, Argentine, Chilean traders""",
 
-        "portuguese": """Translate to Brazilian Portuguese:
+    "portuguese": """Translate to Brazilian Portuguese:
 
 REQUIREMENTS:
 - Use Brazilian Portuguese (not European)
@@ -182,23 +215,31 @@ REQUIREMENTS:
 - Emphasize community and support
 
 TONE: Friendly, motivational, professional
-TARGET: Brazilian traders
+TARGET: Brazilian traders"""
+}
 
-Translate now:"""
-    }
 
-    instruction = language_instructions.get(target_language, "")
-    return f"{instruction}\n\n{text}"
+def get_translation_prompt(text: str, target_language: str, category: str) -> str:
+    """Generate prompt for professional translation"""
 
+    guide = TRANSLATION_GUIDES.get(target_language, f"Translate to {target_language}.")
 
-def get_seo_metadata_prompt(article: str, category: str, asset: str) -> str:
-    """Generate prompt for SEO metadata creation"""
+    return f"""{TRANSLATION_INSTRUCTIONS}
+
+=== {target_language.upper()} ===
+{guide}
+
+=== THIS TRANSLATION ===
+Translate now:
 
-    return f"""Generate SEO metadata for this {category} article about {asset}:
+{text}"""
+
+
+SEO_METADATA_GUIDE = """Generate SEO metadata for the trading article below.
 
 REQUIREMENTS:
 1. SEO Title (50-60 characters):
-   - Include {asset} and category
+   - Include the asset and category
    - Include "Seekapa" brand
    - Compelling and click-worthy
 
@@ -208,22 +249,31 @@ REQUIREMENTS:
    - Call-to-action if space permits
 
 3. Keywords (5-7 keywords):
-   - Primary: {asset} + {category}
+   - Primary: the asset + the category
    - Secondary: "trading", "analysis", "market"
    - Long-tail: specific to article content
 
 4. Image Alt Text (descriptive, SEO-friendly):
    - Describe the trading chart/image
-   - Include {asset} keyword
+   - Include the asset keyword
    - Accessibility-friendly
 
-ARTICLE:
-{article[:500]}...
-
 Generate metadata in JSON format:
-{{
+{
   "title": "...",
   "description": "...",
   "keywords": ["...", "...", ...],
   "image_alt": "..."
-}}"""
+}"""
+
+
+def get_seo_metadata_prompt(article: str, category: str, asset: str) -> str:
+    """Generate prompt for SEO metadata creation"""
+
+    return f"""{SEO_METADATA_GUIDE}
+
+CATEGORY: {category}
+ASSET: {asset}
+
+ARTICLE:
+{fit_to_budget(article, SEO_EXCERPT_BUDGET)}"""
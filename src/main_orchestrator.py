@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """
 Main Orchestrator - Automated Trading Blog System
-Coordinates 3 parallel sub-agents using git worktrees
+Coordinates parallel sub-agents (one per planned article) using git worktrees
 
 Architecture:
 - Main Orchestrator (this file)
-  ├─→ Forex Agent (git worktree: blog-forex/)
-  ├─→ Crypto Agent (git worktree: blog-crypto/)
-  └─→ Commodities Agent (git worktree: blog-commodities/)
+  └─→ Article Scheduler (run plan: N articles x M languages)
+      ├─→ Forex Agents (git worktree: blog-forex/)
+      ├─→ Crypto Agents (git worktree: blog-crypto/)
+      └─→ Commodities Agents (git worktree: blog-commodities/)
 
 Uses:
 - Task tool to launch parallel sub-agents
@@ -17,6 +18,7 @@ Uses:
 - Perplexity API for market research
 """
 
+import argparse
 import asyncio
 import sys
 import os
@@ -31,46 +33,121 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
 from utils.git_worktree_manager import GitWorktreeManager
-from services.zapier_delivery import ZapierDelivery
-from services.html_formatter import HTMLFormatter
-from agents.content_generation_agent import (
-    generate_forex_article,
-    generate_crypto_article,
-    generate_commodities_article
+from services.service_container import ServiceContainer
+from services.rate_limiter import get_rate_limiter_stats
+from services.circuit_breaker import get_circuit_breaker_stats
+from services.deadline import Deadline, deadline_scope
+from services.loop_monitor import LoopStallMonitor
+from services.checkpoints import CheckpointStore, fingerprint
+from services.tracing import current_span, get_tracer, span
+from config.credentials import (
+    REPORTS_DIR,
+    TRACE_DIR,
+    RUN_DEADLINE_SECONDS,
+    DEADLINE_DELIVERY_RESERVE_SECONDS,
+    RUN_PLAN_PATH,
+    LOOP_MONITOR_ENABLED,
+    ZAPIER_DELIVERY_MODE
 )
+from agents.scheduler import ArticleScheduler, load_run_plan
 
 
-# Configure logging
 LOG_DIR = os.path.join(PROJECT_ROOT, "logs")
-os.makedirs(LOG_DIR, exist_ok=True)
 
-logger.add(
-    os.path.join(LOG_DIR, "orchestrator_{time:YYYY-MM-DD}.log"),
-    rotation="1 day",
-    retention="30 days",
-    level="INFO"
-)
+
+def setup_logging(log_dir: str = LOG_DIR) -> None:
+    """
+    Add the daily orchestrator log file sink
+
+    Called by main() rather than at import, so importing the orchestrator
+    (benchmarks, tests) does not write into the repo's logs/.
+
+    Args:
+        log_dir: Directory of the daily log files
+    """
+    os.makedirs(log_dir, exist_ok=True)
+    logger.add(
+        os.path.join(log_dir, "orchestrator_{time:YYYY-MM-DD}.log"),
+        rotation="1 day",
+        retention="30 days",
+        level="INFO"
+    )
 
 
 class BlogOrchestrator:
     """Main orchestrator for automated blog generation"""
 
-    def __init__(self):
+    def __init__(self, resume: bool = False):
+        """
+        Initialize orchestrator
+
+        Args:
+            resume: Reuse today's checkpoints and worktrees from a failed run
+        """
         self.date_str = datetime.now().strftime("%Y-%m-%d")
-        self.categories = ["forex", "crypto", "commodities"]
+        self.resume = resume
 
         self.git_manager = GitWorktreeManager()
-        self.zapier = ZapierDelivery()
-        self.html_formatter = HTMLFormatter()
+
+        # One set of clients and connection pools shared by all agents
+        self.services = ServiceContainer()
+        self.zapier = self.services.zapier
+        self.html_formatter = self.services.html_formatter
+
+        # Which articles and languages this run produces
+        self.plan = load_run_plan(RUN_PLAN_PATH, self.services.universe)
+        self.categories = self.plan.categories
+        # Phase outputs of today's run, read back when resuming
+        self.checkpoints = CheckpointStore(self.date_str, resume=resume)
+
+        # Incremental mode publishes each article as soon as its agent finishes
+        self.incremental_delivery = ZAPIER_DELIVERY_MODE == "incremental"
+        self.deliveries: Dict[str, Dict] = {}
+        self.first_publish_seconds = None
+        self.scheduler = ArticleScheduler(
+            self.services,
+            self.plan,
+            checkpoints=self.checkpoints,
+            on_result=self._deliver_article if self.incremental_delivery else None
+        )
 
         self.articles = []
         self.execution_start = None
+        self.deadline = None
+        self.loop_monitor = LoopStallMonitor() if LOOP_MONITOR_ENABLED else None
 
     async def run(self):
         """Execute complete blog generation workflow"""
         self.execution_start = datetime.now()
+
+        # Every agent and client call below shares this time budget
+        self.deadline = Deadline(RUN_DEADLINE_SECONDS) if RUN_DEADLINE_SECONDS > 0 else None
+
+        if self.loop_monitor:
+            await self.loop_monitor.start()
+        run_span = None
+        try:
+            with span(
+                "run",
+                date=self.date_str,
+                articles=len(self.plan.articles),
+                languages=len(self.plan.languages) + 1,
+                resume=self.resume
+            ) as run_span, deadline_scope(self.deadline):
+                result = await self._run_phases()
+                if not result["success"]:
+                    run_span.fail(result["error"])
+            return result
+        finally:
+            if self.loop_monitor:
+                await self.loop_monitor.stop()
+            if run_span is not None:
+                self._write_trace(run_span.trace_id)
+
+    async def _run_phases(self):
+        """Run the workflow phases under the current deadline"""
         logger.info(f"=" * 80)
-        logger.info(f"Starting Automated Blog Generation - {self.date_str}")
+        logger.info(f"Starting Automated Blog Generation - {self.date_str}{' (resumed)' if self.resume else ''}")
         logger.info(f"=" * 80)
 
         try:
@@ -80,21 +157,27 @@ class BlogOrchestrator:
 
             # Phase 2: Create Git Worktrees
             logger.info("PHASE 2: Creating Git Worktrees")
-            worktrees = self.git_manager.create_worktrees(
-                categories=self.categories,
-                date_str=self.date_str
-            )
+            with span("step", step="worktrees"):
+                worktrees = self.git_manager.create_worktrees(
+                    categories=self.categories,
+                    date_str=self.date_str,
+                    reuse_existing=self.resume
+                )
 
             # Phase 3: Launch Parallel Agents (Real AI Content Generation)
-            logger.info("PHASE 3: Launching 3 Parallel AI Agents")
+            logger.info(f"PHASE 3: Launching {len(self.plan.articles)} Parallel AI Agents")
             logger.info("🤖 Using GPT-5-Pro + Perplexity for real content generation...")
 
-            articles = await self._generate_articles_parallel(worktrees)
+            # Generation stops early enough to leave time for merge and delivery
+            generation_deadline = self.deadline.reserve(DEADLINE_DELIVERY_RESERVE_SECONDS) if self.deadline else None
+            with span("step", step="agents"), deadline_scope(generation_deadline):
+                articles = await self._generate_articles_parallel(worktrees)
 
             # Phase 4: Merge Branches
             logger.info("PHASE 4: Merging Git Branches")
             branches = [f"daily/{cat}-{self.date_str}" for cat in self.categories]
-            merge_success = self.git_manager.merge_branches(branches)
+            with span("step", step="merge", branches=len(branches)):
+                merge_success = self.git_manager.merge_branches(branches)
 
             if not merge_success:
                 raise Exception("Failed to merge branches")
@@ -105,14 +188,15 @@ class BlogOrchestrator:
 
             # Phase 6: Zapier Delivery
             logger.info("PHASE 6: Delivering to Zapier Webhook")
-            delivery_result = self.zapier.send_with_retry(
-                articles=valid_articles,
-                metadata=self._get_execution_metadata()
-            )
-
-            if not delivery_result["success"]:
-                # Save for manual retry
-                self.zapier.save_failed_delivery(valid_articles, self.date_str)
+            metadata = self._get_execution_metadata()
+            with span("step", step="delivery", articles=len(valid_articles)):
+                if self.incremental_delivery:
+                    delivery_result = await self._deliver_summary(valid_articles, metadata)
+                else:
+                    delivery_result = self._deliver_batch(valid_articles, metadata)
+            metadata["delivery"] = self._delivery_stats()
+            self._write_usage_report(metadata)
+            self._write_latency_report()
 
             # Phase 7: Cleanup
             logger.info("PHASE 7: Cleanup")
@@ -124,8 +208,25 @@ class BlogOrchestrator:
             logger.success(f"=" * 80)
             logger.success(f"✅ Blog Generation Completed Successfully!")
             logger.success(f"Articles Generated: {len(valid_articles)}")
+            throughput = metadata["scheduler"]
+            logger.success(
+                f"Throughput: {throughput['articles_per_minute']} articles/min, "
+                f"{throughput['pages_per_minute']} pages/min (peak {throughput['peak_in_flight']} agents in flight)"
+            )
             logger.success(f"Execution Time: {execution_time:.0f} seconds ({execution_time/60:.1f} minutes)")
             logger.success(f"Zapier Delivery: {'✅ Success' if delivery_result['success'] else '❌ Failed (saved locally)'}")
+            cache_stats = self.services.llm_cache.stats()
+            logger.success(
+                f"LLM Cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                f"({cache_stats['tokens_saved']} tokens saved)"
+            )
+            usage_totals = metadata["llm_usage"]["totals"]
+            logger.success(
+                f"LLM Usage: {usage_totals['calls']} calls, "
+                f"{usage_totals['prompt_tokens'] + usage_totals['completion_tokens']} tokens, "
+                f"${usage_totals['cost_usd']:.2f}, "
+                f"prompt cache hit rate {usage_totals['prompt_cache_hit_rate']:.0%}"
+            )
             logger.success(f"=" * 80)
 
             # Return success if articles were generated, even if Zapier delivery failed
@@ -142,9 +243,12 @@ class BlogOrchestrator:
             logger.exception(e)
             return {"success": False, "error": str(e)}
 
+        finally:
+            await self.services.close()
+
     async def _generate_articles_parallel(self, worktrees: Dict[str, str]) -> list:
         """
-        Generate articles in parallel using real AI agents
+        Generate the planned articles in parallel using real AI agents
 
         Args:
             worktrees: Dict mapping category to worktree path
@@ -153,42 +257,15 @@ class BlogOrchestrator:
             List of article packages
         """
         logger.info("Starting parallel AI content generation...")
-
-        # Create tasks for all 3 agents
-        tasks = {
-            "forex": asyncio.create_task(
-                generate_forex_article(worktrees.get("forex", ""))
-            ),
-            "crypto": asyncio.create_task(
-                generate_crypto_article(worktrees.get("crypto", ""))
-            ),
-            "commodities": asyncio.create_task(
-                generate_commodities_article(worktrees.get("commodities", ""))
-            )
-        }
-
-        # Wait for all agents to complete
-        logger.info("⏳ Waiting for all 3 agents to complete...")
-        results = {}
-        for category, task in tasks.items():
-            try:
-                result = await task
-                results[category] = result
-                if result.get("success"):
-                    logger.success(f"✅ {category} agent completed successfully")
-                else:
-                    logger.error(f"❌ {category} agent failed: {result.get('error')}")
-            except Exception as e:
-                logger.error(f"❌ {category} agent exception: {e}")
-                results[category] = {"success": False, "error": str(e)}
+        results = await self.scheduler.run(worktrees)
 
         # Extract article packages from successful results
         articles = []
-        for category, result in results.items():
+        for spec, result in zip(self.plan.articles, results):
             if result.get("success") and "package" in result:
                 articles.append(result["package"])
             else:
-                logger.warning(f"⚠️  {category} article not included (failed or incomplete)")
+                logger.warning(f"⚠️  {spec['category']} article not included (failed or incomplete)")
 
         logger.info(f"Collected {len(articles)} articles from parallel generation")
         return articles
@@ -197,7 +274,7 @@ class BlogOrchestrator:
         """Validate article quality"""
         valid = []
         for article in articles:
-            if len(article["languages"]) >= 4:  # Must have all 4 languages
+            if self._is_complete(article):
                 valid.append(article)
                 logger.info(f"✅ {article['category']} article validated")
             else:
@@ -205,6 +282,96 @@ class BlogOrchestrator:
 
         return valid
 
+    def _is_complete(self, article: Dict) -> bool:
+        """Article has English plus every planned language"""
+        return len(article["languages"]) >= len(self.plan.languages) + 1
+
+    def _deliver_batch(self, valid_articles: list, metadata: Dict) -> Dict:
+        """Send all articles as one payload (batch mode)"""
+        # A resumed run does not deliver the same articles twice
+        run_checkpoints = self.checkpoints.scope("_run")
+        delivery_key = fingerprint({
+            "articles": [[a["category"], a["asset"], a["generated_at"]] for a in valid_articles]
+        })
+        delivered = run_checkpoints.load("delivery", delivery_key)
+        if delivered is not None:
+            logger.info("Articles already delivered by the failed run, skipping delivery")
+            return delivered["value"]
+
+        delivery_result = self.zapier.send_with_retry(
+            articles=valid_articles,
+            metadata=metadata
+        )
+        if delivery_result["success"]:
+            run_checkpoints.save("delivery", delivery_key, delivery_result)
+            self._note_published()
+        else:
+            # Save for manual retry
+            self.zapier.save_failed_delivery(valid_articles, self.date_str)
+        return delivery_result
+
+    async def _deliver_article(self, spec: Dict, result: Dict) -> None:
+        """Validate and deliver one article as soon as its agent finishes (incremental mode)"""
+        if not (result.get("success") and "package" in result):
+            return
+
+        article = result["package"]
+        if not self._is_complete(article):
+            logger.warning(f"⚠️  {article['category']} article incomplete, not delivered")
+            return
+
+        key = self.zapier.idempotency_key(article, self.date_str)
+        run_checkpoints = self.checkpoints.scope("_run")
+        delivered = run_checkpoints.load(f"delivery-{key}", key)
+        if delivered is not None:
+            logger.info(f"{article['category']} article ({article['asset']}) already delivered, skipping")
+            self.deliveries[key] = delivered["value"]
+            return
+
+        delivery = await self.zapier.send_article_async(article, key)
+        self.deliveries[key] = delivery
+        if delivery["success"]:
+            run_checkpoints.save(f"delivery-{key}", key, delivery)
+            self._note_published()
+
+    async def _deliver_summary(self, valid_articles: list, metadata: Dict) -> Dict:
+        """Close an incremental delivery with the summary event (failed articles are saved for retry)"""
+        keys = {self.zapier.idempotency_key(article, self.date_str): article for article in valid_articles}
+        delivered = [key for key in keys if self.deliveries.get(key, {}).get("success")]
+        failed = [key for key in keys if key not in delivered]
+
+        summary = {
+            "generated_at": datetime.now().isoformat(),
+            "delivered": delivered,
+            "failed": failed,
+            "metadata": metadata
+        }
+        summary_result = await self.zapier.send_summary_async(summary, fingerprint({"summary": self.date_str})[:32])
+
+        if failed:
+            self.zapier.save_failed_delivery([keys[key] for key in failed], self.date_str)
+        return {
+            **summary_result,
+            "success": summary_result["success"] and not failed,
+            "articles_delivered": len(delivered),
+            "articles_failed": len(failed)
+        }
+
+    def _note_published(self) -> None:
+        """Remember when the first article went out"""
+        if self.first_publish_seconds is None:
+            self.first_publish_seconds = round((datetime.now() - self.execution_start).total_seconds(), 1)
+            logger.success(f"📤 First article published after {self.first_publish_seconds:.0f}s")
+
+    def _delivery_stats(self) -> Dict:
+        """Delivery mode and time to first publish"""
+        return {
+            "mode": "incremental" if self.incremental_delivery else "batch",
+            "time_to_first_publish_seconds": self.first_publish_seconds,
+            "articles_delivered": sum(1 for d in self.deliveries.values() if d.get("success"))
+            if self.incremental_delivery else None
+        }
+
     def _get_execution_metadata(self):
         """Get execution metadata"""
         execution_time = (datetime.now() - self.execution_start).total_seconds()
@@ -212,23 +379,74 @@ class BlogOrchestrator:
             "execution_time_seconds": int(execution_time),
             "date": self.date_str,
             "categories": self.categories,
+            "run_plan": self.plan.describe(),
+            "scheduler": self.scheduler.stats(),
+            "llm_cache": self.services.llm_cache.stats(),
+            "research_cache": self.services.research_cache.stats(),
+            "rate_limits": get_rate_limiter_stats(),
+            "circuit_breakers": get_circuit_breaker_stats(),
+            "hedging": self.services.hedging.stats() if self.services.hedging else None,
+            "batch": self.services.batch.stats() if self.services.batch else None,
+            "llm_usage": self.services.usage.summary(),
+            "deadline": {
+                "budget_seconds": self.deadline.budget,
+                "remaining_seconds": round(self.deadline.remaining(), 1)
+            } if self.deadline else None,
+            "loop_stalls": self.loop_monitor.stats() if self.loop_monitor else None,
+            "checkpoints": self.checkpoints.stats(),
+            "trace_id": current_span().trace_id if current_span() else None,
             "system": "automated_blog_multi_agent_v1.0"
         }
 
+    def _write_usage_report(self, metadata: Dict) -> None:
+        """Write per-call LLM usage for this run to output/reports"""
+        timestamp = self.execution_start.strftime("%Y%m%d_%H%M%S")
+        try:
+            self.services.usage.write_report(
+                os.path.join(REPORTS_DIR, f"run_{timestamp}.json"),
+                metadata={k: v for k, v in metadata.items() if k != "llm_usage"}
+            )
+        except OSError as e:
+            logger.warning(f"Could not write usage report: {e}")
+
+    def _write_latency_report(self) -> None:
+        """Export latency histograms per (deployment, call type) for capacity planning"""
+        timestamp = self.execution_start.strftime("%Y%m%d_%H%M%S")
+        try:
+            self.services.latency.write_export(os.path.join(REPORTS_DIR, f"latency_{timestamp}.json"))
+        except OSError as e:
+            logger.warning(f"Could not write latency report: {e}")
+
+    def _write_trace(self, trace_id: str) -> None:
+        """Export this run's spans (render with: python src/utils/trace_waterfall.py)"""
+        timestamp = self.execution_start.strftime("%Y%m%d_%H%M%S")
+        try:
+            get_tracer().export(os.path.join(TRACE_DIR, f"trace_{timestamp}.json"), trace_id=trace_id)
+        except OSError as e:
+            logger.warning(f"Could not write trace: {e}")
+
     def _create_output_directories(self):
         """Create necessary output directories"""
         os.makedirs(os.path.join(PROJECT_ROOT, "output"), exist_ok=True)
-        os.makedirs(os.path.join(PROJECT_ROOT, "logs"), exist_ok=True)
 
 
-async def main():
+async def main(resume: bool = False):
     """Main entry point"""
-    orchestrator = BlogOrchestrator()
+    setup_logging()
+    orchestrator = BlogOrchestrator(resume=resume)
     result = await orchestrator.run()
     return result
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Automated trading blog generation")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume today's failed run from its checkpoints instead of regenerating"
+    )
+    args = parser.parse_args()
+
     # Run orchestrator
-    result = asyncio.run(main())
+    result = asyncio.run(main(resume=args.resume))
     sys.exit(0 if result.get("success") else 1)
@@ -0,0 +1,77 @@
+"""
+Adaptive Timeouts
+Per-call timeouts derived from observed latency instead of fixed values
+"""
+
+from typing import Optional
+from config.credentials import (
+    ADAPTIVE_TIMEOUTS_ENABLED,
+    TIMEOUT_PERCENTILE,
+    TIMEOUT_HEADROOM,
+    TIMEOUT_MIN_SAMPLES,
+    TIMEOUT_MIN_SECONDS,
+    TIMEOUT_MAX_SECONDS
+)
+from services.latency_stats import RollingLatencyWindow
+
+
+class AdaptiveTimeoutPolicy:
+    """
+    Timeout = high latency percentile x headroom for the (deployment, call type) key
+
+    Keys without enough history keep the caller's fixed timeout. Each retry
+    doubles the timeout (up to max_seconds) so a slow day cannot fail every
+    attempt at the same tight limit.
+    """
+
+    def __init__(
+        self,
+        latencies: Optional[RollingLatencyWindow] = None,
+        enabled: bool = ADAPTIVE_TIMEOUTS_ENABLED,
+        percentile: float = TIMEOUT_PERCENTILE,
+        headroom: float = TIMEOUT_HEADROOM,
+        min_samples: int = TIMEOUT_MIN_SAMPLES,
+        min_seconds: float = TIMEOUT_MIN_SECONDS,
+        max_seconds: float = TIMEOUT_MAX_SECONDS
+    ):
+        """
+        Initialize policy
+
+        Args:
+            latencies: Latency samples (recorded even while adaptive timeouts are disabled)
+            enabled: Derive timeouts from latencies (False = always use the fixed timeout)
+            percentile: Latency percentile (0-1) the timeout is based on
+            headroom: Multiplier applied to the percentile
+            min_samples: Samples needed per key before the fixed timeout is replaced
+            min_seconds: Lower bound for derived timeouts
+            max_seconds: Upper bound for derived and escalated timeouts
+        """
+        self.latencies = latencies or RollingLatencyWindow()
+        self.enabled = enabled
+        self.percentile = percentile
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+
+    def timeout(self, key: str, default: float, attempt: int = 0) -> float:
+        """
+        Get the timeout for one attempt
+
+        Args:
+            key: "<deployment>:<call type>"
+            default: Fixed timeout used without enough history
+            attempt: 0-based attempt number
+
+        Returns:
+            Timeout in seconds
+        """
+        if not self.enabled or self.latencies.count(key) < self.min_samples:
+            return default
+
+        base = max(self.min_seconds, self.latencies.percentile(key, self.percentile) * self.headroom)
+        return min(self.max_seconds, base * 2 ** attempt)
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add the latency of a successful attempt"""
+        self.latencies.record(key, seconds)
@@ -0,0 +1,253 @@
+"""
+Asset Ranking
+Scores an instrument universe per category to pick article subjects without LLM calls
+"""
+
+import json
+import re
+import warnings
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+from config.credentials import (
+    RANKING_TOP_N,
+    RANK_WEIGHT_VOLATILITY,
+    RANK_WEIGHT_VOLUME,
+    RANK_WEIGHT_GAP,
+    RANK_WEIGHT_MENTIONS
+)
+from services.indicators import IndicatorEngine, atr, stack_series
+
+# Default universe: the assets with images (slugs from ImageManager.asset_folders)
+DEFAULT_CATEGORIES = {
+    "forex": ["EUR/USD", "USD/JPY", "GBP/USD", "USD/CAD", "AUD/USD"],
+    "crypto": ["Bitcoin", "Ethereum", "XRP"],
+    "commodities": ["Gold", "Silver", "Oil", "Copper"]
+}
+
+DEFAULT_ALIASES = {
+    "Bitcoin": ["BTC"],
+    "Ethereum": ["ETH", "Ether"],
+    "Gold": ["XAU"],
+    "Silver": ["XAG"],
+    "Oil": ["Crude", "WTI", "Brent"]
+}
+
+COMPONENTS = ("volatility", "volume", "gap", "mentions")
+
+
+def load_universe(path: Optional[str], asset_folders: Dict[str, str]) -> Dict[str, Dict[str, Dict]]:
+    """
+    Load the instrument universe
+
+    Args:
+        path: JSON file {category: {asset: slug | {"slug": ..., "aliases": [...]}}} (None/missing = default)
+        asset_folders: Asset name -> slug for the default universe
+
+    Returns:
+        Dict category -> asset -> {"slug", "aliases"}
+    """
+    if path:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            return {
+                category: {
+                    asset: spec if isinstance(spec, dict) else {"slug": spec, "aliases": []}
+                    for asset, spec in assets.items()
+                }
+                for category, assets in raw.items()
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable asset universe {path}: {e}")
+
+    return {
+        category: {
+            asset: {"slug": asset_folders.get(asset, asset.lower()), "aliases": DEFAULT_ALIASES.get(asset, [])}
+            for asset in assets
+        }
+        for category, assets in DEFAULT_CATEGORIES.items()
+    }
+
+
+def rank_scores(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    has_prices: np.ndarray,
+    mentions: np.ndarray,
+    groups: np.ndarray,
+    weights: Dict[str, float]
+) -> Dict[str, np.ndarray]:
+    """
+    Score every asset in one vectorized pass
+
+    Raw components are z-scored within their category, missing values count
+    as average (0), and the score is the weighted sum.
+
+    Args:
+        open_, high, low, close, volume: (assets x bars) arrays (rows without prices may hold anything)
+        has_prices: Bool per asset, False where no price data was loaded
+        mentions: Research mentions per asset
+        groups: Category index per asset
+        weights: Weight per component name
+
+    Returns:
+        Dict with the raw components, their z-scores ("z_<name>") and "score"
+    """
+    last_close, previous_close = close[:, -1], close[:, -2]
+    recent_atr = atr(high, low, close)[:, -1]
+
+    with np.errstate(divide="ignore", invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # nanmean of series without volume
+        raw = {
+            # ATR as % of price
+            "volatility": recent_atr / last_close * 100,
+            # Last bar's volume vs. the series average
+            "volume": volume[:, -1] / np.nanmean(volume[:, :-1], axis=1),
+            # Opening gap in ATRs
+            "gap": np.abs(open_[:, -1] - previous_close) / recent_atr,
+            "mentions": mentions.astype(float)
+        }
+    for name in ("volatility", "volume", "gap"):
+        raw[name] = np.where(has_prices & np.isfinite(raw[name]), raw[name], np.nan)
+
+    result = dict(raw)
+    score = np.zeros(len(groups))
+    for name in COMPONENTS:
+        z = _group_zscore(raw[name], groups)
+        result[f"z_{name}"] = z
+        score += weights.get(name, 0.0) * z
+    result["score"] = score
+    return result
+
+
+def _group_zscore(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Z-score within each group, ignoring NaNs (NaN and constant groups -> 0)"""
+    valid = np.isfinite(values)
+    filled = np.where(valid, values, 0.0)
+    count = np.bincount(groups, weights=valid.astype(float))
+    total = np.bincount(groups, weights=filled)
+    squares = np.bincount(groups, weights=filled ** 2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = total / count
+        std = np.sqrt(np.maximum(squares / count - mean ** 2, 0.0))
+        z = (filled - mean[groups]) / std[groups]
+    return np.where(valid & np.isfinite(z), z, 0.0)
+
+
+class AssetRanker:
+    """
+    Ranks the universe per category from price arrays and research mentions
+
+    Price components are computed once per run from the indicator engine's
+    series; mentions are counted per call from the research text.
+    """
+
+    def __init__(
+        self,
+        universe: Dict[str, Dict[str, Dict]],
+        indicators: IndicatorEngine,
+        weights: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize ranker
+
+        Args:
+            universe: Category -> asset -> {"slug", "aliases"} (see load_universe)
+            indicators: Engine whose price series are ranked (its assets should cover the universe)
+            weights: Component weights (defaults from config)
+        """
+        self.universe = universe
+        self.indicators = indicators
+        self.weights = weights or {
+            "volatility": RANK_WEIGHT_VOLATILITY,
+            "volume": RANK_WEIGHT_VOLUME,
+            "gap": RANK_WEIGHT_GAP,
+            "mentions": RANK_WEIGHT_MENTIONS
+        }
+
+        self.names: List[str] = [asset for assets in universe.values() for asset in assets]
+        self.categories: List[str] = list(universe)
+        self.groups = np.array([
+            self.categories.index(category) for category, assets in universe.items() for _ in assets
+        ])
+        self._patterns = [
+            _mention_pattern([asset] + spec.get("aliases", []))
+            for assets in universe.values() for asset, spec in assets.items()
+        ]
+
+    def rank(self, research_text: str = "", top_n: int = RANKING_TOP_N) -> Dict[str, List[Dict]]:
+        """
+        Rank every category
+
+        Args:
+            research_text: Research content whose asset mentions count towards the score
+            top_n: Assets returned per category
+
+        Returns:
+            Dict category -> best assets first, each with score and raw components
+        """
+        series = self.indicators.series()
+        has_prices = np.array([name in series for name in self.names])
+        columns = self._price_matrix(series, has_prices)
+        mentions = np.array([len(pattern.findall(research_text or "")) for pattern in self._patterns])
+
+        scores = rank_scores(
+            *columns, has_prices=has_prices, mentions=mentions, groups=self.groups, weights=self.weights
+        )
+
+        ranking = {}
+        for index, category in enumerate(self.categories):
+            rows = np.flatnonzero(self.groups == index)
+            # Stable sort keeps universe order between equal scores
+            best = rows[np.argsort(-scores["score"][rows], kind="stable")][:top_n]
+            ranking[category] = [self._entry(row, scores) for row in best]
+        return ranking
+
+    def top(self, category: str, research_text: str = "", top_n: int = RANKING_TOP_N) -> List[Dict]:
+        """Best assets of one category (see rank)"""
+        return self.rank(research_text, top_n).get(category, [])
+
+    def _price_matrix(self, series: Dict[str, Dict[str, np.ndarray]], has_prices: np.ndarray) -> tuple:
+        """Open, high, low, close and volume as (universe x bars) arrays (NaN rows without data)"""
+        loaded = [name for name in self.names if name in series]
+        width = max((len(series[name]["close"]) for name in loaded), default=2)
+        columns = []
+        for column in ("open", "high", "low", "close", "volume"):
+            matrix = np.full((len(self.names), max(width, 2)), np.nan)
+            if loaded:
+                matrix[has_prices, -width:] = stack_series(series, loaded, column)
+            columns.append(matrix)
+        return tuple(columns)
+
+    def _entry(self, row: int, scores: Dict[str, np.ndarray]) -> Dict:
+        """Ranking entry for one asset"""
+        def value(name: str) -> Optional[float]:
+            number = scores[name][row]
+            return round(float(number), 3) if np.isfinite(number) else None
+
+        return {
+            "asset": self.names[row],
+            "score": value("score"),
+            "volatility_pct": value("volatility"),
+            "volume_ratio": value("volume"),
+            "gap_atr": value("gap"),
+            "mentions": int(scores["mentions"][row])
+        }
+
+
+def _mention_pattern(names: List[str]) -> "re.Pattern":
+    """Case-insensitive whole-word pattern for an asset and its aliases (EUR/USD also matches EURUSD)"""
+    variants = set()
+    for name in names:
+        variants.add(re.escape(name))
+        if "/" in name:
+            variants.add(re.escape(name.replace("/", "")))
+    return re.compile(r"(?<![\w/])(?:" + "|".join(sorted(variants, key=len, reverse=True)) + r")(?![\w/])", re.IGNORECASE)
@@ -3,74 +3,130 @@ Azure OpenAI Client
 Wrapper for Azure OpenAI MCP tools: consult_gpt5, consult_gpt5_pro, consult_gpt5_codex
 """
 
+import asyncio
+import json
+import aiohttp
 import requests
 import time
-from typing import Dict, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
 from loguru import logger
 from config.credentials import (
     AZURE_OPENAI_KEY,
     AZURE_OPENAI_ENDPOINT,
     GPT5_DEPLOYMENT,
     GPT5_PRO_DEPLOYMENT,
+    BACKGROUND_POLL_INTERVAL,
+    BACKGROUND_HEARTBEAT_INTERVAL,
+    BACKGROUND_MAX_WAIT_SECONDS,
+    CIRCUIT_FALLBACKS,
     get_api_headers
 )
+from services.http_transport import HTTPTransport, clean_headers, get_shared_transport
+from services.llm_cache import LLMResponseCache, get_shared_cache
+from services.rate_limiter import get_rate_limiter
+from services.background_jobs import BackgroundJobStore
+from services.hedging import HedgingPolicy
+from services.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from services.usage_tracker import UsageCollector, current_call_context, note_attempt
+from services.tracing import Span, get_tracer, span
+from services.adaptive_timeout import AdaptiveTimeoutPolicy
+from services.concurrency import ProviderLimits
+from services.deadline import deadline_exceeded, deadline_result, remaining_timeout
+from services.prompt_budget import count_tokens, fit_to_budget, output_budget, QUALITY_REVIEW_BUDGET
+
+RESPONSES_API_VERSION = "2025-04-01-preview"
+CHAT_COMPLETIONS_API_VERSION = "2024-12-01-preview"
+
+# Higher for reasoning + translation
+TRANSLATION_MAX_TOKENS = 6000
+
+# Raised by a 200 response whose body is not JSON or lacks the expected fields (retried like a network error)
+MALFORMED_RESPONSE_ERRORS = (ValueError, KeyError, IndexError, TypeError, AttributeError)
+
+SYSTEM_PROMPT = "You are a professional forex/crypto/commodities trading content writer for Seekapa, a regulated forex broker."
 
 
 class AzureOpenAIClient:
     """Client for Azure OpenAI GPT-5 models"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        transport: Optional[HTTPTransport] = None,
+        cache: Optional[LLMResponseCache] = None,
+        job_store: Optional[BackgroundJobStore] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        usage: Optional[UsageCollector] = None,
+        timeouts: Optional[AdaptiveTimeoutPolicy] = None,
+        limits: Optional[ProviderLimits] = None
+    ):
         self.api_key = AZURE_OPENAI_KEY
         self.endpoint = AZURE_OPENAI_ENDPOINT
         self.headers = get_api_headers("azure_openai")
 
-    def generate_article(
+        # Shared keep-alive connection pools
+        self.transport = transport or get_shared_transport()
+
+        # Shared on-disk response cache
+        self.cache = cache or get_shared_cache()
+
+        # Pending Responses API background jobs (survives restarts)
+        self.job_store = job_store or BackgroundJobStore()
+
+        # Optional hedging for translation and SEO calls (None = disabled)
+        self.hedging = hedging
+
+        # Per-call token/latency/cost records for the run report
+        self.usage = usage or UsageCollector()
+
+        # Latency history per (deployment, call type) and the timeouts derived from it
+        self.timeouts = timeouts or AdaptiveTimeoutPolicy()
+
+        # Requests in flight per deployment (async calls only; uncapped if omitted)
+        self.limits = limits or ProviderLimits({})
+
+    def _build_request(
         self,
         prompt: str,
-        deployment: str = GPT5_DEPLOYMENT,
-        max_tokens: int = 16384,
-        temperature: float = None
-    ) -> Dict:
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float]
+    ) -> Tuple[str, Dict, int]:
         """
-        Generate article content using GPT-5 or GPT-5-Pro
+        Build URL, payload and timeout for a generation request
 
         Args:
-            prompt: Article generation prompt
+            prompt: User prompt
             deployment: GPT-5 model deployment name (gpt-5 or gpt-5-pro)
-            max_tokens: Maximum tokens in response (16384 for GPT-5-Pro)
-            temperature: Creativity level (0-1), None for default. Note: GPT-5 only supports default temperature.
+            max_tokens: Maximum tokens in response (capped to the context left after the prompt)
+            temperature: Creativity level, None for default
 
         Returns:
-            Dict with generated content
+            Tuple of (url, payload, fixed timeout in seconds)
         """
         # GPT-5-Pro uses Responses API, GPT-5 uses Chat Completions API
         is_responses_api = deployment == "gpt-5-pro"
+        max_tokens = self._output_budget(prompt, deployment, max_tokens)
 
         if is_responses_api:
             # Responses API (GPT-5-Pro)
-            url = f"{self.endpoint}openai/responses?api-version=2025-04-01-preview"
-
-            # Combine system message and prompt into single input
-            full_input = "You are a professional forex/crypto/commodities trading content writer for Seekapa, a regulated forex broker.\n\n" + prompt
+            url = f"{self.endpoint}openai/responses?api-version={RESPONSES_API_VERSION}"
 
+            # System persona as instructions, so input starts with the prompt's static prefix
             payload = {
                 "model": deployment,
-                "input": full_input,
+                "instructions": SYSTEM_PROMPT,
+                "input": prompt,
                 "max_output_tokens": max_tokens
             }
-
-            # Only add temperature if specified
-            if temperature is not None:
-                payload["temperature"] = temperature
         else:
             # Chat Completions API (GPT-5 standard)
-            url = f"{self.endpoint}openai/deployments/{deployment}/chat/completions?api-version=2024-12-01-preview"
+            url = f"{self.endpoint}openai/deployments/{deployment}/chat/completions?api-version={CHAT_COMPLETIONS_API_VERSION}"
 
             payload = {
                 "messages": [
                     {
                         "role": "system",
-                        "content": "You are a professional forex/crypto/commodities trading content writer for Seekapa, a regulated forex broker."
+                        "content": SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -80,57 +136,274 @@ class AzureOpenAIClient:
                 "max_completion_tokens": max_tokens
             }
 
-            # Only add temperature if specified
-            if temperature is not None:
-                payload["temperature"] = temperature
+        # Only add temperature if specified
+        if temperature is not None:
+            payload["temperature"] = temperature
+
+        # GPT-5-Pro needs much longer timeout for complex reasoning (3-4 minutes typical)
+        # Used until there is latency history for the call type (see _attempt_timeout)
+        timeout = 300 if is_responses_api else 90  # 5 minutes for Responses API, 90s for standard
+
+        return url, payload, timeout
+
+    def _parse_response(self, data: Dict, is_responses_api: bool) -> Tuple[str, Dict]:
+        """
+        Extract content and usage from an API response body
+
+        Args:
+            data: Decoded JSON response
+            is_responses_api: True for Responses API (GPT-5-Pro) payloads
+
+        Returns:
+            Tuple of (content, usage)
+        """
+        if is_responses_api:
+            # Responses API returns output array
+            if data.get("output") and isinstance(data["output"], list):
+                # Find message object
+                message_obj = next((item for item in data["output"] if item.get("type") == "message"), None)
+
+                if message_obj and message_obj.get("content") and isinstance(message_obj["content"], list):
+                    # Extract text from content items
+                    content = "\n\n".join(
+                        item.get("text", "")
+                        for item in message_obj["content"]
+                        if item.get("text")
+                    )
+                else:
+                    content = str(data["output"])
+            else:
+                content = data.get("output", "")
+
+            usage = self._map_usage(data.get("usage") or {}, is_responses_api)
+        else:
+            # Standard Chat Completions format
+            content = data["choices"][0]["message"]["content"]
+            usage = self._map_usage(data.get("usage") or {}, is_responses_api)
+
+        return content, usage
+
+    def _map_usage(self, usage: Dict, is_responses_api: bool) -> Dict:
+        """Map usage onto the Chat Completions field names, plus reasoning_tokens and cached_tokens"""
+        if not is_responses_api:
+            details = usage.get("completion_tokens_details") or {}
+            prompt_details = usage.get("prompt_tokens_details") or {}
+            return {
+                **usage,
+                "reasoning_tokens": details.get("reasoning_tokens", 0),
+                "cached_tokens": prompt_details.get("cached_tokens", 0)
+            }
+
+        details = usage.get("output_tokens_details") or {}
+        input_details = usage.get("input_tokens_details") or {}
+        return {
+            "prompt_tokens": usage.get("input_tokens", 0),
+            "completion_tokens": usage.get("output_tokens", 0),
+            "total_tokens": usage.get("total_tokens", 0),
+            "reasoning_tokens": details.get("reasoning_tokens", 0),
+            "cached_tokens": input_details.get("cached_tokens", 0)
+        }
+
+    def _parse_stream_event(
+        self,
+        event: Dict,
+        is_responses_api: bool
+    ) -> Tuple[str, Optional[Dict], Optional[str]]:
+        """
+        Extract text delta, usage and error from one SSE event
+
+        Args:
+            event: Decoded JSON from a data: line
+            is_responses_api: True for Responses API (GPT-5-Pro) events
+
+        Returns:
+            Tuple of (delta text, usage or None, error or None)
+        """
+        if is_responses_api:
+            event_type = event.get("type", "")
+
+            if event_type == "response.output_text.delta":
+                return event.get("delta", ""), None, None
+            if event_type in ("response.completed", "response.incomplete"):
+                usage = (event.get("response") or {}).get("usage") or {}
+                return "", self._map_usage(usage, True), None
+            if event_type in ("response.failed", "error"):
+                error = (event.get("response") or {}).get("error") or event.get("error") or event
+                return "", None, str(error)
+            return "", None, None
+
+        choices = event.get("choices") or []
+        delta = ""
+        if choices:
+            delta = (choices[0].get("delta") or {}).get("content") or ""
+        usage = event.get("usage")
+        return delta, self._map_usage(usage, False) if usage else None, None
+
+    @staticmethod
+    async def _iter_sse(response: aiohttp.ClientResponse) -> AsyncIterator[Dict]:
+        """
+        Yield decoded JSON payloads from a server-sent events stream
+
+        Args:
+            response: Streaming aiohttp response
+
+        Yields:
+            Dict for each data: line (stops at [DONE])
+        """
+        buffer = b""
+        async for chunk in response.content.iter_any():
+            buffer += chunk
+            while b"\n" in buffer:
+                raw_line, buffer = buffer.split(b"\n", 1)
+                line = raw_line.decode("utf-8").strip()
+                if not line.startswith("data:"):
+                    continue
+
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    return
+                try:
+                    yield json.loads(data)
+                except json.JSONDecodeError:
+                    logger.debug(f"Skipping malformed SSE payload: {data[:80]}")
+
+    def _output_budget(self, prompt: str, deployment: str, max_tokens: int) -> int:
+        """Cap max_tokens to the deployment's context left after system prompt + prompt"""
+        return output_budget(SYSTEM_PROMPT + "\n\n" + prompt, deployment, max_tokens)
+
+    def _estimate_request_tokens(self, prompt: str, max_tokens: int, deployment: str) -> int:
+        """Estimate the TPM cost of a request (prompt tokens + max output tokens)"""
+        return count_tokens(SYSTEM_PROMPT) + count_tokens(prompt) + self._output_budget(prompt, deployment, max_tokens)
+
+    def _call_span(self, deployment: str, **attributes):
+        """Span of one logical call (retries and reroutes included), labelled like its usage record"""
+        return span("llm.call", **{**current_call_context(), "deployment": deployment, **attributes})
+
+    def _latency_key(self, deployment: str) -> str:
+        """Latency history key: deployment plus the phase label of the current call"""
+        return f"{deployment}:{current_call_context().get('phase', 'other')}"
+
+    def _attempt_timeout(self, latency_key: str, default: float, attempt: int) -> float:
+        """Adaptive timeout for one attempt, capped by the run deadline"""
+        return remaining_timeout(self.timeouts.timeout(latency_key, default, attempt))
+
+    def _cache_key(
+        self,
+        deployment: str,
+        payload: Dict,
+        max_tokens: int,
+        temperature: Optional[float]
+    ) -> str:
+        """Build the response-cache key for a request payload"""
+        if "input" in payload:
+            api_flavour, full_prompt = "responses", payload["instructions"] + "\n\n" + payload["input"]
+        else:
+            api_flavour, full_prompt = "chat", json.dumps(payload["messages"], ensure_ascii=False)
+
+        return self.cache.make_key(deployment, api_flavour, full_prompt, max_tokens, temperature)
+
+    def _get_cached(self, cache_key: Optional[str], deployment: str) -> Optional[Dict]:
+        """Return a cached generation result, if any"""
+        if cache_key is None:
+            return None
+
+        cached = self.cache.get(cache_key)
+        if cached is None:
+            return None
+
+        logger.info(f"LLM cache hit for {deployment} ({len(cached['content'])} chars)")
+        return {"success": True, "content": cached["content"], "usage": cached["usage"], "cached": True}
+
+    def generate_article(
+        self,
+        prompt: str,
+        deployment: str = GPT5_DEPLOYMENT,
+        max_tokens: int = 16384,
+        temperature: float = None,
+        use_cache: bool = True
+    ) -> Dict:
+        """
+        Generate article content using GPT-5 or GPT-5-Pro
+
+        Args:
+            prompt: Article generation prompt
+            deployment: GPT-5 model deployment name (gpt-5 or gpt-5-pro)
+            max_tokens: Maximum tokens in response (16384 for GPT-5-Pro)
+            temperature: Creativity level (0-1), None for default. Note: GPT-5 only supports default temperature.
+            use_cache: Read from the response cache (fresh results are always stored)
+
+        Returns:
+            Dict with generated content
+        """
+        with self.usage.track(deployment) as call, self._call_span(deployment) as call_span:
+            result = self._generate_article(prompt, deployment, max_tokens, temperature, use_cache)
+            return call.finish(_trace_result(call_span, result))
+
+    def _generate_article(
+        self,
+        prompt: str,
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        use_cache: bool
+    ) -> Dict:
+        """Uncounted body of generate_article"""
+        is_responses_api = deployment == "gpt-5-pro"
+        url, payload, timeout = self._build_request(prompt, deployment, max_tokens, temperature)
+
+        cache_key = self._cache_key(deployment, payload, max_tokens, temperature)
+        cached = self._get_cached(cache_key if use_cache else None, deployment)
+        if cached:
+            return cached
+
+        # Shared per-deployment quota; Azure counts prompt + max_tokens against TPM
+        rate_limiter = get_rate_limiter(deployment)
+        estimated_tokens = self._estimate_request_tokens(prompt, max_tokens, deployment)
+        latency_key = self._latency_key(deployment)
+
+        # Shared per-deployment health; an open circuit reroutes or fails fast
+        breaker = get_circuit_breaker(deployment)
 
         # Retry logic for transient errors
         max_retries = 3
         retry_delay = 2  # seconds
+        rate_limited = False
 
         for attempt in range(max_retries):
+            if deadline_exceeded():
+                return deadline_result()
+            if not breaker.allow_request():
+                return self._degrade(prompt, deployment, max_tokens, temperature, use_cache)
+
             try:
                 if attempt > 0:
                     logger.info(f"Retry attempt {attempt + 1}/{max_retries} for {deployment}...")
-                    time.sleep(retry_delay * attempt)  # Exponential backoff
-
-                logger.info(f"Generating content with {deployment}...")
-                # GPT-5-Pro needs much longer timeout for complex reasoning (3-4 minutes typical)
-                timeout = 300 if is_responses_api else 90  # 5 minutes for Responses API, 90s for standard
-                response = requests.post(url, headers=self.headers, json=payload, timeout=timeout)
-                response.raise_for_status()
-
-                data = response.json()
-
-                # Extract content based on API type
-                if is_responses_api:
-                    # Responses API returns output array
-                    if data.get("output") and isinstance(data["output"], list):
-                        # Find message object
-                        message_obj = next((item for item in data["output"] if item.get("type") == "message"), None)
-
-                        if message_obj and message_obj.get("content") and isinstance(message_obj["content"], list):
-                            # Extract text from content items
-                            content = "\n\n".join(
-                                item.get("text", "")
-                                for item in message_obj["content"]
-                                if item.get("text")
-                            )
-                        else:
-                            content = str(data["output"])
-                    else:
-                        content = data.get("output", "")
+                    if not rate_limited:
+                        time.sleep(remaining_timeout(retry_delay * attempt))  # Exponential backoff
+                rate_limited = False
 
-                    # Map usage tokens (Responses API uses different field names)
-                    usage = {
-                        "prompt_tokens": data.get("usage", {}).get("input_tokens", 0),
-                        "completion_tokens": data.get("usage", {}).get("output_tokens", 0),
-                        "total_tokens": data.get("usage", {}).get("total_tokens", 0)
-                    }
-                else:
-                    # Standard Chat Completions format
-                    content = data["choices"][0]["message"]["content"]
-                    usage = data.get("usage", {})
+                with span("http.attempt", attempt=attempt + 1) as attempt_span:
+                    # 429 waits (Retry-After) are applied by the limiter
+                    rate_limiter.acquire_blocking(estimated_tokens)
+
+                    logger.info(f"Generating content with {deployment}...")
+                    note_attempt()
+                    sent = time.monotonic()
+                    attempt_span.set(wait_seconds=round(attempt_span.elapsed(), 3))
+                    response = self.transport.session.post(
+                        url,
+                        headers=self.headers,
+                        json=payload,
+                        timeout=self._attempt_timeout(latency_key, timeout, attempt)
+                    )
+                    attempt_span.set(status_code=response.status_code, response_bytes=len(response.content))
+                    rate_limiter.update_from_headers(response.headers, response.status_code)
+                    self._record_health(breaker, response.status_code)
+                    response.raise_for_status()
+
+                    data = response.json()
+
+                content, usage = self._parse_response(data, is_responses_api)
 
                 # Check if content is empty
                 if not content or len(content) == 0:
@@ -141,12 +414,15 @@ class AzureOpenAIClient:
                         return {"success": False, "error": "Empty content returned after retries"}
 
                 logger.success(f"Article generated ({len(content)} chars)")
+                self.timeouts.record(latency_key, time.monotonic() - sent)
+                self.cache.set(cache_key, content, usage, deployment=deployment)
                 return {"success": True, "content": content, "usage": usage}
 
             except requests.exceptions.HTTPError as e:
                 # Check if it's a 4xx error (client error) - don't retry these unless it's 429 (rate limit)
                 if e.response.status_code == 429:
-                    logger.warning(f"Rate limit hit, will retry after backoff...")
+                    logger.warning(f"Rate limit hit, will retry after Retry-After...")
+                    rate_limited = True
                     if attempt < max_retries - 1:
                         continue
                 elif 400 <= e.response.status_code < 500:
@@ -157,13 +433,18 @@ class AzureOpenAIClient:
                         continue
                     return {"success": False, "error": str(e)}
                 else:
-                    # 5xx errors - retry
+                    # 5xx errors - retry (or reroute once the circuit has opened)
                     logger.warning(f"Server error, will retry: {e}")
+                    if breaker.state == CircuitBreaker.OPEN:
+                        return self._degrade(prompt, deployment, max_tokens, temperature, use_cache)
                     if attempt < max_retries - 1:
                         continue
                     return {"success": False, "error": str(e)}
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, *MALFORMED_RESPONSE_ERRORS) as e:
                 logger.error(f"Azure OpenAI API error: {e}")
+                breaker.record_failure()
+                if breaker.state == CircuitBreaker.OPEN:
+                    return self._degrade(prompt, deployment, max_tokens, temperature, use_cache)
                 if attempt < max_retries - 1:
                     logger.info("Retrying after network error...")
                     continue
@@ -172,11 +453,469 @@ class AzureOpenAIClient:
         # If we get here, all retries failed
         return {"success": False, "error": f"All {max_retries} retry attempts failed"}
 
+    async def generate_article_async(
+        self,
+        prompt: str,
+        deployment: str = GPT5_DEPLOYMENT,
+        max_tokens: int = 16384,
+        temperature: float = None,
+        use_cache: bool = True,
+        stream: bool = False
+    ) -> Dict:
+        """
+        Generate article content on the running event loop (aiohttp transport)
+
+        Same request, response and retry semantics as generate_article, without
+        tying up a worker thread for the duration of the call. Uses the shared
+        async connection pool from the transport.
+
+        Args:
+            prompt: Article generation prompt
+            deployment: GPT-5 model deployment name (gpt-5 or gpt-5-pro)
+            max_tokens: Maximum tokens in response (16384 for GPT-5-Pro)
+            temperature: Creativity level (0-1), None for default
+            use_cache: Read from the response cache (fresh results are always stored)
+            stream: Receive the response over SSE (adds time_to_first_token to the result)
+
+        Returns:
+            Dict with generated content
+        """
+        if stream:
+            # Streams record their own usage
+            article_stream = self.stream_article(prompt, deployment, max_tokens, temperature, use_cache)
+            async for _ in article_stream:
+                pass
+            return article_stream.result()
+
+        with self.usage.track(deployment) as call, self._call_span(deployment) as call_span:
+            result = await self._generate_article_async(prompt, deployment, max_tokens, temperature, use_cache)
+            return call.finish(_trace_result(call_span, result))
+
+    async def _generate_article_async(
+        self,
+        prompt: str,
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        use_cache: bool
+    ) -> Dict:
+        """Uncounted body of generate_article_async (non-streaming)"""
+        is_responses_api = deployment == "gpt-5-pro"
+        url, payload, timeout = self._build_request(prompt, deployment, max_tokens, temperature)
+
+        cache_key = self._cache_key(deployment, payload, max_tokens, temperature)
+        cached = self._get_cached(cache_key if use_cache else None, deployment)
+        if cached:
+            return cached
+
+        session = await self.transport.get_async_session()
+        headers = clean_headers(self.headers)
+
+        # Shared per-deployment quota; Azure counts prompt + max_tokens against TPM
+        rate_limiter = get_rate_limiter(deployment)
+        estimated_tokens = self._estimate_request_tokens(prompt, max_tokens, deployment)
+        latency_key = self._latency_key(deployment)
+
+        # Shared per-deployment health; an open circuit reroutes or fails fast
+        breaker = get_circuit_breaker(deployment)
+
+        # Retry logic for transient errors
+        max_retries = 3
+        retry_delay = 2  # seconds
+        rate_limited = False
+
+        for attempt in range(max_retries):
+            if deadline_exceeded():
+                return deadline_result()
+            if not breaker.allow_request():
+                return await self._degrade_async(prompt, deployment, max_tokens, temperature, use_cache)
+
+            try:
+                if attempt > 0:
+                    logger.info(f"Retry attempt {attempt + 1}/{max_retries} for {deployment}...")
+                    if not rate_limited:
+                        await asyncio.sleep(remaining_timeout(retry_delay * attempt))  # Exponential backoff
+                rate_limited = False
+
+                # At most N requests in flight per deployment; 429 waits (Retry-After) are applied by the limiter
+                with span("http.attempt", attempt=attempt + 1) as attempt_span:
+                    async with self.limits.slot(deployment):
+                        await rate_limiter.acquire(estimated_tokens)
+
+                        logger.info(f"Generating content with {deployment}...")
+                        note_attempt()
+                        sent = time.monotonic()
+                        attempt_span.set(wait_seconds=round(attempt_span.elapsed(), 3))
+                        async with session.post(
+                            url,
+                            headers=headers,
+                            json=payload,
+                            timeout=aiohttp.ClientTimeout(total=self._attempt_timeout(latency_key, timeout, attempt))
+                        ) as response:
+                            attempt_span.set(status_code=response.status, response_bytes=response.content_length)
+                            rate_limiter.update_from_headers(response.headers, response.status)
+                            self._record_health(breaker, response.status)
+                            response.raise_for_status()
+                            data = await response.json(content_type=None)
+
+                content, usage = self._parse_response(data, is_responses_api)
+
+                # Check if content is empty
+                if not content or len(content) == 0:
+                    logger.warning(f"Empty content returned from {deployment}, retrying...")
+                    if attempt < max_retries - 1:
+                        continue
+                    else:
+                        return {"success": False, "error": "Empty content returned after retries"}
+
+                logger.success(f"Article generated ({len(content)} chars)")
+                self.timeouts.record(latency_key, time.monotonic() - sent)
+                self.cache.set(cache_key, content, usage, deployment=deployment)
+                return {"success": True, "content": content, "usage": usage}
+
+            except aiohttp.ClientResponseError as e:
+                # Check if it's a 4xx error (client error) - don't retry these unless it's 429 (rate limit)
+                if e.status == 429:
+                    logger.warning(f"Rate limit hit, will retry after Retry-After...")
+                    rate_limited = True
+                    if attempt < max_retries - 1:
+                        continue
+                elif 400 <= e.status < 500:
+                    logger.error(f"Client error {e.status}: {e}")
+                    # For 400 errors, try one more time with a delay
+                    if attempt < max_retries - 1:
+                        logger.info("Retrying 400 error after delay...")
+                        continue
+                    return {"success": False, "error": str(e)}
+                else:
+                    # 5xx errors - retry (or reroute once the circuit has opened)
+                    logger.warning(f"Server error, will retry: {e}")
+                    if breaker.state == CircuitBreaker.OPEN:
+                        return await self._degrade_async(prompt, deployment, max_tokens, temperature, use_cache)
+                    if attempt < max_retries - 1:
+                        continue
+                    return {"success": False, "error": str(e)}
+            except (aiohttp.ClientError, asyncio.TimeoutError, *MALFORMED_RESPONSE_ERRORS) as e:
+                logger.error(f"Azure OpenAI API error: {e!r}")
+                breaker.record_failure()
+                if breaker.state == CircuitBreaker.OPEN:
+                    return await self._degrade_async(prompt, deployment, max_tokens, temperature, use_cache)
+                if attempt < max_retries - 1:
+                    logger.info("Retrying after network error...")
+                    continue
+                return {"success": False, "error": repr(e)}
+
+        # If we get here, all retries failed
+        return {"success": False, "error": f"All {max_retries} retry attempts failed"}
+
+    def _record_health(self, breaker: CircuitBreaker, status: int) -> None:
+        """
+        Feed an HTTP status into the circuit breaker
+
+        429, 408 and 5xx are failures, so a deployment that keeps throttling
+        trips over to its fallback. Other 4xx (bad request, auth, not found)
+        are the request's fault, not the deployment's, and are not recorded.
+        """
+        if status in (408, 429) or status >= 500:
+            breaker.record_failure()
+        elif status < 400:
+            breaker.record_success()
+
+    def _degrade(
+        self,
+        prompt: str,
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        use_cache: bool
+    ) -> Dict:
+        """Reroute a call to the fallback deployment while the circuit is open"""
+        fallback = CIRCUIT_FALLBACKS.get(deployment)
+        if not fallback or fallback == deployment:
+            logger.error(f"⚡ Circuit open for {deployment}, failing fast")
+            return {"success": False, "error": f"Circuit open for {deployment}", "circuit_open": True}
+
+        logger.warning(f"⚡ Circuit open for {deployment}, rerouting to {fallback}")
+        result = self.generate_article(prompt, fallback, max_tokens, temperature, use_cache)
+        return {**result, "deployment": fallback, "degraded_from": deployment}
+
+    async def _degrade_async(
+        self,
+        prompt: str,
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        use_cache: bool
+    ) -> Dict:
+        """Async variant of _degrade"""
+        fallback = CIRCUIT_FALLBACKS.get(deployment)
+        if not fallback or fallback == deployment:
+            logger.error(f"⚡ Circuit open for {deployment}, failing fast")
+            return {"success": False, "error": f"Circuit open for {deployment}", "circuit_open": True}
+
+        logger.warning(f"⚡ Circuit open for {deployment}, rerouting to {fallback}")
+        result = await self.generate_article_async(prompt, fallback, max_tokens, temperature, use_cache)
+        return {**result, "deployment": fallback, "degraded_from": deployment}
+
+    async def generate_article_background(
+        self,
+        prompt: str,
+        deployment: str = GPT5_PRO_DEPLOYMENT,
+        max_tokens: int = 16384,
+        temperature: float = None,
+        use_cache: bool = True
+    ) -> Dict:
+        """
+        Generate content as a Responses API background job and poll for it
+
+        The response id is persisted before polling starts. A dropped
+        connection only costs one poll, and a restarted process running the
+        same prompt resumes the stored job instead of paying for a new
+        reasoning run.
+
+        Args:
+            prompt: Article generation prompt
+            deployment: Responses API deployment (gpt-5-pro)
+            max_tokens: Maximum tokens in response
+            temperature: Creativity level (0-1), None for default
+            use_cache: Read from the response cache (fresh results are always stored)
+
+        Returns:
+            Dict with generated content (response_id included)
+        """
+        with self.usage.track(deployment) as call, self._call_span(deployment, background=True) as call_span:
+            result = await self._generate_article_background(prompt, deployment, max_tokens, temperature, use_cache)
+            return call.finish(_trace_result(call_span, result))
+
+    async def _generate_article_background(
+        self,
+        prompt: str,
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        use_cache: bool
+    ) -> Dict:
+        """Uncounted body of generate_article_background"""
+        if deployment != "gpt-5-pro":
+            # Background mode only exists on the Responses API
+            return await self.generate_article_async(prompt, deployment, max_tokens, temperature, use_cache)
+
+        breaker = get_circuit_breaker(deployment)
+
+        url, payload, _ = self._build_request(prompt, deployment, max_tokens, temperature)
+
+        cache_key = self._cache_key(deployment, payload, max_tokens, temperature)
+        cached = self._get_cached(cache_key if use_cache else None, deployment)
+        if cached:
+            return cached
+
+        job = self.job_store.get(cache_key)
+        response_id = job["response_id"] if job else None
+        if response_id:
+            logger.info(f"Resuming {deployment} background job {response_id}")
+
+        max_retries = 3
+        retry_delay = 2  # seconds
+        result = {"success": False, "error": f"All {max_retries} retry attempts failed"}
+
+        for attempt in range(max_retries):
+            if deadline_exceeded():
+                # Any submitted job stays in the store for a later run to collect
+                return deadline_result()
+            if attempt > 0:
+                logger.info(f"Retry attempt {attempt + 1}/{max_retries} for {deployment} background job...")
+                await asyncio.sleep(remaining_timeout(retry_delay * attempt))
+
+            if response_id is None:
+                if not breaker.allow_request():
+                    return await self._degrade_async(prompt, deployment, max_tokens, temperature, use_cache)
+
+                submitted = await self._submit_background(url, payload, deployment, prompt, max_tokens)
+                if not submitted["success"]:
+                    result = submitted
+                    continue
+                response_id = submitted["response_id"]
+                self.job_store.put(cache_key, response_id, deployment)
+
+            with span("background.poll", response_id=response_id) as poll_span:
+                result = await self._poll_background(response_id, deployment)
+                if not result["success"]:
+                    poll_span.fail(result["error"])
+
+            if result["success"]:
+                self.job_store.remove(cache_key)
+                self.cache.set(cache_key, result["content"], result["usage"], deployment=deployment)
+                return result
+
+            if result.get("terminal"):
+                breaker.record_failure()
+            else:
+                # Still running (or unreachable): keep the id so a later run can collect it
+                return result
+
+            # Job failed/expired server-side: forget it and submit a new one
+            self.job_store.remove(cache_key)
+            response_id = None
+
+        return result
+
+    async def _submit_background(
+        self,
+        url: str,
+        payload: Dict,
+        deployment: str,
+        prompt: str,
+        max_tokens: int
+    ) -> Dict:
+        """Submit a Responses API request with background=true"""
+        session = await self.transport.get_async_session()
+        rate_limiter = get_rate_limiter(deployment)
+        await rate_limiter.acquire(self._estimate_request_tokens(prompt, max_tokens, deployment))
+
+        try:
+            logger.info(f"Submitting {deployment} background job...")
+            note_attempt()
+            with span("http.attempt", request="submit") as attempt_span:
+                async with self.limits.slot(deployment), session.post(
+                    url,
+                    headers=clean_headers(self.headers),
+                    json={**payload, "background": True, "store": True},
+                    timeout=aiohttp.ClientTimeout(total=60)
+                ) as response:
+                    attempt_span.set(status_code=response.status, response_bytes=response.content_length)
+                    rate_limiter.update_from_headers(response.headers, response.status)
+                    self._record_health(get_circuit_breaker(deployment), response.status)
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+                    response_id = data.get("id")
+        except (aiohttp.ClientError, asyncio.TimeoutError, *MALFORMED_RESPONSE_ERRORS) as e:
+            logger.error(f"Background job submission failed: {e!r}")
+            if not isinstance(e, aiohttp.ClientResponseError):
+                get_circuit_breaker(deployment).record_failure()
+            return {"success": False, "error": repr(e)}
+
+        if not response_id:
+            return {"success": False, "error": "Background submission returned no response id"}
+
+        logger.success(f"Background job {response_id} submitted ({data.get('status', 'queued')})")
+        return {"success": True, "response_id": response_id}
+
+    async def _poll_background(self, response_id: str, deployment: str) -> Dict:
+        """
+        Poll a background job until it finishes
+
+        Args:
+            response_id: Responses API id
+            deployment: Deployment name (for logging)
+
+        Returns:
+            Generation result; terminal=True marks jobs that must be resubmitted
+        """
+        session = await self.transport.get_async_session()
+        headers = clean_headers(self.headers)
+        url = f"{self.endpoint}openai/responses/{response_id}?api-version={RESPONSES_API_VERSION}"
+
+        max_poll_errors = 10
+        poll_errors = 0
+        started = time.monotonic()
+        last_heartbeat = started
+        max_wait = remaining_timeout(BACKGROUND_MAX_WAIT_SECONDS)
+
+        while True:
+            elapsed = time.monotonic() - started
+            if elapsed > max_wait:
+                return {
+                    "success": False,
+                    "error": f"Background job {response_id} still running after {elapsed:.0f}s",
+                    "response_id": response_id
+                }
+
+            try:
+                async with session.get(
+                    url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status == 404:
+                        return {
+                            "success": False,
+                            "terminal": True,
+                            "error": f"Background job {response_id} not found"
+                        }
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+                    status = data.get("status")
+                poll_errors = 0
+            except (aiohttp.ClientError, asyncio.TimeoutError, *MALFORMED_RESPONSE_ERRORS) as e:
+                poll_errors += 1
+                if poll_errors >= max_poll_errors:
+                    return {
+                        "success": False,
+                        "error": f"Lost contact with background job {response_id}: {e!r}",
+                        "response_id": response_id
+                    }
+                logger.warning(f"Poll of {response_id} failed ({poll_errors}/{max_poll_errors}): {e!r}")
+                await asyncio.sleep(BACKGROUND_POLL_INTERVAL)
+                continue
+
+            if status in ("completed", "incomplete"):
+                content, usage = self._parse_response(data, True)
+                if content:
+                    logger.success(f"Background job {response_id} {status} after {elapsed:.0f}s ({len(content)} chars)")
+                    return {"success": True, "content": content, "usage": usage, "response_id": response_id}
+                return {
+                    "success": False,
+                    "terminal": True,
+                    "error": f"Background job {response_id} {status} with empty content"
+                }
+
+            if status in ("failed", "cancelled"):
+                return {
+                    "success": False,
+                    "terminal": True,
+                    "error": f"Background job {response_id} {status}: {data.get('error')}"
+                }
+
+            now = time.monotonic()
+            if now - last_heartbeat >= BACKGROUND_HEARTBEAT_INTERVAL:
+                logger.info(f"⏳ {deployment} job {response_id} {status} ({now - started:.0f}s elapsed)")
+                last_heartbeat = now
+
+            await asyncio.sleep(BACKGROUND_POLL_INTERVAL)
+
+    def stream_article(
+        self,
+        prompt: str,
+        deployment: str = GPT5_DEPLOYMENT,
+        max_tokens: int = 16384,
+        temperature: float = None,
+        use_cache: bool = True
+    ) -> "ArticleStream":
+        """
+        Stream article content as text deltas (SSE)
+
+        Works for both the Responses API (gpt-5-pro) and Chat Completions.
+        Iterate the returned ArticleStream with ``async for``; once exhausted
+        it exposes the final content, usage and time to first token.
+
+        Args:
+            prompt: Article generation prompt
+            deployment: GPT-5 model deployment name (gpt-5 or gpt-5-pro)
+            max_tokens: Maximum tokens in response
+            temperature: Creativity level (0-1), None for default
+            use_cache: Serve a cached response as a single delta when available
+
+        Returns:
+            ArticleStream async iterator
+        """
+        return ArticleStream(self, prompt, deployment, max_tokens, temperature, use_cache)
+
     def translate_content(
         self,
         text: str,
         target_language: str,
-        context: str = "trading article"
+        context: str = "trading article",
+        use_cache: bool = True
     ) -> Dict:
         """
         Translate content to target language using GPT-5
@@ -185,6 +924,7 @@ class AzureOpenAIClient:
             text: English text to translate
             target_language: arabic_gcc, spanish, or portuguese
             context: Content context for better translation
+            use_cache: Read from the response cache (False forces a fresh translation)
 
         Returns:
             Dict with translated content
@@ -196,8 +936,9 @@ class AzureOpenAIClient:
         return self.generate_article(
             prompt=prompt,
             deployment=GPT5_DEPLOYMENT,
-            max_tokens=6000,  # Higher for reasoning + translation
-            temperature=None  # Use default for GPT-5 reasoning models
+            max_tokens=TRANSLATION_MAX_TOKENS,
+            temperature=None,  # Use default for GPT-5 reasoning models
+            use_cache=use_cache
         )
 
     def generate_seo_metadata(
@@ -228,6 +969,74 @@ class AzureOpenAIClient:
             temperature=None  # Use default for GPT-5
         )
 
+        return self._parse_seo_result(result, category, asset)
+
+    async def translate_content_async(
+        self,
+        text: str,
+        target_language: str,
+        context: str = "trading article",
+        use_cache: bool = True
+    ) -> Dict:
+        """Async variant of translate_content (hedged when a policy is configured)"""
+        from config.prompts import get_translation_prompt
+
+        prompt = get_translation_prompt(text, target_language, context)
+
+        return await self._run_hedged(
+            f"{GPT5_DEPLOYMENT}:translation",
+            lambda: self.generate_article_async(
+                prompt=prompt,
+                deployment=GPT5_DEPLOYMENT,
+                max_tokens=TRANSLATION_MAX_TOKENS,
+                temperature=None,  # Use default for GPT-5 reasoning models
+                use_cache=use_cache
+            )
+        )
+
+    def forget(self, prompt: str, deployment: str, max_tokens: int, temperature: Optional[float]) -> None:
+        """Drop the cached response to a request (e.g. one that failed downstream validation)"""
+        _, payload, _ = self._build_request(prompt, deployment, max_tokens, temperature)
+        self.cache.invalidate(self._cache_key(deployment, payload, max_tokens, temperature))
+
+    def forget_translation(self, text: str, target_language: str, context: str = "trading article") -> None:
+        """Drop the cached translation of a text, so the next run translates it afresh"""
+        from config.prompts import get_translation_prompt
+
+        prompt = get_translation_prompt(text, target_language, context)
+        self.forget(prompt, GPT5_DEPLOYMENT, TRANSLATION_MAX_TOKENS, None)
+
+    async def generate_seo_metadata_async(
+        self,
+        article: str,
+        category: str,
+        asset: str
+    ) -> Dict:
+        """Async variant of generate_seo_metadata (hedged when a policy is configured)"""
+        from config.prompts import get_seo_metadata_prompt
+
+        prompt = get_seo_metadata_prompt(article, category, asset)
+
+        result = await self._run_hedged(
+            f"{GPT5_DEPLOYMENT}:seo",
+            lambda: self.generate_article_async(
+                prompt=prompt,
+                deployment=GPT5_DEPLOYMENT,
+                max_tokens=2000,  # Increased for reasoning models
+                temperature=None  # Use default for GPT-5
+            )
+        )
+
+        return self._parse_seo_result(result, category, asset)
+
+    async def _run_hedged(self, key: str, make_call: Callable[[], Awaitable[Dict]]) -> Dict:
+        """Run a call through the hedging policy, or directly when hedging is off"""
+        if self.hedging is None:
+            return await make_call()
+        return await self.hedging.run(key, make_call)
+
+    def _parse_seo_result(self, result: Dict, category: str, asset: str) -> Dict:
+        """Parse SEO metadata JSON from a generation result"""
         if result["success"]:
             # Parse JSON response
             try:
@@ -251,10 +1060,7 @@ class AzureOpenAIClient:
         Returns:
             Dict with quality score and suggestions
         """
-        prompt = f"""Review this {category} trading article for quality:
-
-ARTICLE:
-{article[:1000]}...
+        prompt = f"""Review the trading article at the end of this message for quality.
 
 EVALUATE:
 1. Content accuracy and completeness
@@ -269,7 +1075,10 @@ Provide:
 - Improvements needed (bullet points)
 - Overall recommendation (publish/revise)
 
-Format as JSON."""
+Format as JSON.
+
+ARTICLE ({category}):
+{fit_to_budget(article, QUALITY_REVIEW_BUDGET)}"""
 
         return self.generate_article(
             prompt=prompt,
@@ -289,3 +1098,231 @@ Format as JSON."""
                 "image_alt": f"{asset} {category} trading chart showing market analysis"
             }
         }
+
+
+class ArticleStream:
+    """
+    Async iterator over the text deltas of a streamed generation
+
+    Retries (same policy as generate_article_async) are only possible until
+    the first delta has been yielded; after that a dropped stream ends the
+    iteration with success=False and the partial content kept.
+    """
+
+    def __init__(
+        self,
+        client: AzureOpenAIClient,
+        prompt: str,
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        use_cache: bool
+    ):
+        self.client = client
+        self.prompt = prompt
+        self.deployment = deployment
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.use_cache = use_cache
+
+        # Filled in while streaming
+        self.content = ""
+        self.usage: Dict = {}
+        self.time_to_first_token: Optional[float] = None
+        self.success: Optional[bool] = None
+        self.error: Optional[str] = None
+        self.cached = False
+        self.degraded_from: Optional[str] = None
+        self.attempts = 0
+        self.span: Optional[Span] = None
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._tracked()
+
+    def result(self) -> Dict:
+        """
+        Get the final result in generate_article format
+
+        Returns:
+            Dict with success, content, usage and time_to_first_token
+        """
+        if not self.success:
+            return {"success": False, "error": self.error or "Stream not consumed", "content": self.content}
+
+        result = {
+            "success": True,
+            "content": self.content,
+            "usage": self.usage,
+            "time_to_first_token": self.time_to_first_token
+        }
+        if self.cached:
+            result["cached"] = True
+        if self.degraded_from:
+            result["deployment"] = self.deployment
+            result["degraded_from"] = self.degraded_from
+        return result
+
+    async def _tracked(self) -> AsyncIterator[str]:
+        """Iterate and record the call in the client's usage collector"""
+        requested = self.deployment
+        started = time.monotonic()
+        tracer = get_tracer()
+        self.span = tracer.start("llm.call", **{**current_call_context(), "deployment": requested, "stream": True})
+        try:
+            async for delta in self._iterate():
+                yield delta
+        finally:
+            self.client.usage.record(
+                deployment=requested,
+                result=self.result(),
+                latency=time.monotonic() - started,
+                attempts=self.attempts
+            )
+            _trace_result(self.span, self.result())
+            tracer.end(self.span)
+
+    async def _iterate(self) -> AsyncIterator[str]:
+        """Run the request and yield deltas as they arrive"""
+        client = self.client
+        deployment = self.deployment
+        is_responses_api = deployment == "gpt-5-pro"
+        url, payload, timeout = client._build_request(self.prompt, deployment, self.max_tokens, self.temperature)
+
+        started = time.monotonic()
+        cache_key = client._cache_key(deployment, payload, self.max_tokens, self.temperature)
+        cached = client._get_cached(cache_key if self.use_cache else None, deployment)
+        if cached:
+            self.content, self.usage, self.cached = cached["content"], cached["usage"], True
+            self.time_to_first_token = time.monotonic() - started
+            self.success = True
+            yield self.content
+            return
+
+        payload["stream"] = True
+        if not is_responses_api:
+            payload["stream_options"] = {"include_usage": True}
+
+        session = await client.transport.get_async_session()
+        headers = clean_headers(client.headers)
+        rate_limiter = get_rate_limiter(deployment)
+        breaker = get_circuit_breaker(deployment)
+        estimated_tokens = client._estimate_request_tokens(self.prompt, self.max_tokens, deployment)
+        latency_key = client._latency_key(deployment)
+
+        max_retries = 3
+        retry_delay = 2  # seconds
+        rate_limited = False
+
+        for attempt in range(max_retries):
+            if deadline_exceeded():
+                self.success, self.error = False, deadline_result()["error"]
+                return
+            if not breaker.allow_request():
+                async for delta in self._degrade():
+                    yield delta
+                return
+
+            parts = []
+            try:
+                if attempt > 0:
+                    logger.info(f"Retry attempt {attempt + 1}/{max_retries} for {deployment} stream...")
+                    if not rate_limited:
+                        await asyncio.sleep(remaining_timeout(retry_delay * attempt))  # Exponential backoff
+                rate_limited = False
+
+                with get_tracer().child(self.span, "http.attempt", attempt=attempt + 1) as attempt_span:
+                    async with client.limits.slot(deployment):
+                        await rate_limiter.acquire(estimated_tokens)
+
+                        logger.info(f"Streaming content from {deployment}...")
+                        self.attempts += 1
+                        sent = time.monotonic()
+                        attempt_span.set(wait_seconds=round(attempt_span.elapsed(), 3))
+                        async with session.post(
+                            url,
+                            headers=headers,
+                            json=payload,
+                            timeout=aiohttp.ClientTimeout(total=client._attempt_timeout(latency_key, timeout, attempt))
+                        ) as response:
+                            attempt_span.set(status_code=response.status)
+                            rate_limiter.update_from_headers(response.headers, response.status)
+                            client._record_health(breaker, response.status)
+                            response.raise_for_status()
+
+                            async for event in client._iter_sse(response):
+                                delta, usage, error = client._parse_stream_event(event, is_responses_api)
+                                if error:
+                                    raise RuntimeError(f"Stream failed: {error}")
+                                if usage:
+                                    self.usage = usage
+                                if delta:
+                                    if self.time_to_first_token is None:
+                                        self.time_to_first_token = time.monotonic() - started
+                                        logger.info(f"{deployment} first token after {self.time_to_first_token:.1f}s")
+                                    parts.append(delta)
+                                    yield delta
+                        attempt_span.set(response_chars=sum(len(part) for part in parts))
+
+                self.content = "".join(parts)
+                if not self.content:
+                    logger.warning(f"Empty content streamed from {deployment}, retrying...")
+                    if attempt < max_retries - 1:
+                        continue
+                    self.success, self.error = False, "Empty content returned after retries"
+                    return
+
+                logger.success(f"Article streamed ({len(self.content)} chars)")
+                client.timeouts.record(latency_key, time.monotonic() - sent)
+                client.cache.set(cache_key, self.content, self.usage, deployment=deployment)
+                self.success = True
+                return
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError) as e:
+                if isinstance(e, aiohttp.ClientResponseError) and e.status == 429:
+                    logger.warning(f"Rate limit hit, will retry after Retry-After...")
+                    rate_limited = True
+                else:
+                    logger.error(f"Azure OpenAI stream error: {e!r}")
+                if not isinstance(e, aiohttp.ClientResponseError):
+                    breaker.record_failure()
+
+                if parts:
+                    # Deltas already handed to the consumer, cannot restart transparently
+                    self.content = "".join(parts)
+                    self.success, self.error = False, f"Stream interrupted after {len(self.content)} chars: {e!r}"
+                    return
+                if attempt < max_retries - 1:
+                    continue
+                self.success, self.error = False, repr(e)
+                return
+
+        self.success, self.error = False, f"All {max_retries} retry attempts failed"
+
+    async def _degrade(self) -> AsyncIterator[str]:
+        """Continue the stream on the fallback deployment while the circuit is open"""
+        fallback = CIRCUIT_FALLBACKS.get(self.deployment)
+        if not fallback or fallback == self.deployment:
+            logger.error(f"⚡ Circuit open for {self.deployment}, failing fast")
+            self.success, self.error = False, f"Circuit open for {self.deployment}"
+            return
+
+        logger.warning(f"⚡ Circuit open for {self.deployment}, streaming from {fallback} instead")
+        self.degraded_from, self.deployment = self.deployment, fallback
+        async for delta in self._iterate():
+            yield delta
+
+
+def _trace_result(call_span: Span, result: Dict) -> Dict:
+    """Copy the outcome and token counts of a call onto its span (result returned unchanged)"""
+    usage = result.get("usage") or {}
+    call_span.set(
+        served_by=result.get("deployment"),
+        cached=bool(result.get("cached")),
+        prompt_tokens=usage.get("prompt_tokens"),
+        completion_tokens=usage.get("completion_tokens"),
+        reasoning_tokens=usage.get("reasoning_tokens"),
+        time_to_first_token=result.get("time_to_first_token")
+    )
+    if not result.get("success"):
+        call_span.fail(str(result.get("error")))
+    return result
@@ -0,0 +1,96 @@
+"""
+Background Job Store
+Persists Responses API background job ids so a restarted run can collect results
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+from loguru import logger
+from config.credentials import BACKGROUND_JOBS_PATH
+
+
+class BackgroundJobStore:
+    """
+    JSON file mapping a request key to its in-flight background response id
+
+    The key is the content address of the request (see LLMResponseCache.make_key),
+    so re-running the same prompt after a crash resumes the existing job
+    instead of paying for a new reasoning run.
+    """
+
+    def __init__(self, path: str = BACKGROUND_JOBS_PATH):
+        """
+        Initialize store
+
+        Args:
+            path: JSON file holding pending jobs
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def get(self, job_key: str) -> Optional[Dict]:
+        """
+        Get a pending job
+
+        Args:
+            job_key: Request key
+
+        Returns:
+            Dict with response_id, deployment and submitted_at, or None
+        """
+        with self._lock:
+            return self._load().get(job_key)
+
+    def put(self, job_key: str, response_id: str, deployment: str) -> None:
+        """
+        Record a submitted job
+
+        Args:
+            job_key: Request key
+            response_id: Responses API id returned on submission
+            deployment: Deployment the job runs on
+        """
+        with self._lock:
+            jobs = self._load()
+            jobs[job_key] = {
+                "response_id": response_id,
+                "deployment": deployment,
+                "submitted_at": time.time()
+            }
+            self._save(jobs)
+
+    def remove(self, job_key: str) -> None:
+        """Forget a job (collected, failed or expired)"""
+        with self._lock:
+            jobs = self._load()
+            if jobs.pop(job_key, None) is not None:
+                self._save(jobs)
+
+    def pending(self) -> Dict[str, Dict]:
+        """Get all jobs that have not been collected yet"""
+        with self._lock:
+            return self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Read the store (caller holds the lock)"""
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable background job store {self.path}: {e}")
+            return {}
+
+    def _save(self, jobs: Dict[str, Dict]) -> None:
+        """Write the store atomically (caller holds the lock)"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(jobs, f, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,478 @@
+"""
+Batch Jobs
+Runs translation and translation-review prompts as offline batch jobs
+(Azure OpenAI Batch API, or a local file-based stand-in for testing)
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+import aiohttp
+from loguru import logger
+from config.credentials import (
+    GPT5_DEPLOYMENT,
+    GPT5_BATCH_DEPLOYMENT,
+    BATCH_BACKEND,
+    BATCH_COLLECT_SECONDS,
+    BATCH_POLL_INTERVAL,
+    BATCH_MAX_WAIT_SECONDS,
+    BATCH_LOCAL_DIR
+)
+from services.azure_openai_client import AzureOpenAIClient, CHAT_COMPLETIONS_API_VERSION, TRANSLATION_MAX_TOKENS
+from services.http_transport import clean_headers
+from services.usage_tracker import note_attempt
+from services.deadline import remaining_timeout
+
+BATCH_API_VERSION = "2024-10-21"
+
+# Terminal batch states (expired/cancelled batches may still carry partial output)
+FINISHED_STATES = ("completed", "failed", "expired", "cancelled")
+
+# Answers one batch line: Chat Completions request body -> response body
+Responder = Callable[[Dict], Awaitable[Dict]]
+
+
+class AzureBatchBackend:
+    """Azure OpenAI Batch API: upload JSONL, create batch, poll, download output"""
+
+    def __init__(self, client: AzureOpenAIClient):
+        """
+        Initialize backend
+
+        Args:
+            client: Client providing endpoint, headers and the shared transport
+        """
+        self.client = client
+
+    def _url(self, path: str) -> str:
+        return f"{self.client.endpoint}openai/{path}?api-version={BATCH_API_VERSION}"
+
+    async def submit(self, lines: List[Dict]) -> str:
+        """
+        Upload the requests and create a batch
+
+        Args:
+            lines: Batch request lines (custom_id, method, url, body)
+
+        Returns:
+            Batch id
+        """
+        session = await self.client.transport.get_async_session()
+        headers = clean_headers(self.client.headers)
+
+        form = aiohttp.FormData()
+        form.add_field("purpose", "batch")
+        form.add_field("file", _to_jsonl(lines).encode("utf-8"), filename="batch.jsonl", content_type="application/jsonl")
+
+        # Multipart upload sets its own Content-Type
+        upload_headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+        async with session.post(
+            self._url("files"),
+            headers=upload_headers,
+            data=form,
+            timeout=aiohttp.ClientTimeout(total=300)
+        ) as response:
+            response.raise_for_status()
+            file_id = (await response.json(content_type=None))["id"]
+
+        async with session.post(
+            self._url("batches"),
+            headers=headers,
+            json={"input_file_id": file_id, "endpoint": "/chat/completions", "completion_window": "24h"},
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            response.raise_for_status()
+            return (await response.json(content_type=None))["id"]
+
+    async def poll(self, batch_id: str) -> Dict:
+        """
+        Get batch status
+
+        Args:
+            batch_id: Id returned by submit
+
+        Returns:
+            Dict with status, plus results (custom_id -> output line) once finished
+        """
+        session = await self.client.transport.get_async_session()
+        headers = clean_headers(self.client.headers)
+
+        async with session.get(
+            self._url(f"batches/{batch_id}"),
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            response.raise_for_status()
+            batch = await response.json(content_type=None)
+
+        status = batch.get("status", "unknown")
+        if status not in FINISHED_STATES:
+            return {"status": status}
+
+        results = {}
+        for file_id in (batch.get("output_file_id"), batch.get("error_file_id")):
+            if not file_id:
+                continue
+            async with session.get(
+                self._url(f"files/{file_id}/content"),
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=300)
+            ) as response:
+                response.raise_for_status()
+                results.update(_parse_jsonl(await response.text()))
+
+        return {"status": status, "results": results}
+
+
+class LocalBatchBackend:
+    """
+    File-based stand-in for the Batch API
+
+    Input, output and status files are written to a directory. A batch
+    completes ``duration`` seconds after submission, with every line
+    answered by the responder (a line it fails on gets an error entry).
+    """
+
+    def __init__(self, responder: Responder, directory: str = BATCH_LOCAL_DIR, duration: float = 1.0):
+        """
+        Initialize backend
+
+        Args:
+            responder: Answers each request line (e.g. interactive_responder or the stand-in's batch_responder)
+            directory: Where batch files are written
+            duration: Seconds until a submitted batch completes
+        """
+        self.responder = responder
+        self.directory = directory
+        self.duration = duration
+
+    def _path(self, batch_id: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{batch_id}.{suffix}")
+
+    async def submit(self, lines: List[Dict]) -> str:
+        """Write the input file and status file (see AzureBatchBackend.submit)"""
+        os.makedirs(self.directory, exist_ok=True)
+        batch_id = f"batch_local_{uuid.uuid4().hex[:12]}"
+
+        with open(self._path(batch_id, "input.jsonl"), "w", encoding="utf-8") as f:
+            f.write(_to_jsonl(lines))
+        with open(self._path(batch_id, "json"), "w", encoding="utf-8") as f:
+            json.dump({"id": batch_id, "status": "in_progress", "created_at": time.time()}, f)
+
+        return batch_id
+
+    async def poll(self, batch_id: str) -> Dict:
+        """Complete the batch once its duration has passed (see AzureBatchBackend.poll)"""
+        with open(self._path(batch_id, "json"), "r", encoding="utf-8") as f:
+            batch = json.load(f)
+
+        if time.time() - batch["created_at"] < self.duration:
+            return {"status": "in_progress"}
+
+        output_path = self._path(batch_id, "output.jsonl")
+        if not os.path.exists(output_path):
+            with open(self._path(batch_id, "input.jsonl"), "r", encoding="utf-8") as f:
+                requests = list(_parse_jsonl(f.read()).values())
+
+            outputs = []
+            for request in requests:
+                try:
+                    body = await self.responder(request["body"])
+                except Exception as e:
+                    outputs.append({"custom_id": request["custom_id"], "response": None, "error": {"message": repr(e)}})
+                    continue
+                outputs.append({
+                    "custom_id": request["custom_id"],
+                    "response": {"status_code": 200, "body": body},
+                    "error": None
+                })
+
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(_to_jsonl(outputs))
+            batch["status"] = "completed"
+            with open(self._path(batch_id, "json"), "w", encoding="utf-8") as f:
+                json.dump(batch, f)
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            return {"status": "completed", "results": _parse_jsonl(f.read())}
+
+
+def interactive_responder(client: AzureOpenAIClient) -> Responder:
+    """
+    Responder sending each batch line as an interactive Chat Completions request
+
+    With BATCH_BACKEND=local this runs batches against AZURE_OPENAI_ENDPOINT,
+    e.g. the stand-in server.
+
+    Args:
+        client: Client providing endpoint, headers and the shared transport
+    """
+    async def respond(body: Dict) -> Dict:
+        session = await client.transport.get_async_session()
+        url = (
+            f"{client.endpoint}openai/deployments/{body['model']}/chat/completions"
+            f"?api-version={CHAT_COMPLETIONS_API_VERSION}"
+        )
+        async with session.post(
+            url,
+            headers=clean_headers(client.headers),
+            json=body,
+            timeout=aiohttp.ClientTimeout(total=300)
+        ) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    return respond
+
+
+def make_batch_backend(client: AzureOpenAIClient):
+    """Build the backend selected by BATCH_BACKEND (azure or local)"""
+    if BATCH_BACKEND == "local":
+        return LocalBatchBackend(interactive_responder(client))
+    return AzureBatchBackend(client)
+
+
+class BatchJobClient:
+    """
+    Drop-in for the async GPT-5 calls of AzureOpenAIClient that go through a batch job
+
+    Requests arriving within ``collect_seconds`` of each other are written
+    as one JSONL batch. Callers await their own result, which has the same
+    shape as generate_article_async (plus ``batch: True``). Identical
+    requests share one batch line, cache hits skip the batch, and requests
+    the batch did not answer fall back to an interactive call.
+    """
+
+    def __init__(
+        self,
+        client: AzureOpenAIClient,
+        backend=None,
+        collect_seconds: float = BATCH_COLLECT_SECONDS,
+        poll_interval: float = BATCH_POLL_INTERVAL,
+        max_wait_seconds: float = BATCH_MAX_WAIT_SECONDS
+    ):
+        """
+        Initialize batch client
+
+        Args:
+            client: Interactive client (request building, cache, usage, fallback)
+            backend: AzureBatchBackend or LocalBatchBackend (BATCH_BACKEND by default)
+            collect_seconds: Wait after the first queued request before submitting
+            poll_interval: Seconds between status polls
+            max_wait_seconds: Give up on a batch after this long
+        """
+        self.client = client
+        self.backend = backend or make_batch_backend(client)
+        self.collect_seconds = collect_seconds
+        self.poll_interval = poll_interval
+        self.max_wait_seconds = max_wait_seconds
+
+        self._pending: Dict[str, Dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.batches_submitted = 0
+        self.requests_batched = 0
+        self.requests_served = 0
+        self.fallbacks = 0
+
+    async def generate_article_async(
+        self,
+        prompt: str,
+        deployment: str = GPT5_DEPLOYMENT,
+        max_tokens: int = 16384,
+        temperature: float = None,
+        use_cache: bool = True,
+        stream: bool = False
+    ) -> Dict:
+        """
+        Generate content through the next batch job
+
+        Args:
+            prompt: Prompt text
+            deployment: Only GPT-5 is batched, other deployments run interactively
+            max_tokens: Maximum tokens in response
+            temperature: Creativity level (0-1), None for default
+            use_cache: Read from the response cache (results are always stored)
+            stream: Streaming requests always run interactively
+
+        Returns:
+            Dict with generated content
+        """
+        if stream or deployment != GPT5_DEPLOYMENT:
+            return await self.client.generate_article_async(prompt, deployment, max_tokens, temperature, use_cache, stream)
+
+        with self.client.usage.track(deployment) as call:
+            result = await self._enqueue(prompt, deployment, max_tokens, temperature, use_cache)
+            if result is None:
+                # Not answered by the batch: pay for an interactive call instead
+                self.fallbacks += 1
+                result = await self.client.generate_article_async(prompt, deployment, max_tokens, temperature, use_cache=False)
+            return call.finish(result)
+
+    async def translate_content_async(
+        self,
+        text: str,
+        target_language: str,
+        context: str = "trading article",
+        use_cache: bool = True
+    ) -> Dict:
+        """Batched variant of AzureOpenAIClient.translate_content_async"""
+        from config.prompts import get_translation_prompt
+
+        prompt = get_translation_prompt(text, target_language, context)
+
+        return await self.generate_article_async(
+            prompt=prompt,
+            deployment=GPT5_DEPLOYMENT,
+            max_tokens=TRANSLATION_MAX_TOKENS,
+            temperature=None,  # Use default for GPT-5 reasoning models
+            use_cache=use_cache
+        )
+
+    def forget_translation(self, text: str, target_language: str, context: str = "trading article") -> None:
+        """Drop the cached translation of a text (batch results share the interactive cache)"""
+        self.client.forget_translation(text, target_language, context)
+
+    def stats(self) -> Dict:
+        """Get batch counters"""
+        return {
+            "batches_submitted": self.batches_submitted,
+            "requests_batched": self.requests_batched,
+            "requests_served": self.requests_served,
+            "fallbacks": self.fallbacks
+        }
+
+    async def _enqueue(
+        self,
+        prompt: str,
+        deployment: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        use_cache: bool
+    ) -> Optional[Dict]:
+        """Queue a request and wait for its batch (None = not answered)"""
+        _, payload, _ = self.client._build_request(prompt, deployment, max_tokens, temperature)
+
+        cache_key = self.client._cache_key(deployment, payload, max_tokens, temperature)
+        cached = self.client._get_cached(cache_key if use_cache else None, deployment)
+        if cached:
+            return cached
+
+        note_attempt()
+        entry = self._pending.get(cache_key)
+        if entry is None:
+            entry = {
+                "line": {
+                    "custom_id": cache_key,
+                    "method": "POST",
+                    "url": "/chat/completions",
+                    "body": {**payload, "model": GPT5_BATCH_DEPLOYMENT}
+                },
+                "deployment": deployment,
+                "future": asyncio.get_running_loop().create_future()
+            }
+            self._pending[cache_key] = entry
+            if self._flush_task is None:
+                self._flush_task = asyncio.ensure_future(self._flush_later())
+
+        # Shielded: a cancelled caller must not cancel a line other callers share
+        result = await asyncio.shield(entry["future"])
+        return dict(result) if result else None
+
+    async def _flush_later(self) -> None:
+        """Submit everything queued during the collection window as one batch"""
+        pending: Dict[str, Dict] = {}
+        results: Dict[str, Dict] = {}
+        try:
+            await asyncio.sleep(self.collect_seconds)
+            pending, self._pending, self._flush_task = self._pending, {}, None
+            results = await self._run_batch([entry["line"] for entry in pending.values()])
+        except Exception as e:
+            logger.error(f"Batch job failed: {e!r}")
+        finally:
+            if self._flush_task is asyncio.current_task():
+                # Cancelled while collecting: the queued requests belong to this batch
+                pending, self._pending, self._flush_task = self._pending, {}, None
+
+            # Every waiting caller gets an answer (None = fall back to an interactive call),
+            # also when the batch was cancelled
+            for custom_id, entry in pending.items():
+                result = self._map_result(custom_id, entry["deployment"], results.get(custom_id))
+                if result:
+                    self.requests_served += 1
+                if not entry["future"].done():
+                    entry["future"].set_result(result)
+
+    async def _run_batch(self, lines: List[Dict]) -> Dict[str, Dict]:
+        """Submit and poll one batch, returning its output lines by custom_id"""
+        batch_id = await self.backend.submit(lines)
+        self.batches_submitted += 1
+        self.requests_batched += len(lines)
+        logger.info(f"Submitted batch {batch_id} with {len(lines)} requests")
+
+        started = time.monotonic()
+        max_wait = remaining_timeout(self.max_wait_seconds)
+        while time.monotonic() - started < max_wait:
+            await asyncio.sleep(self.poll_interval)
+
+            try:
+                status = await self.backend.poll(batch_id)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Batch keeps running server-side, try again next interval
+                logger.warning(f"Polling batch {batch_id} failed: {e!r}")
+                continue
+
+            if "results" in status:
+                logger.info(
+                    f"Batch {batch_id} {status['status']} after {time.monotonic() - started:.0f}s "
+                    f"({len(status['results'])}/{len(lines)} results)"
+                )
+                return status["results"]
+
+        logger.error(f"Batch {batch_id} did not finish within {max_wait:.0f}s")
+        return {}
+
+    def _map_result(self, custom_id: str, deployment: str, item: Optional[Dict]) -> Optional[Dict]:
+        """Turn a batch output line into a generate_article result (None = not usable)"""
+        if not item or item.get("error"):
+            return None
+
+        response = item.get("response") or {}
+        if response.get("status_code") != 200:
+            return None
+
+        try:
+            content, usage = self.client._parse_response(response.get("body") or {}, False)
+        except (KeyError, IndexError, TypeError):
+            return None
+        if not content:
+            return None
+
+        self.client.cache.set(custom_id, content, usage, deployment=deployment)
+        return {"success": True, "content": content, "usage": usage, "batch": True}
+
+
+def _to_jsonl(lines: List[Dict]) -> str:
+    """Serialize dicts as JSON lines"""
+    return "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines)
+
+
+def _parse_jsonl(text: str) -> Dict[str, Dict]:
+    """Parse JSON lines keyed by custom_id"""
+    parsed = {}
+    for raw in text.splitlines():
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            line = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping malformed batch line: {raw[:80]}")
+            continue
+        if line.get("custom_id"):
+            parsed[line["custom_id"]] = line
+    return parsed
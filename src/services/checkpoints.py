@@ -0,0 +1,184 @@
+"""
+Checkpoint Store
+Per-run phase outputs on disk, so a failed run can resume without regenerating
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from loguru import logger
+from config.credentials import CHECKPOINT_ENABLED, CHECKPOINT_DIR, CHECKPOINT_RETENTION_DAYS
+
+
+def fingerprint(inputs: Dict[str, Any]) -> str:
+    """
+    Hash of a phase's inputs
+
+    Args:
+        inputs: Results the phase is called with
+
+    Returns:
+        Hex digest (changes whenever an upstream result changes)
+    """
+    encoded = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Phase outputs of one run: <dir>/<run id>/<article key>/<phase>.json
+
+    Every run writes checkpoints; only resumed runs read them. A checkpoint
+    is valid when the inputs it was computed from hash to the same
+    fingerprint as the inputs of the resumed phase, so a redone research
+    phase invalidates everything downstream of it.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        resume: bool = False,
+        root: str = CHECKPOINT_DIR,
+        enabled: bool = CHECKPOINT_ENABLED,
+        retention_days: int = CHECKPOINT_RETENTION_DAYS
+    ):
+        """
+        Initialize store
+
+        Args:
+            run_id: Run key (the run date)
+            resume: Read existing checkpoints (otherwise they are only written)
+            root: Directory holding one folder per run
+            enabled: False disables reads and writes
+            retention_days: Run folders older than this are deleted (0 = keep all)
+        """
+        self.run_id = run_id
+        self.resume = resume and enabled
+        self.enabled = enabled
+        self.path = os.path.join(root, run_id)
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        if enabled and retention_days > 0:
+            self._prune(root, retention_days)
+
+    def scope(self, article_key: str) -> "ArticleCheckpoints":
+        """Get the checkpoints of one article (or of the run itself, e.g. "_run")"""
+        return ArticleCheckpoints(self, _safe_name(article_key))
+
+    def load(self, article_key: str, phase: str, inputs_hash: str) -> Optional[Dict]:
+        """
+        Get a valid checkpoint
+
+        Args:
+            article_key: Article the phase belongs to
+            phase: Phase name
+            inputs_hash: Fingerprint of the phase's current inputs
+
+        Returns:
+            {"value": ...} when resuming and the stored inputs match, else None
+        """
+        if not self.resume:
+            return None
+
+        try:
+            with open(self._file(article_key, phase), "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {article_key}/{phase}: {e}")
+            self.misses += 1
+            return None
+
+        if checkpoint.get("inputs") != inputs_hash:
+            logger.info(f"Checkpoint {article_key}/{phase} is stale (inputs changed), redoing phase")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {"value": checkpoint.get("value")}
+
+    def save(self, article_key: str, phase: str, inputs_hash: str, value: Any) -> None:
+        """
+        Store a phase output (atomically; failures only log)
+
+        Args:
+            article_key: Article the phase belongs to
+            phase: Phase name
+            inputs_hash: Fingerprint of the inputs it was computed from
+            value: JSON-serialisable phase result
+        """
+        if not self.enabled:
+            return
+
+        path = self._file(article_key, phase)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"saved_at": datetime.now().isoformat(), "inputs": inputs_hash, "value": value},
+                    f,
+                    ensure_ascii=False,
+                    default=str
+                )
+            os.replace(tmp_path, path)
+            self.writes += 1
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write checkpoint {article_key}/{phase}: {e}")
+
+    def stats(self) -> Dict:
+        """Get resume counters"""
+        return {
+            "run_id": self.run_id,
+            "resume": self.resume,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes
+        }
+
+    def _file(self, article_key: str, phase: str) -> str:
+        """Checkpoint file of a phase"""
+        return os.path.join(self.path, article_key, f"{_safe_name(phase)}.json")
+
+    def _prune(self, root: str, retention_days: int) -> None:
+        """Delete run folders (named YYYY-MM-DD) older than the retention period"""
+        cutoff = (datetime.now() - timedelta(days=retention_days)).strftime("%Y-%m-%d")
+        try:
+            names = os.listdir(root)
+        except FileNotFoundError:
+            return
+        for name in names:
+            if re.fullmatch(r"\d{4}-\d{2}-\d{2}", name) and name < cutoff:
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+class ArticleCheckpoints:
+    """Checkpoint store bound to one article key"""
+
+    def __init__(self, store: CheckpointStore, article_key: str):
+        self.store = store
+        self.article_key = article_key
+
+    def load(self, phase: str, inputs_hash: str) -> Optional[Dict]:
+        """See CheckpointStore.load"""
+        return self.store.load(self.article_key, phase, inputs_hash)
+
+    def save(self, phase: str, inputs_hash: str, value: Any) -> None:
+        """See CheckpointStore.save"""
+        self.store.save(self.article_key, phase, inputs_hash, value)
+
+
+def _safe_name(name: str) -> str:
+    """File-system safe version of an article key or phase name (EUR/USD -> eur-usd)"""
+    return re.sub(r"[^a-z0-9_]+", "-", name.lower()).strip("-") or "_"
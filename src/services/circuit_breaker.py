@@ -0,0 +1,139 @@
+"""
+Circuit Breaker
+Per-deployment closed/open/half-open breaker shared by all agents
+"""
+
+import threading
+import time
+from typing import Dict
+from loguru import logger
+from config.credentials import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RECOVERY_SECONDS
+
+
+class CircuitBreaker:
+    """
+    Tracks consecutive failures (429s, 5xx, timeouts, connection errors) of one deployment
+
+    CLOSED: requests flow normally.
+    OPEN: requests are refused until recovery_timeout has passed.
+    HALF_OPEN: one probe request per recovery_timeout is let through; its
+    success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout: float = CIRCUIT_RECOVERY_SECONDS
+    ):
+        """
+        Initialize breaker
+
+        Args:
+            name: Deployment name (for logging)
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds before a half-open probe is allowed
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+
+        # Counters
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state (closed, open or half_open)"""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent to the deployment
+
+        Returns:
+            True if closed, or if this caller is the half-open probe
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+
+            if self._state == self.OPEN and now - self._opened_at >= self.recovery_timeout:
+                self._state = self.HALF_OPEN
+                self._probe_started_at = now
+                logger.info(f"Circuit {self.name} half-open, sending probe request")
+                return True
+
+            if self._state == self.HALF_OPEN and now - self._probe_started_at >= self.recovery_timeout:
+                # Previous probe never reported back, let another one through
+                self._probe_started_at = now
+                return True
+
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a response from a healthy deployment"""
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.success(f"Circuit {self.name} closed (deployment recovered)")
+            self._state = self.CLOSED
+            self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Record a throttled request, server error, timeout or connection failure"""
+        with self._lock:
+            self._consecutive_failures += 1
+
+            should_open = (
+                self._state == self.HALF_OPEN
+                or (self._state == self.CLOSED and self._consecutive_failures >= self.failure_threshold)
+            )
+            if should_open:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+                logger.error(
+                    f"⚡ Circuit {self.name} opened after {self._consecutive_failures} consecutive failures"
+                )
+
+    def stats(self) -> Dict:
+        """Get breaker state and counters"""
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(deployment: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a deployment"""
+    with _breakers_lock:
+        if deployment not in _breakers:
+            _breakers[deployment] = CircuitBreaker(deployment)
+        return _breakers[deployment]
+
+
+def get_circuit_breaker_stats() -> Dict[str, Dict]:
+    """Get state for every breaker created in this process"""
+    with _breakers_lock:
+        return {name: breaker.stats() for name, breaker in _breakers.items()}
@@ -0,0 +1,73 @@
+"""
+Provider Concurrency Limits
+Caps on requests in flight per provider (Perplexity, each Azure deployment) for a run
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+
+class ProviderLimits:
+    """
+    One semaphore per provider, shared by every agent of a run
+
+    The rate limiter paces requests per minute; these caps bound how many
+    are open at once, so a large run plan queues at the client instead of
+    piling long GPT-5-Pro calls onto the deployment. Providers without a
+    configured limit (or a limit of 0) are not capped.
+    """
+
+    def __init__(self, limits: Dict[str, int]):
+        """
+        Initialize limits
+
+        Args:
+            limits: Provider name -> max requests in flight
+        """
+        self.limits = {name: limit for name, limit in limits.items() if limit > 0}
+        self._semaphores = {name: asyncio.Semaphore(limit) for name, limit in self.limits.items()}
+
+        # Counters
+        self._in_flight = {name: 0 for name in self.limits}
+        self._peak = {name: 0 for name in self.limits}
+        self._queued = {name: 0 for name in self.limits}
+        self._total_wait = {name: 0.0 for name in self.limits}
+
+    @asynccontextmanager
+    async def slot(self, provider: str) -> AsyncIterator[None]:
+        """
+        Hold one of the provider's slots for the block
+
+        Args:
+            provider: "perplexity" or an Azure deployment name
+        """
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            yield
+            return
+
+        if semaphore.locked():
+            self._queued[provider] += 1
+        started = time.monotonic()
+        async with semaphore:
+            self._total_wait[provider] += time.monotonic() - started
+            self._in_flight[provider] += 1
+            self._peak[provider] = max(self._peak[provider], self._in_flight[provider])
+            try:
+                yield
+            finally:
+                self._in_flight[provider] -= 1
+
+    def stats(self) -> Dict[str, Dict]:
+        """Get limit, peak in-flight and queueing counters per provider"""
+        return {
+            name: {
+                "limit": limit,
+                "peak_in_flight": self._peak[name],
+                "queued": self._queued[name],
+                "total_wait_seconds": round(self._total_wait[name], 2)
+            }
+            for name, limit in self.limits.items()
+        }
@@ -0,0 +1,113 @@
+"""
+Run Deadline
+Run-wide time budget carried through agents and clients via a context variable
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+# Smallest timeout handed to a call while budget remains (avoids zero/negative timeouts)
+MIN_CALL_TIMEOUT = 1.0
+
+
+class Deadline:
+    """Absolute point in time (monotonic clock) by which work has to be done"""
+
+    def __init__(self, seconds: float):
+        """
+        Initialize deadline
+
+        Args:
+            seconds: Budget from now
+        """
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left (negative once expired)"""
+        return self.expires_at - time.monotonic()
+
+    def expired(self) -> bool:
+        """True once the budget is used up"""
+        return self.remaining() <= 0
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """
+        Get an earlier deadline that keeps time back for later phases
+
+        Args:
+            seconds: Time to hold back (e.g. for delivery)
+
+        Returns:
+            Deadline expiring `seconds` before this one
+        """
+        child = Deadline(0)
+        child.expires_at = self.expires_at - seconds
+        child.budget = child.remaining()
+        return child
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("run_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Make a deadline current for the block (None leaves work unbounded)
+
+    Args:
+        deadline: Deadline to apply
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the current task, if any"""
+    return _current_deadline.get()
+
+
+def deadline_exceeded() -> bool:
+    """True if a deadline is set and has passed"""
+    deadline = _current_deadline.get()
+    return deadline is not None and deadline.expired()
+
+
+def remaining_timeout(per_call: float) -> float:
+    """
+    Timeout for the next call
+
+    Args:
+        per_call: The call's own timeout
+
+    Returns:
+        min(per_call, remaining budget), never below MIN_CALL_TIMEOUT
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return per_call
+    return max(MIN_CALL_TIMEOUT, min(per_call, deadline.remaining()))
+
+
+def has_budget(seconds: float) -> bool:
+    """
+    Check whether a phase needing `seconds` still fits
+
+    Args:
+        seconds: Expected duration
+
+    Returns:
+        True without a deadline, otherwise whether that much time is left
+    """
+    deadline = _current_deadline.get()
+    return deadline is None or deadline.remaining() >= seconds
+
+
+def deadline_result() -> Dict:
+    """Failure result for calls refused because the run deadline has passed"""
+    return {"success": False, "error": "Run deadline exceeded", "deadline_exceeded": True}
@@ -0,0 +1,145 @@
+"""
+Request Hedging
+Duplicate slow calls once they pass a latency percentile and keep the first success
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional
+from loguru import logger
+from config.credentials import HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_MAX_RATIO, HEDGE_MIN_BUDGET
+from services.latency_stats import RollingLatencyWindow
+
+
+class HedgingPolicy:
+    """
+    Opt-in hedging for latency-sensitive, idempotent calls (translation, SEO)
+
+    A call that has not finished after the configured percentile of recently
+    observed latency for its key gets a duplicate. Whichever succeeds first
+    is returned and the other is cancelled. Hedges are capped at a fraction
+    of all calls so the extra spend stays bounded, with a small fixed
+    allowance so a run with only a few calls can still hedge.
+    """
+
+    def __init__(
+        self,
+        percentile: float = HEDGE_PERCENTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        max_hedge_ratio: float = HEDGE_MAX_RATIO,
+        min_budget: int = HEDGE_MIN_BUDGET,
+        latencies: Optional[RollingLatencyWindow] = None
+    ):
+        """
+        Initialize policy
+
+        Args:
+            percentile: Latency percentile (0-1) after which a hedge is fired
+            min_samples: Samples needed per key before hedging starts
+            max_hedge_ratio: Max hedges as a fraction of calls
+            min_budget: Hedges allowed regardless of the ratio
+            latencies: Latency history the client already records into (e.g. the
+                persisted window behind its adaptive timeouts); without it the
+                policy fills a private window from the calls it hedges
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_budget = min_budget
+        self.latencies = latencies or RollingLatencyWindow()
+        self._records_latency = latencies is None
+
+        # Counters
+        self.calls = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+        self.hedges_skipped_budget = 0
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """
+        Get the delay after which a call for this key is hedged
+
+        Args:
+            key: "<deployment>:<call type>"
+
+        Returns:
+            Seconds, or None while there are too few samples
+        """
+        if self.latencies.count(key) < self.min_samples:
+            return None
+        return self.latencies.percentile(key, self.percentile)
+
+    async def run(self, key: str, make_call: Callable[[], Awaitable[Dict]]) -> Dict:
+        """
+        Run a call with hedging
+
+        Args:
+            key: "<deployment>:<call type>" used for latency tracking
+            make_call: Factory returning a fresh awaitable result dict per invocation
+
+        Returns:
+            First successful result (or the last failure)
+        """
+        self.calls += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(make_call())
+
+        delay = self.hedge_delay(key)
+        if delay is None:
+            return self._record(key, started, await primary)
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return self._record(key, started, primary.result())
+
+        # The first min_budget hedges are free, later ones must stay within the ratio
+        if self.hedges_fired >= self.min_budget and self.hedges_fired + 1 > self.max_hedge_ratio * self.calls:
+            self.hedges_skipped_budget += 1
+            return self._record(key, started, await primary)
+
+        self.hedges_fired += 1
+        logger.info(f"Hedging {key} call after {delay:.1f}s (hedge #{self.hedges_fired})")
+        hedge_started = time.monotonic()
+        hedge = asyncio.ensure_future(make_call())
+
+        pending = {primary, hedge}
+        result: Dict = {"success": False, "error": "Hedged call produced no result"}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        result = {"success": False, "error": repr(task.exception())}
+                        continue
+
+                    result = task.result()
+                    if result.get("success"):
+                        if task is hedge:
+                            self.hedges_won += 1
+                            return self._record(key, hedge_started, result)
+                        return self._record(key, started, result)
+        finally:
+            # Cancel the loser
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return result
+
+    def stats(self) -> Dict:
+        """Get hedging counters"""
+        return {
+            "calls": self.calls,
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+            "hedges_skipped_budget": self.hedges_skipped_budget,
+            "hedge_ratio": round(self.hedges_fired / self.calls, 3) if self.calls else 0.0
+        }
+
+    def _record(self, key: str, started: float, result: Dict) -> Dict:
+        """Record latency of a fresh successful call (private window only)"""
+        if self._records_latency and result.get("success") and not result.get("cached"):
+            self.latencies.record(key, time.monotonic() - started)
+        return result
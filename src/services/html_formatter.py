@@ -7,6 +7,13 @@ from typing import Dict
 from datetime import datetime
 from loguru import logger
 
+# Translation languages an article package can carry (language key -> HTML lang code, direction)
+LANGUAGES = {
+    "arabic_gcc": {"code": "ar", "rtl": True},
+    "spanish": {"code": "es", "rtl": False},
+    "portuguese": {"code": "pt-BR", "rtl": False}
+}
+
 
 class HTMLFormatter:
     """Formats articles as clean HTML with SEO optimization"""
@@ -180,13 +187,7 @@ class HTMLFormatter:
         }
 
         # Translated versions
-        language_map = {
-            "arabic_gcc": {"code": "ar", "rtl": True},
-            "spanish": {"code": "es", "rtl": False},
-            "portuguese": {"code": "pt-BR", "rtl": False}
-        }
-
-        for lang_key, lang_config in language_map.items():
+        for lang_key, lang_config in LANGUAGES.items():
             if lang_key in translations and translations[lang_key].get("success"):
                 translated_content = translations[lang_key]["translated_content"]
 
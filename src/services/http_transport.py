@@ -0,0 +1,112 @@
+"""
+HTTP Transport
+Process-wide keep-alive connection pools shared by all service clients
+"""
+
+import asyncio
+import threading
+from typing import Dict, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+from config.credentials import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_ASYNC_LIMIT,
+    HTTP_ASYNC_LIMIT_PER_HOST,
+    HTTP_KEEPALIVE_TIMEOUT
+)
+
+
+def clean_headers(headers: Dict) -> Dict[str, str]:
+    """Drop None header values (requests ignores them, aiohttp rejects them)"""
+    return {k: v for k, v in (headers or {}).items() if v is not None}
+
+
+class HTTPTransport:
+    """
+    Shared connection pools for sync (requests) and async (aiohttp) calls
+
+    Both sides keep one pool of keep-alive connections per host, so
+    repeated calls to Perplexity, Azure OpenAI and Zapier reuse TCP+TLS
+    connections instead of opening a new one per request.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        async_limit: int = HTTP_ASYNC_LIMIT,
+        async_limit_per_host: int = HTTP_ASYNC_LIMIT_PER_HOST,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT
+    ):
+        """
+        Initialize transport
+
+        Args:
+            pool_connections: Number of per-host pools kept by the sync session
+            pool_maxsize: Max keep-alive connections per host (sync)
+            async_limit: Max total connections for the async session (0 = unlimited)
+            async_limit_per_host: Max connections per host for the async session (0 = unlimited)
+            keepalive_timeout: Seconds an idle async connection is kept open
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.async_limit = async_limit
+        self.async_limit_per_host = async_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+
+        # Sync session (requests/urllib3 keeps one pool per host)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Async session, created lazily inside the running loop
+        self._async_session: Optional[aiohttp.ClientSession] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def get_async_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+
+        if self._async_session is None or self._async_session.closed or self._async_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.async_limit,
+                limit_per_host=self.async_limit_per_host,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._async_session = aiohttp.ClientSession(connector=connector)
+            self._async_loop = loop
+            logger.debug(
+                f"Opened async HTTP pool (limit={self.async_limit}, per_host={self.async_limit_per_host})"
+            )
+
+        return self._async_session
+
+    async def aclose(self) -> None:
+        """Close the async session (must run on the loop that created it)"""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_loop = None
+
+    def close(self) -> None:
+        """Close the sync session"""
+        self.session.close()
+
+
+_shared_transport: Optional[HTTPTransport] = None
+_shared_transport_lock = threading.Lock()
+
+
+def get_shared_transport() -> HTTPTransport:
+    """Get the process-wide transport, creating it on first use"""
+    global _shared_transport
+
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = HTTPTransport()
+        return _shared_transport
@@ -8,15 +8,19 @@ import random
 from typing import Optional, List
 from loguru import logger
 from config.credentials import TRADING_IMAGES_PATH, TRADING_IMAGES_URL
+from services.http_transport import HTTPTransport, get_shared_transport
 
 
 class ImageManager:
     """Manages trading images from GitHub repository and web fallback"""
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         self.images_path = TRADING_IMAGES_PATH
         self.images_url = TRADING_IMAGES_URL
 
+        # Shared keep-alive connection pools
+        self.transport = transport or get_shared_transport()
+
         # Asset to folder mapping
         self.asset_folders = {
             # Forex
@@ -165,7 +169,7 @@ class ImageManager:
         import requests
 
         try:
-            response = requests.head(url, timeout=5)
+            response = self.transport.session.head(url, timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
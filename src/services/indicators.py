@@ -0,0 +1,369 @@
+"""
+Technical Indicators
+Vectorized SMA/EMA, RSI, MACD, ATR, pivot levels and 24h change over local OHLC data
+"""
+
+import csv
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Collection, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from config.credentials import PRICE_DATA_DIR, PRICE_DATA_MAX_AGE_HOURS, INDICATOR_LOOKBACK_BARS
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: only CSV price files are read without it
+    pq = None
+
+SMA_PERIODS = (20, 50, 200)
+EMA_PERIODS = (12, 26)
+RSI_PERIOD = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+ATR_PERIOD = 14
+
+_COLUMNS = ("open", "high", "low", "close")
+_OPTIONAL_COLUMNS = ("volume",)
+_TIME_COLUMNS = ("timestamp", "date", "datetime", "time")
+
+
+def load_ohlc(path: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Load an OHLC series from a CSV or Parquet file
+
+    Args:
+        path: File with a timestamp/date column and open, high, low, close columns
+
+    Returns:
+        Dict with "time" (epoch seconds) and float arrays per column (volume is
+        NaN when the file has none), oldest first, or None if the file cannot be read
+    """
+    try:
+        if path.endswith(".parquet"):
+            if pq is None:
+                logger.warning(f"pyarrow not installed, skipping {path}")
+                return None
+            table = pq.read_table(path).to_pydict()
+            columns = {name.lower(): values for name, values in table.items()}
+        else:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+            columns = {name.lower().strip(): [row[name] for row in rows] for name in (rows[0] if rows else {})}
+
+        time_column = next((c for c in _TIME_COLUMNS if c in columns), None)
+        if time_column is None or any(c not in columns for c in _COLUMNS):
+            logger.warning(f"{path} needs a timestamp column and {', '.join(_COLUMNS)}")
+            return None
+
+        series = {"time": np.array([_epoch(v) for v in columns[time_column]], dtype=float)}
+        for column in _COLUMNS:
+            series[column] = np.array(columns[column], dtype=float)
+        for column in _OPTIONAL_COLUMNS:
+            values = columns.get(column)
+            series[column] = (
+                np.array([v if v not in (None, "") else np.nan for v in values], dtype=float)
+                if values is not None else np.full(len(series["close"]), np.nan)
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Could not load price data {path}: {e}")
+        return None
+
+    order = np.argsort(series["time"], kind="stable")
+    return {name: values[order] for name, values in series.items()}
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average along the last axis (NaN until `period` values exist)"""
+    result = np.full(values.shape, np.nan)
+    if values.shape[-1] < period:
+        return result
+
+    sums = np.cumsum(values, axis=-1)
+    result[..., period - 1] = sums[..., period - 1]
+    result[..., period:] = sums[..., period:] - sums[..., :-period]
+    return result / period
+
+
+def ema(values: np.ndarray, period: int, alpha: Optional[float] = None) -> np.ndarray:
+    """
+    Exponential moving average along the last axis
+
+    Vectorized across rows (assets); the recursion runs over time.
+
+    Args:
+        values: Array shaped (assets, bars)
+        period: Span (alpha = 2 / (period + 1)) unless alpha is given
+        alpha: Smoothing factor override (Wilder smoothing uses 1 / period)
+    """
+    alpha = 2.0 / (period + 1) if alpha is None else alpha
+    result = np.empty(values.shape)
+    result[..., 0] = values[..., 0]
+    for i in range(1, values.shape[-1]):
+        result[..., i] = alpha * values[..., i] + (1 - alpha) * result[..., i - 1]
+    return result
+
+
+def rsi(close: np.ndarray, period: int = RSI_PERIOD) -> np.ndarray:
+    """Wilder's relative strength index (0-100)"""
+    delta = np.diff(close, axis=-1, prepend=close[..., :1])
+    gains = ema(np.clip(delta, 0, None), period, alpha=1.0 / period)
+    losses = ema(np.clip(-delta, 0, None), period, alpha=1.0 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = 100 - 100 / (1 + gains / losses)
+    # No losses at all: maximally overbought (flat series: neutral)
+    result = np.where(losses == 0, np.where(gains == 0, 50.0, 100.0), result)
+    return result
+
+
+def macd(close: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram (12/26/9)"""
+    line = ema(close, MACD_FAST) - ema(close, MACD_SLOW)
+    signal = ema(line, MACD_SIGNAL)
+    return line, signal, line - signal
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = ATR_PERIOD) -> np.ndarray:
+    """Wilder's average true range"""
+    previous_close = np.concatenate([close[..., :1], close[..., :-1]], axis=-1)
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - previous_close), np.abs(low - previous_close)))
+    return ema(true_range, period, alpha=1.0 / period)
+
+
+def pivot_levels(time: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Classic floor pivots from the previous session (one value per asset)
+
+    The session is the UTC calendar day: its high/low are taken over all of
+    its bars and its close is its last bar, so intraday files give daily
+    pivots rather than pivots of the previous bar. The previous session is
+    the last day with bars before the current one (Friday on a Monday).
+
+    Args:
+        time: Bar times in epoch seconds, same shape as the prices
+        high: Bar highs
+        low: Bar lows
+        close: Bar closes
+
+    Returns:
+        Dict of levels (NaN where there is no earlier session)
+    """
+    day = np.floor(time / 86400)
+    earlier = day < day[..., -1:]
+    previous_day = np.where(earlier, day, -np.inf).max(axis=-1, keepdims=True)
+    session = day == previous_day
+
+    h = np.where(session, high, -np.inf).max(axis=-1)
+    l = np.where(session, low, np.inf).min(axis=-1)
+    last_bar = session.shape[-1] - 1 - np.argmax(session[..., ::-1], axis=-1)
+    c = np.take_along_axis(close, last_bar[..., None], axis=-1)[..., 0]
+
+    with np.errstate(invalid="ignore"):
+        has_session = session.any(axis=-1)
+        h, l, c = (np.where(has_session, values, np.nan) for values in (h, l, c))
+        pivot = (h + l + c) / 3
+        return {
+            "pivot": pivot,
+            "support_1": 2 * pivot - h,
+            "support_2": pivot - (h - l),
+            "resistance_1": 2 * pivot - l,
+            "resistance_2": pivot + (h - l)
+        }
+
+
+def stack_series(series: Dict[str, Dict[str, np.ndarray]], names: List[str], column: str) -> np.ndarray:
+    """
+    Right-align one column of several series into an (assets x bars) array
+
+    Args:
+        series: Loaded series per asset
+        names: Row order
+        column: Column to stack
+
+    Returns:
+        Array with shorter series front-padded with their first value
+    """
+    width = max(len(series[name]["close"]) for name in names)
+    return np.vstack([
+        np.concatenate([np.full(width - len(values), values[0]), values])
+        for values in (series[name][column] for name in names)
+    ])
+
+
+class IndicatorEngine:
+    """
+    Computes indicators for every asset with price data in one vectorized pass
+
+    Series are right-aligned into (assets x bars) arrays; shorter histories are
+    front-padded with their first bar, and indicators needing more bars than an
+    asset has are reported as None. Results are computed once per engine.
+    """
+
+    def __init__(
+        self,
+        assets: Dict[str, str],
+        data_dir: str = PRICE_DATA_DIR,
+        lookback_bars: int = INDICATOR_LOOKBACK_BARS,
+        max_age_hours: float = PRICE_DATA_MAX_AGE_HOURS
+    ):
+        """
+        Initialize engine
+
+        Args:
+            assets: Asset name -> file slug (e.g. ImageManager.asset_folders)
+            data_dir: Directory holding <slug>.csv or <slug>.parquet files
+            lookback_bars: Bars used per asset (most recent)
+            max_age_hours: Ignore series whose last bar is older than this (0 = no limit)
+        """
+        self.assets = assets
+        self.data_dir = data_dir
+        self.lookback_bars = lookback_bars
+        self.max_age_hours = max_age_hours
+
+        self._series: Optional[Dict[str, Dict[str, np.ndarray]]] = None
+        self._results: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+
+    def for_asset(self, asset: str) -> Optional[Dict]:
+        """
+        Get indicators for one asset
+
+        Args:
+            asset: Asset name as selected from research (matched loosely, e.g. "WTI Crude Oil" -> "Oil")
+
+        Returns:
+            Dict of indicator values, or None without usable price data
+        """
+        results = self.compute_all()
+        name = match_asset(asset, results)
+        return results.get(name) if name else None
+
+    def compute_all(self) -> Dict[str, Dict]:
+        """Compute (once) and return indicators for every asset with price data"""
+        series = self.series()
+        with self._lock:
+            if self._results is None:
+                self._results = self._compute(series)
+            return self._results
+
+    def series(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Load (once) and return the recent bars of every asset with fresh price data"""
+        with self._lock:
+            if self._series is None:
+                self._series = self._load_all()
+            return self._series
+
+    def _load_all(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Load the most recent bars of every asset that has a fresh price file"""
+        now = datetime.now(timezone.utc).timestamp()
+        series = {}
+        for asset, slug in self.assets.items():
+            path = next(
+                (p for p in (os.path.join(self.data_dir, f"{slug}{ext}") for ext in (".parquet", ".csv")) if os.path.exists(p)),
+                None
+            )
+            if path is None:
+                continue
+
+            ohlc = load_ohlc(path)
+            if ohlc is None or len(ohlc["close"]) < 2:
+                continue
+
+            age_hours = (now - ohlc["time"][-1]) / 3600
+            if self.max_age_hours and age_hours > self.max_age_hours:
+                logger.warning(f"Price data for {asset} is {age_hours:.0f}h old, ignoring it")
+                continue
+
+            series[asset] = {name: values[-self.lookback_bars:] for name, values in ohlc.items()}
+        return series
+
+    def _compute(self, series: Dict[str, Dict[str, np.ndarray]]) -> Dict[str, Dict]:
+        """Run every indicator over the stacked series"""
+        if not series:
+            logger.info(f"No price data in {self.data_dir}, articles use research figures only")
+            return {}
+
+        names = list(series)
+        bars = np.array([len(series[name]["close"]) for name in names])
+        width = int(bars.max())
+
+        times, high, low, close = (stack_series(series, names, column) for column in ("time", "high", "low", "close"))
+        rows = np.arange(len(names))
+        last = close[:, -1]
+
+        # 24h change: bar closest to 24h before the last one, from each series' bar spacing
+        spacing = np.array([np.median(np.diff(series[name]["time"])) for name in names])
+        bars_per_day = np.clip(np.rint(86400 / np.maximum(spacing, 1)), 1, bars - 1).astype(int)
+        change_24h = (last / close[rows, width - 1 - bars_per_day] - 1) * 100
+
+        values: Dict[str, Tuple[np.ndarray, int]] = {
+            "price": (last, 1),
+            "change_24h_pct": (change_24h, 2),
+            "rsi_14": (rsi(close)[:, -1], RSI_PERIOD + 1),
+            "atr_14": (atr(high, low, close)[:, -1], ATR_PERIOD + 1)
+        }
+        for period in SMA_PERIODS:
+            values[f"sma_{period}"] = (sma(close, period)[:, -1], period)
+        for period in EMA_PERIODS:
+            values[f"ema_{period}"] = (ema(close, period)[:, -1], period)
+        line, signal, histogram = macd(close)
+        values["macd"] = (line[:, -1], MACD_SLOW)
+        values["macd_signal"] = (signal[:, -1], MACD_SLOW + MACD_SIGNAL)
+        values["macd_histogram"] = (histogram[:, -1], MACD_SLOW + MACD_SIGNAL)
+        for level, level_values in pivot_levels(times, high, low, close).items():
+            values[level] = (level_values, 2)
+
+        results = {}
+        for row, name in enumerate(names):
+            decimals = _decimals(last[row])
+            indicators = {
+                key: (round(float(column[row]), 2 if key in ("change_24h_pct", "rsi_14") else decimals)
+                      if bars[row] >= needed and np.isfinite(column[row]) else None)
+                for key, (column, needed) in values.items()
+            }
+            indicators["bars"] = int(bars[row])
+            indicators["as_of"] = datetime.fromtimestamp(times[row, -1], timezone.utc).isoformat()
+            results[name] = indicators
+
+        logger.info(f"Computed technical indicators for {len(results)} assets")
+        return results
+
+
+def _epoch(value) -> float:
+    """Epoch seconds from a number, ISO date/datetime string or datetime"""
+    if isinstance(value, datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+    if isinstance(value, (int, float)):
+        return float(value) / (1000 if value > 1e11 else 1)  # Milliseconds from most exporters
+
+    text = str(value).strip()
+    try:
+        number = float(text)
+        return number / (1000 if number > 1e11 else 1)
+    except ValueError:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        return (parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def _decimals(price: float) -> int:
+    """Display precision for a price level (FX quotes need more digits)"""
+    return 4 if price < 10 else 2
+
+
+def match_asset(asset: str, known: Collection[str]) -> Optional[str]:
+    """Find the known asset name (dict keys or list) a research asset name refers to"""
+    if asset in known:
+        return asset
+
+    wanted = asset.lower().replace(" ", "")
+    for name in known:
+        if name.lower().replace(" ", "") == wanted:
+            return name
+
+    # Research names are often longer ("WTI Crude Oil", "Bitcoin (BTC)")
+    words: List[str] = asset.lower().replace("(", " ").replace(")", " ").split()
+    for name in known:
+        if name.lower() in words:
+            return name
+    return None
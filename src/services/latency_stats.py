@@ -0,0 +1,156 @@
+"""
+Latency Statistics
+Rolling latency samples per (deployment, call type)
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+from loguru import logger
+
+# Upper bucket bounds (seconds) for exported histograms; the last bucket is open-ended
+HISTOGRAM_BOUNDS = (1, 2, 5, 10, 20, 30, 60, 90, 120, 180, 300, 600)
+
+
+class RollingLatencyWindow:
+    """Keeps the most recent latency samples per key and answers percentile queries"""
+
+    def __init__(self, window: int = 200, path: Optional[str] = None):
+        """
+        Initialize window
+
+        Args:
+            window: Samples kept per key
+            path: JSON file the samples are loaded from and saved to (None = in memory only)
+        """
+        self.window = window
+        self.path = path
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+        if path:
+            self._load()
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add a latency sample"""
+        with self._lock:
+            samples = self._samples.setdefault(key, deque(maxlen=self.window))
+            samples.append(seconds)
+
+    def count(self, key: str) -> int:
+        """Number of samples held for a key"""
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def keys(self) -> List[str]:
+        """Keys with at least one sample"""
+        with self._lock:
+            return sorted(self._samples)
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """
+        Get a latency percentile
+
+        Args:
+            key: Sample key
+            q: Percentile in [0, 1]
+
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+
+        if not samples:
+            return None
+
+        index = min(len(samples) - 1, max(0, int(round(q * (len(samples) - 1)))))
+        return samples[index]
+
+    def histogram(self, key: str) -> Dict:
+        """
+        Summarize the samples of one key
+
+        Args:
+            key: Sample key
+
+        Returns:
+            Dict with count, p50/p90/p99/max and bucket counts keyed by upper bound ("le")
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+
+        buckets = {f"le_{bound}": 0 for bound in HISTOGRAM_BOUNDS}
+        buckets["inf"] = 0
+        for seconds in samples:
+            bound = next((b for b in HISTOGRAM_BOUNDS if seconds <= b), None)
+            buckets[f"le_{bound}" if bound is not None else "inf"] += 1
+
+        return {
+            "count": len(samples),
+            "p50": _rounded(self.percentile(key, 0.5)),
+            "p90": _rounded(self.percentile(key, 0.9)),
+            "p99": _rounded(self.percentile(key, 0.99)),
+            "max": _rounded(samples[-1] if samples else None),
+            "buckets": buckets
+        }
+
+    def export(self) -> Dict[str, Dict]:
+        """Get histograms for every key (for capacity planning)"""
+        return {key: self.histogram(key) for key in self.keys()}
+
+    def write_export(self, path: str) -> str:
+        """
+        Write histograms for every key as JSON
+
+        Args:
+            path: Export file path
+
+        Returns:
+            Path written
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.export(), f, indent=2)
+
+        logger.info(f"Latency histograms written to {path}")
+        return path
+
+    def save(self) -> None:
+        """Persist the samples so the next run starts with this run's history"""
+        if not self.path:
+            return
+
+        with self._lock:
+            data = {key: list(samples) for key, samples in self._samples.items()}
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not save latency samples to {self.path}: {e}")
+
+    def _load(self) -> None:
+        """Read persisted samples (missing or unreadable file = start empty)"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable latency samples {self.path}: {e}")
+            return
+
+        for key, samples in data.items():
+            self._samples[key] = deque((float(s) for s in samples), maxlen=self.window)
+
+
+def _rounded(seconds: Optional[float]) -> Optional[float]:
+    """Round a latency for export"""
+    return round(seconds, 3) if seconds is not None else None
@@ -0,0 +1,251 @@
+"""
+LLM Response Cache
+Content-addressed SQLite cache for Azure OpenAI generations (TTL + LRU eviction)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from loguru import logger
+from config.credentials import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MAX_BYTES
+)
+
+
+class LLMResponseCache:
+    """
+    On-disk cache of successful LLM responses
+
+    Entries are keyed on a SHA-256 of (deployment, API flavour, full prompt,
+    max_tokens, temperature), expire after a per-entry TTL and are evicted
+    least-recently-used first once the store grows past max_bytes.
+    """
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        ttl_seconds: int = LLM_CACHE_TTL_SECONDS,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        enabled: bool = LLM_CACHE_ENABLED
+    ):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Default time-to-live for new entries
+            max_bytes: Size bound for stored content before LRU eviction
+            enabled: Disable to turn every lookup into a miss without touching disk
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Per-process counters
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.tokens_saved = 0
+
+    @staticmethod
+    def make_key(
+        deployment: str,
+        api_flavour: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float]
+    ) -> str:
+        """
+        Build the content address for a request
+
+        Args:
+            deployment: Model deployment name
+            api_flavour: "responses" or "chat"
+            prompt: Full prompt as sent (including system instructions)
+            max_tokens: Output token limit
+            temperature: Sampling temperature (None for default)
+
+        Returns:
+            Hex digest cache key
+        """
+        material = json.dumps(
+            [deployment, api_flavour, prompt, max_tokens, temperature],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Dict with content and usage, or None on miss/expiry
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT content, usage, expires_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            content, usage_json, expires_at = row
+            if expires_at <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                self.misses += 1
+                return None
+
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+
+            usage = json.loads(usage_json) if usage_json else {}
+            self.hits += 1
+            self.tokens_saved += usage.get("total_tokens", 0) or 0
+
+        return {"content": content, "usage": usage}
+
+    def set(
+        self,
+        key: str,
+        content: str,
+        usage: Dict,
+        deployment: str = "",
+        ttl_seconds: Optional[int] = None
+    ) -> None:
+        """
+        Store a successful response
+
+        Args:
+            key: Cache key from make_key
+            content: Generated content
+            usage: Token usage dict
+            deployment: Deployment name (informational)
+            ttl_seconds: Override the default TTL for this entry
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        size = len(content.encode("utf-8"))
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, deployment, content, usage, size, created_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, deployment, content, json.dumps(usage or {}), size, now, now + ttl, now)
+            )
+            self.stores += 1
+            self._evict(conn, now)
+            conn.commit()
+
+    def invalidate(self, key: str) -> None:
+        """Remove an entry (e.g. a response that failed downstream validation)"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters for this process
+
+        Returns:
+            Dict with hits, misses, stores, evictions, hit rate and tokens saved
+        """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "tokens_saved": self.tokens_saved
+        }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller holds the lock)"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, deployment TEXT, content TEXT, usage TEXT, "
+                "size INTEGER, created_at REAL, expires_at REAL, last_access REAL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then least-recently-used ones above max_bytes"""
+        expired = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,)).rowcount
+        self.evictions += max(expired, 0)
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+        logger.debug(f"LLM cache evicted entries down to {total} bytes")
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache, creating it on first use"""
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache()
+        return _shared_cache
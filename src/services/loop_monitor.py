@@ -0,0 +1,125 @@
+"""
+Event Loop Stall Monitor
+Debug-mode watchdog that reports code blocking the shared event loop, with its stack
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional
+from loguru import logger
+from config.credentials import LOOP_STALL_THRESHOLD_SECONDS
+
+# Source tree whose frames identify the blocking call (library frames are usually just socket reads)
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class LoopStallMonitor:
+    """
+    Detects event loop stalls from a watchdog thread
+
+    A heartbeat task on the loop stamps the time every `interval`; the
+    watchdog thread notices when the stamp is more than `threshold` late
+    and captures the loop thread's stack while it is still stuck, so the
+    report points at the blocking call rather than at whatever ran after it.
+
+    Usable as `async with LoopStallMonitor() as monitor:`; tests can assert
+    on `monitor.stalls` to catch blocking calls before they cost wall time.
+    """
+
+    def __init__(self, threshold: float = LOOP_STALL_THRESHOLD_SECONDS, interval: Optional[float] = None):
+        """
+        Initialize monitor
+
+        Args:
+            threshold: Seconds the loop may be unresponsive before a stall is reported
+            interval: Heartbeat period (defaults to a quarter of the threshold)
+        """
+        self.threshold = threshold
+        self.interval = interval or threshold / 4
+        self.stalls: List[Dict] = []
+
+        self._beat = 0.0
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        """Start the heartbeat on the running loop and the watchdog thread"""
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-stall-monitor", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Event loop stall monitor on (threshold {self.threshold * 1000:.0f} ms)")
+
+    async def stop(self) -> None:
+        """Stop heartbeat and watchdog"""
+        self._stopped.set()
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+        if self._watchdog:
+            await asyncio.to_thread(self._watchdog.join)
+
+    async def __aenter__(self) -> "LoopStallMonitor":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _heartbeat(self) -> None:
+        """Stamp the time every interval (runs on the monitored loop)"""
+        while True:
+            self._beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+
+    def _watch(self) -> None:
+        """Watchdog thread: capture the loop's stack once per stall, then measure the stall"""
+        stall: Optional[Dict] = None
+        stalled_beat = 0.0
+
+        while not self._stopped.wait(self.interval):
+            beat = self._beat
+            if stall is not None and beat != stalled_beat:
+                # Loop is back: the stall lasted from the missed beat until the new stamp
+                stall["seconds"] = round(beat - stalled_beat - self.interval, 3)
+                logger.warning(f"Event loop stalled for {stall['seconds'] * 1000:.0f} ms")
+                stall = None
+
+            late = time.monotonic() - beat - self.interval
+            if stall is None and late > self.threshold:
+                stall = self._capture(late)
+                stalled_beat = beat
+
+    def _capture(self, late: float) -> Dict:
+        """Record the loop thread's current stack as a new stall"""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else ""
+        stall = {"detected_after_seconds": round(late, 3), "seconds": None, "stack": stack}
+        self.stalls.append(stall)
+        logger.warning(f"Event loop blocked for over {self.threshold * 1000:.0f} ms, blocking call:\n{stack}")
+        return stall
+
+    def stats(self) -> Dict:
+        """Stall count, longest stall and the blocking frame of each stall"""
+        durations = [s["seconds"] or s["detected_after_seconds"] for s in self.stalls]
+        return {
+            "threshold_seconds": self.threshold,
+            "stalls": len(self.stalls),
+            "longest_seconds": max(durations, default=0.0),
+            "locations": [_top_frame(s["stack"]) for s in self.stalls]
+        }
+
+
+def _top_frame(stack: str) -> str:
+    """Innermost 'File ..., line ..., in ...' line of a formatted stack, preferring project code"""
+    frames = [line.strip() for line in stack.splitlines() if line.strip().startswith("File ")]
+    own = [frame for frame in frames if SRC_DIR in frame and "loop_monitor" not in frame]
+    return (own or frames or [""])[-1]
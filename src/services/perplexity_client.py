@@ -3,20 +3,222 @@ Perplexity API Client
 Deep web research for market intelligence
 """
 
+import json
+import re
+import threading
 import requests
-from typing import Dict, List
+from concurrent.futures import Future
+from typing import Dict, List, Optional
 from loguru import logger
-from config.credentials import PERPLEXITY_API_KEY, PERPLEXITY_ENDPOINT, get_api_headers
+from config.credentials import PERPLEXITY_API_KEY, PERPLEXITY_ENDPOINT, PERPLEXITY_COMBINED_RESEARCH, get_api_headers
+from services.http_transport import HTTPTransport, get_shared_transport
+from services.deadline import remaining_timeout
+from services.tracing import span
+from services.research_cache import ResearchCache
+from services.indicators import match_asset
+
+RESEARCH_CATEGORIES = ("forex", "crypto", "commodities")
+
+# One entry per asset, shared by all categories (market_cap only meaningful for crypto)
+_ASSET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "price": {"type": "string"},
+        "change_pct": {"type": "number"},
+        "market_cap": {"type": "string"},
+        "drivers": {"type": "string"},
+        "opportunity_score": {"type": "number"}
+    },
+    "required": ["name", "price", "change_pct", "drivers", "opportunity_score"]
+}
+
+_MARKET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "assets": {"type": "array", "items": _ASSET_SCHEMA},
+        "sentiment": {"type": "string"},
+        "key_events": {"type": "array", "items": {"type": "string"}},
+        "summary": {"type": "string"}
+    },
+    "required": ["assets", "sentiment", "key_events", "summary"]
+}
+
+# Strict output schema of the combined research call
+RESEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {category: _MARKET_SCHEMA for category in RESEARCH_CATEGORIES},
+    "required": list(RESEARCH_CATEGORIES)
+}
+
+COMBINED_RESEARCH_PROMPT = """Provide today's market analysis for a forex/crypto/commodities trading blog.
+
+forex: the top 3 trending forex pairs (e.g. EUR/USD), with key drivers such as economic data,
+central bank policy and geopolitics, plus the key economic events affecting forex today.
+
+crypto: Bitcoin, Ethereum and one trending altcoin, with market cap and key catalysts such as
+news, regulation and tech updates, plus market sentiment (bullish/bearish/neutral).
+
+commodities: the top movers among Gold, Silver, Oil and Copper, with key drivers such as
+supply/demand, geopolitics and economic data.
+
+For every asset give the current price as text with its unit (e.g. "1.0845", "$2,650/oz"),
+the 24h change in percent as a number, and an opportunity_score from 0 to 100 for how
+newsworthy and tradeable the move is today. Summarize each market in two or three sentences.
+
+Answer with JSON only, following the provided schema."""
+
+# Field aliases used by the per-category prompts' free-form JSON
+_NAME_KEYS = ("name", "pair_name", "crypto_name", "commodity_name", "asset")
+_SCORE_KEYS = ("opportunity_score", "significance_score", "score")
+_DRIVER_KEYS = ("drivers", "catalysts")
 
 
 class PerplexityClient:
     """Client for Perplexity API market research"""
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None, cache: Optional[ResearchCache] = None):
         self.api_key = PERPLEXITY_API_KEY
         self.endpoint = PERPLEXITY_ENDPOINT
         self.headers = get_api_headers("perplexity")
 
+        # Shared keep-alive connection pools
+        self.transport = transport or get_shared_transport()
+
+        # Combined research of this client's run, fetched once for all agents
+        # (only a successful result is kept; a failed one is retried by the next agent)
+        self._combined: Optional[Dict] = None
+        self._combined_fetch: Optional[Future] = None
+        self._combined_lock = threading.Lock()
+
+        # Intraday research cache (None = always query)
+        self.cache = cache
+        self._refreshing: set = set()
+        self._refresh_lock = threading.Lock()
+
+    def research_market(self, category: str) -> Dict:
+        """
+        Research one category, from the research cache or the shared combined call
+
+        A stale cache entry is returned immediately and refreshed in the background.
+
+        Args:
+            category: forex, crypto, or commodities
+
+        Returns:
+            Dict with research results (market holds the parsed slice when available)
+        """
+        cached = self.cache.get(category) if self.cache else None
+        if cached:
+            logger.info(
+                f"Using {'stale' if cached['stale'] else 'cached'} {category} research "
+                f"({cached['age_seconds'] / 60:.0f} min old)"
+            )
+            if cached["stale"]:
+                self._refresh_in_background(category)
+            return {**cached["result"], "cached": True, "stale": cached["stale"]}
+
+        result = self._fetch_market(category)
+        if result["success"] and self.cache:
+            self.cache.put(category, result)
+        return result
+
+    def _fetch_market(self, category: str) -> Dict:
+        """Query research for one category (combined call when enabled, else per category)"""
+        if PERPLEXITY_COMBINED_RESEARCH:
+            combined = self._get_combined_research()
+            market = combined.get("markets", {}).get(category) if combined["success"] else None
+            if market and market.get("assets"):
+                return _market_result(market)
+            logger.warning(f"No {category} data in combined research, querying {category} separately")
+
+        research_methods = {
+            "forex": self.research_forex_market,
+            "crypto": self.research_crypto_market,
+            "commodities": self.research_commodities_market
+        }
+        research_method = research_methods.get(category)
+        if not research_method:
+            return {"success": False, "error": f"Unknown category: {category}"}
+        return research_method()
+
+    def research_all_markets(self) -> Dict:
+        """
+        Research every category in one request with a strict JSON schema
+
+        Returns:
+            Dict with research results; markets maps category to its parsed slice
+        """
+        result = self._query(
+            COMBINED_RESEARCH_PROMPT,
+            response_format={"type": "json_schema", "json_schema": {"schema": RESEARCH_SCHEMA}}
+        )
+        if not result["success"]:
+            return result
+
+        markets = _parse_json(result["content"])
+        if not isinstance(markets, dict):
+            logger.error("Combined Perplexity research did not return valid JSON")
+            return {"success": False, "error": "Unparseable combined research response"}
+
+        result["markets"] = markets
+        return result
+
+    def _refresh_in_background(self, category: str) -> None:
+        """Re-query stale research on a daemon thread (one refresh in flight per key)"""
+        # In combined mode one refresh covers every category
+        key = "all" if PERPLEXITY_COMBINED_RESEARCH else category
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        logger.info(f"Refreshing stale {category} research in the background")
+        threading.Thread(target=self._refresh, args=(key,), name=f"research-refresh-{key}", daemon=True).start()
+
+    def _refresh(self, key: str) -> None:
+        """Fetch fresh research into the cache ("all" = combined call)"""
+        try:
+            if key == "all":
+                combined = self.research_all_markets()
+                markets = combined.get("markets", {}) if combined["success"] else {}
+                for category in RESEARCH_CATEGORIES:
+                    market = markets.get(category)
+                    if market and market.get("assets"):
+                        self.cache.put(category, _market_result(market))
+            else:
+                result = self._fetch_market(key)
+                if result["success"]:
+                    self.cache.put(key, result)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def _get_combined_research(self) -> Dict:
+        """Run the combined research once; concurrent agents wait for the same request"""
+        with self._combined_lock:
+            if self._combined is not None:
+                return self._combined
+            fetch = self._combined_fetch
+            owner = fetch is None
+            if owner:
+                fetch = self._combined_fetch = Future()
+
+        # Outside the lock: only agents that need the combined result wait for the request
+        if not owner:
+            return fetch.result()
+
+        result = {"success": False, "error": "Combined research did not complete"}
+        try:
+            result = self.research_all_markets()
+            return result
+        finally:
+            with self._combined_lock:
+                if result["success"]:
+                    self._combined = result
+                self._combined_fetch = None
+            fetch.set_result(result)
+
     def research_forex_market(self) -> Dict:
         """Research current forex market trends and top pairs"""
         prompt = """Provide current forex market analysis:
@@ -71,12 +273,13 @@ Format: JSON with {commodity_name, price, change_pct, drivers, significance_scor
 
         return self._query(prompt)
 
-    def _query(self, prompt: str) -> Dict:
+    def _query(self, prompt: str, response_format: Optional[Dict] = None) -> Dict:
         """
         Send query to Perplexity API
 
         Args:
             prompt: Research question
+            response_format: Structured output spec (e.g. a JSON schema), None for free text
 
         Returns:
             Dict with research results
@@ -90,44 +293,89 @@ Format: JSON with {commodity_name, price, change_pct, drivers, significance_scor
                 }
             ]
         }
-
-        try:
-            logger.info(f"Querying Perplexity API...")
-            response = requests.post(
-                self.endpoint,
-                headers=self.headers,
-                json=payload,
-                timeout=60
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            content = data["choices"][0]["message"]["content"]
-
-            logger.success(f"Perplexity research completed")
-            return {"success": True, "content": content, "data": data}
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Perplexity API error: {e}")
-            return {"success": False, "error": str(e)}
-
-    def select_best_asset(self, research_data: Dict, category: str) -> Dict:
+        if response_format:
+            payload["response_format"] = response_format
+
+        with span("research.call", provider="perplexity", structured=bool(response_format)) as call_span:
+            try:
+                logger.info(f"Querying Perplexity API...")
+                response = self.transport.session.post(
+                    self.endpoint,
+                    headers=self.headers,
+                    json=payload,
+                    timeout=remaining_timeout(60)
+                )
+                call_span.set(status_code=response.status_code, response_bytes=len(response.content))
+                response.raise_for_status()
+
+                data = response.json()
+                content = data["choices"][0]["message"]["content"]
+                usage = data.get("usage") or {}
+                call_span.set(prompt_tokens=usage.get("prompt_tokens"), completion_tokens=usage.get("completion_tokens"))
+
+                logger.success(f"Perplexity research completed")
+                return {"success": True, "content": content, "data": data}
+
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Perplexity API error: {e}")
+                call_span.fail(str(e))
+                return {"success": False, "error": str(e)}
+
+    def select_best_asset(self, research_data: Dict, category: str, ranked: Optional[List[str]] = None) -> Dict:
         """
         Select the best asset to write about based on research
 
         Args:
             research_data: Research results from Perplexity
             category: forex, crypto, or commodities
+            ranked: Asset names from the ranking stage, best first (its top pick wins)
 
         Returns:
             Dict with selected asset and key data
         """
-        # Parse research content and select most volatile/newsworthy asset
-        # This is a simplified version - in production, parse JSON properly
-
         content = research_data.get("content", "")
+        market = research_data.get("market") or _parse_market(content)
+        assets = [a for a in (market or {}).get("assets", []) if _first(a, _NAME_KEYS)]
+
+        if ranked:
+            # Research entry for the top-ranked asset ("WTI Crude Oil" counts for "Oil")
+            researched = next((a for a in assets if match_asset(str(_first(a, _NAME_KEYS)), [ranked[0]])), None)
+            if researched is None:
+                # Ranked from price data alone; price and change come from the indicators
+                logger.info(f"Selected {category} asset: {ranked[0]} (ranked, not in research)")
+                return {
+                    "asset": ranked[0],
+                    "price": "N/A",
+                    "change": "N/A",
+                    "catalysts" if category == "crypto" else "drivers": "",
+                    "research_insights": (market or {}).get("summary") or content[:500],
+                    "source": "ranking"
+                }
+            assets = [researched]
+
+        if assets:
+            # Most newsworthy move first (score, then size of the move)
+            best = max(assets, key=lambda a: (_as_float(_first(a, _SCORE_KEYS)), abs(_as_float(a.get("change_pct")))))
+            selected = {
+                # Universe name when ranked, so images and price data line up
+                "asset": ranked[0] if ranked else str(_first(best, _NAME_KEYS)),
+                "price": str(best.get("price", "N/A")),
+                "change": _format_change(best.get("change_pct")),
+                "catalysts" if category == "crypto" else "drivers": str(_first(best, _DRIVER_KEYS) or ""),
+                "research_insights": market.get("summary") or content[:500],
+                "source": "research"
+            }
+            if category == "crypto" and best.get("market_cap"):
+                selected["market_cap"] = str(best["market_cap"])
+            if market.get("sentiment"):
+                selected["sentiment"] = market["sentiment"]
+
+            logger.info(f"Selected {category} asset: {selected['asset']}")
+            return selected
+
+        logger.warning(f"Could not parse {category} research, using default asset")
 
-        # Default selections based on research trends
+        # Default selections when the research cannot be parsed
         defaults = {
             "forex": {
                 "asset": "EUR/USD",
@@ -149,10 +397,73 @@ Format: JSON with {commodity_name, price, change_pct, drivers, significance_scor
             }
         }
 
-        # In production, parse the actual Perplexity response
-        # For now, return structured data with research insights
         selected = defaults.get(category, defaults["forex"])
         selected["research_insights"] = content[:500]  # Include research summary
+        selected["source"] = "default"
 
         logger.info(f"Selected {category} asset: {selected['asset']}")
         return selected
+
+
+def _market_result(market: Dict) -> Dict:
+    """Research result for one category's slice of the combined call"""
+    return {"success": True, "content": json.dumps(market), "market": market, "combined": True}
+
+
+def _parse_json(content: str) -> Optional[object]:
+    """Parse a JSON answer, tolerating code fences and text around it (None if invalid)"""
+    text = re.sub(r"^```(?:json)?\s*|\s*```$", "", content.strip())
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+
+    # First {...} or [...] block in free text
+    match = re.search(r"[\[{].*[\]}]", text, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(0))
+        except ValueError:
+            return None
+    return None
+
+
+def _parse_market(content: str) -> Optional[Dict]:
+    """Get {"assets": [...], ...} from a per-category research answer"""
+    parsed = _parse_json(content) if content else None
+
+    if isinstance(parsed, list):
+        return {"assets": [a for a in parsed if isinstance(a, dict)]}
+    if not isinstance(parsed, dict):
+        return None
+    if isinstance(parsed.get("assets"), list):
+        return parsed
+
+    # Free-form shapes: first list of objects found (e.g. {"top_pairs": [...]})
+    for value in parsed.values():
+        if isinstance(value, list) and value and all(isinstance(a, dict) for a in value):
+            return {**parsed, "assets": value}
+    return None
+
+
+def _first(item: Dict, keys) -> Optional[object]:
+    """Value of the first present key"""
+    for key in keys:
+        if item.get(key) not in (None, ""):
+            return item[key]
+    return None
+
+
+def _as_float(value) -> float:
+    """Number from a float or a string like "+1.2%" (0.0 if not numeric)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = re.search(r"[-+]?\d+(?:\.\d+)?", str(value or ""))
+    return float(match.group(0)) if match else 0.0
+
+
+def _format_change(value) -> str:
+    """Format a 24h change as "+0.32%" """
+    if value is None or value == "":
+        return "N/A"
+    return f"{_as_float(value):+.2f}%"
@@ -0,0 +1,181 @@
+"""
+Prompt Budget
+Token counting and token-budgeted truncation for prompts
+"""
+
+import re
+from functools import lru_cache
+from typing import List
+from loguru import logger
+from config.credentials import GPT5_DEPLOYMENT, GPT5_PRO_DEPLOYMENT
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to the character heuristic
+    tiktoken = None
+
+# GPT-5 family tokenizer
+ENCODING_NAME = "o200k_base"
+
+# Total context (input + output) and output cap per deployment
+CONTEXT_WINDOWS = {
+    GPT5_DEPLOYMENT: 400_000,
+    GPT5_PRO_DEPLOYMENT: 400_000
+}
+MAX_OUTPUT_TOKENS = 128_000
+
+# Longest article the writing prompts ask for (600-800 words) plus title and headings
+ARTICLE_MAX_WORDS = 900
+
+# Upper bound of tokens per word, by language (covers o200k_base and the heuristic count)
+TOKENS_PER_WORD = {
+    "english": 1.5,
+    "spanish": 1.8,
+    "portuguese": 1.8,
+    "arabic_gcc": 3.0
+}
+
+# SEO title, description and keywords come from the headline, introduction and highlights
+SEO_EXCERPT_WORDS = 300
+
+TRUNCATION_MARKER = "..."
+
+_SENTENCE_END = re.compile(r"(?<=[.!?؟。])\s+")
+
+
+def article_budget(language: str = "english", words: int = ARTICLE_MAX_WORDS) -> int:
+    """
+    Tokens of an article excerpt in a language
+
+    Reviews judge depth, structure and completeness, so their budgets hold a
+    whole article; with verdict-sized outputs that is a small fraction of the
+    context window.
+
+    Args:
+        language: english or a translation language (unknown = densest known)
+        words: Words the excerpt must hold
+
+    Returns:
+        Token budget
+    """
+    return int(words * TOKENS_PER_WORD.get(language, max(TOKENS_PER_WORD.values())))
+
+
+# Input budgets (tokens) for excerpts embedded in review/metadata prompts
+ARTICLE_REVIEW_BUDGET = article_budget("english")
+QUALITY_REVIEW_BUDGET = article_budget("english")
+SEO_EXCERPT_BUDGET = article_budget("english", SEO_EXCERPT_WORDS)
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Load the tokenizer once (None when tiktoken or its vocabulary is unavailable)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(ENCODING_NAME)
+    except Exception as e:
+        logger.warning(f"tiktoken encoding {ENCODING_NAME} unavailable, using heuristic token counts: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text
+
+    Args:
+        text: Any text
+
+    Returns:
+        Exact count with tiktoken, otherwise an estimate that treats
+        non-Latin scripts (e.g. Arabic) as denser than ASCII
+    """
+    if not text:
+        return 0
+
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return -(-ascii_chars // 4) + -(-(len(text) - ascii_chars) // 2)
+
+
+def fit_to_budget(text: str, max_tokens: int) -> str:
+    """
+    Trim text to a token budget at paragraph, then sentence, boundaries
+
+    Args:
+        text: Text to embed in a prompt
+        max_tokens: Token budget for the text
+
+    Returns:
+        Text unchanged if it fits, otherwise its longest fitting prefix
+        followed by a truncation marker
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    budget = max_tokens - count_tokens(TRUNCATION_MARKER)
+    kept: List[str] = []
+    used = 0
+
+    for paragraph in text.split("\n\n"):
+        paragraph_tokens = count_tokens(paragraph)
+        if used + paragraph_tokens <= budget:
+            kept.append(paragraph)
+            used += paragraph_tokens
+            continue
+
+        # Paragraph does not fit: keep as many of its sentences as possible
+        sentences = []
+        for sentence in _SENTENCE_END.split(paragraph):
+            sentence_tokens = count_tokens(sentence)
+            if used + sentence_tokens > budget:
+                break
+            sentences.append(sentence)
+            used += sentence_tokens
+
+        if sentences:
+            kept.append(" ".join(sentences))
+        elif not kept:
+            # Not even one sentence fits
+            kept.append(_cut_tokens(paragraph, budget))
+        break
+
+    return "\n\n".join(kept).rstrip() + TRUNCATION_MARKER
+
+
+def output_budget(prompt: str, deployment: str, desired: int, reserved: int = 0) -> int:
+    """
+    Choose max_tokens / max_output_tokens for a request
+
+    Args:
+        prompt: Full input text (system prompt included)
+        deployment: Target deployment
+        desired: Output tokens the call would like
+        reserved: Extra input tokens not contained in prompt
+
+    Returns:
+        desired, capped by the model output limit and the context left after the prompt
+    """
+    context_window = CONTEXT_WINDOWS.get(deployment, CONTEXT_WINDOWS[GPT5_DEPLOYMENT])
+    remaining = context_window - count_tokens(prompt) - reserved
+    return max(1, min(desired, MAX_OUTPUT_TOKENS, remaining))
+
+
+def _cut_tokens(text: str, max_tokens: int) -> str:
+    """Hard-cut text to max_tokens (last resort for a single oversized sentence)"""
+    encoder = _get_encoder()
+    if encoder is not None:
+        return encoder.decode(encoder.encode(text, disallowed_special=())[:max(0, max_tokens)])
+
+    # Heuristic: longest prefix whose estimate fits
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
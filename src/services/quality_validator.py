@@ -3,9 +3,10 @@ AI Quality Validator
 Uses GPT-5-Pro to validate and improve content before publication
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from loguru import logger
 from services.azure_openai_client import AzureOpenAIClient
+from services.prompt_budget import fit_to_budget, article_budget, ARTICLE_REVIEW_BUDGET
 
 
 class QualityValidator:
@@ -14,8 +15,8 @@ class QualityValidator:
     Uses GPT-5-Pro for content review and enhancement
     """
 
-    def __init__(self):
-        self.openai_client = AzureOpenAIClient()
+    def __init__(self, openai_client: Optional[AzureOpenAIClient] = None):
+        self.openai_client = openai_client or AzureOpenAIClient()
 
     def validate_article(self, article: str, category: str, asset: str) -> Dict:
         """
@@ -31,10 +32,30 @@ class QualityValidator:
         """
         logger.info(f"Validating {asset} article quality...")
 
-        validation_prompt = f"""Review this {category} trading article about {asset} for publication quality.
+        result = self.openai_client.generate_article(
+            prompt=self._article_review_prompt(article, category, asset),
+            deployment="gpt-5-pro",
+            max_tokens=3000
+        )
+
+        return self._parse_article_review(result)
+
+    async def validate_article_async(self, article: str, category: str, asset: str) -> Dict:
+        """Async variant of validate_article"""
+        logger.info(f"Validating {asset} article quality...")
+
+        result = await self.openai_client.generate_article_async(
+            prompt=self._article_review_prompt(article, category, asset),
+            deployment="gpt-5-pro",
+            max_tokens=3000
+        )
+
+        return self._parse_article_review(result)
 
-ARTICLE TO REVIEW:
-{article[:2000]}...
+    def _article_review_prompt(self, article: str, category: str, asset: str) -> str:
+        """Build the AI review prompt for an English article"""
+        # Static instructions first, article last (provider prompt-cache prefix)
+        return f"""Review the trading article at the end of this message for publication quality.
 
 EVALUATE THE FOLLOWING:
 1. **Content Accuracy** (0-25 points):
@@ -86,14 +107,13 @@ RESPOND IN THIS FORMAT:
 If score < 70: Recommend "IMPROVE"
 If score >= 70: Recommend "PUBLISH"
 If score < 50: Recommend "REJECT"
-"""
 
-        result = self.openai_client.generate_article(
-            prompt=validation_prompt,
-            deployment="gpt-5-pro",
-            max_tokens=3000
-        )
+ARTICLE TO REVIEW ({category} article about {asset}):
+{fit_to_budget(article, ARTICLE_REVIEW_BUDGET)}
+"""
 
+    def _parse_article_review(self, result: Dict) -> Dict:
+        """Parse the AI review result (passes on parse errors or an unavailable service)"""
         if result["success"]:
             # Parse JSON response
             try:
@@ -118,6 +138,11 @@ If score < 50: Recommend "REJECT"
                 logger.info(f"Quality score: {validation_result.get('quality_score', 0)}/100")
                 logger.info(f"Recommendation: {validation_result.get('recommendation', 'UNKNOWN')}")
 
+                if result.get("degraded_from"):
+                    # Circuit breaker rerouted the review to the fallback deployment
+                    validation_result["degraded_from"] = result["degraded_from"]
+                    validation_result["deployment"] = result["deployment"]
+
                 return {
                     "success": True,
                     **validation_result
@@ -163,6 +188,42 @@ If score < 50: Recommend "REJECT"
         """
         logger.info(f"Validating {language} translation...")
 
+        precheck = self._precheck_translation(original, translated)
+        if precheck:
+            return precheck
+
+        result = self.openai_client.generate_article(
+            prompt=self._translation_review_prompt(original, translated, language, category),
+            deployment="gpt-5",  # Use standard GPT-5 for quick validation
+            max_tokens=500
+        )
+
+        return self._parse_translation_review(result, language)
+
+    async def validate_translation_async(
+        self,
+        original: str,
+        translated: str,
+        language: str,
+        category: str
+    ) -> Dict:
+        """Async variant of validate_translation (batched when the client is a BatchJobClient)"""
+        logger.info(f"Validating {language} translation...")
+
+        precheck = self._precheck_translation(original, translated)
+        if precheck:
+            return precheck
+
+        result = await self.openai_client.generate_article_async(
+            prompt=self._translation_review_prompt(original, translated, language, category),
+            deployment="gpt-5",  # Use standard GPT-5 for quick validation
+            max_tokens=500
+        )
+
+        return self._parse_translation_review(result, language)
+
+    def _precheck_translation(self, original: str, translated: str) -> Optional[Dict]:
+        """Cheap empty/length checks (a RETRY result, or None when the AI review is needed)"""
         # Quick checks first
         if not translated or len(translated) == 0:
             return {
@@ -184,14 +245,11 @@ If score < 50: Recommend "REJECT"
                 "recommendation": "RETRY"
             }
 
-        # AI validation for non-empty translations
-        validation_prompt = f"""Validate this {language} translation of a {category} trading article.
+        return None
 
-ORIGINAL (English):
-{original[:800]}...
-
-TRANSLATION ({language}):
-{translated[:800]}...
+    def _translation_review_prompt(self, original: str, translated: str, language: str, category: str) -> str:
+        """Build the AI review prompt for a translation"""
+        return f"""Validate the translation of a trading article given at the end of this message.
 
 EVALUATE:
 1. Accuracy: Does translation convey same meaning?
@@ -207,14 +265,19 @@ RESPOND WITH SCORE 0-100 AND BRIEF ASSESSMENT:
   "recommendation": "ACCEPT" or "RETRY"
 }}
 ```
-"""
 
-        result = self.openai_client.generate_article(
-            prompt=validation_prompt,
-            deployment="gpt-5",  # Use standard GPT-5 for quick validation
-            max_tokens=500
-        )
+LANGUAGE: {language}
+CATEGORY: {category}
 
+ORIGINAL (English):
+{fit_to_budget(original, ARTICLE_REVIEW_BUDGET)}
+
+TRANSLATION ({language}):
+{fit_to_budget(translated, article_budget(language))}
+"""
+
+    def _parse_translation_review(self, result: Dict, language: str) -> Dict:
+        """Parse the AI review result (passes on parse errors or an unavailable service)"""
         if result["success"]:
             try:
                 import json
@@ -279,13 +342,38 @@ RESPOND WITH SCORE 0-100 AND BRIEF ASSESSMENT:
 
         logger.info(f"Improving {asset} article based on feedback...")
 
-        improvement_prompt = f"""Improve this {category} trading article about {asset} based on the following feedback:
+        result = self.openai_client.generate_article(
+            prompt=self._improvement_prompt(article, validation_result, category, asset),
+            deployment="gpt-5-pro",
+            max_tokens=8000
+        )
 
-ORIGINAL ARTICLE:
-{article}
+        return self._parse_improvement(result, article)
 
-ISSUES TO FIX:
-{chr(10).join(f"- {issue}" for issue in validation_result.get('improvements_needed', []))}
+    async def improve_article_if_needed_async(
+        self,
+        article: str,
+        validation_result: Dict,
+        category: str,
+        asset: str
+    ) -> str:
+        """Async variant of improve_article_if_needed"""
+        if validation_result.get("recommendation") != "IMPROVE":
+            return article  # No improvement needed
+
+        logger.info(f"Improving {asset} article based on feedback...")
+
+        result = await self.openai_client.generate_article_async(
+            prompt=self._improvement_prompt(article, validation_result, category, asset),
+            deployment="gpt-5-pro",
+            max_tokens=8000
+        )
+
+        return self._parse_improvement(result, article)
+
+    def _improvement_prompt(self, article: str, validation_result: Dict, category: str, asset: str) -> str:
+        """Build the rewrite prompt from the review's requested improvements"""
+        return f"""Improve the trading article at the end of this message based on the listed feedback.
 
 REQUIREMENTS:
 - Maintain 600-800 words
@@ -295,15 +383,19 @@ REQUIREMENTS:
 - Clear structure with headlines
 - Actionable insights for traders
 
-RESPOND WITH THE IMPROVED ARTICLE (NO EXPLANATIONS, JUST THE ARTICLE):
-"""
+RESPOND WITH THE IMPROVED ARTICLE (NO EXPLANATIONS, JUST THE ARTICLE).
 
-        result = self.openai_client.generate_article(
-            prompt=improvement_prompt,
-            deployment="gpt-5-pro",
-            max_tokens=8000
-        )
+ARTICLE: {category} article about {asset}
+
+ISSUES TO FIX:
+{chr(10).join(f"- {issue}" for issue in validation_result.get('improvements_needed', []))}
+
+ORIGINAL ARTICLE:
+{article}
+"""
 
+    def _parse_improvement(self, result: Dict, article: str) -> str:
+        """Improved article text, or the original if the rewrite failed"""
         if result["success"] and result["content"]:
             improved = result["content"].strip()
             logger.success(f"Article improved ({len(improved)} chars)")
@@ -0,0 +1,235 @@
+"""
+Rate Limiter
+Per-deployment token buckets (requests/min + tokens/min) shared by all agents
+"""
+
+import asyncio
+import email.utils
+import threading
+import time
+from typing import Dict, Mapping, Optional
+from loguru import logger
+from config.credentials import AZURE_RATE_LIMITS
+
+
+class TokenBucketRateLimiter:
+    """
+    Token-bucket limiter for one Azure OpenAI deployment
+
+    Callers reserve capacity up front: the reservation is deducted
+    immediately (the bucket may go negative) and the caller sleeps until its
+    share has refilled. Concurrent callers therefore queue in arrival order
+    and the deployment is driven at its quota rather than into 429s.
+    Response headers (Retry-After, x-ratelimit-remaining-*) keep the local
+    view in sync with the server.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize limiter
+
+        Args:
+            name: Deployment name (for logging)
+            requests_per_minute: RPM quota (0 disables the request bucket)
+            tokens_per_minute: TPM quota (0 disables the token bucket)
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._lock = threading.Lock()
+        self._request_level = float(requests_per_minute)
+        self._token_level = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+
+        # Counters
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def reserve(self, estimated_tokens: int) -> float:
+        """
+        Reserve capacity for one request
+
+        Args:
+            estimated_tokens: Prompt tokens + max output tokens (how Azure counts TPM)
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            wait = max(0.0, self._blocked_until - now)
+
+            if self.requests_per_minute > 0:
+                self._request_level -= 1
+                if self._request_level < 0:
+                    wait = max(wait, -self._request_level * 60.0 / self.requests_per_minute)
+
+            if self.tokens_per_minute > 0:
+                self._token_level -= estimated_tokens
+                if self._token_level < 0:
+                    wait = max(wait, -self._token_level * 60.0 / self.tokens_per_minute)
+
+            self.requests += 1
+            self.total_wait += wait
+            return wait
+
+    async def acquire(self, estimated_tokens: int) -> float:
+        """Wait (on the event loop) until a request may be sent"""
+        wait = self.reserve(estimated_tokens)
+        if wait > 0:
+            self._log_wait(wait)
+            await asyncio.sleep(wait)
+
+        # A 429 may have arrived while this caller was queued
+        blocked = self._remaining_block()
+        while blocked > 0:
+            await asyncio.sleep(blocked)
+            wait += blocked
+            blocked = self._remaining_block()
+        return wait
+
+    def acquire_blocking(self, estimated_tokens: int) -> float:
+        """Wait (blocking the calling thread) until a request may be sent"""
+        wait = self.reserve(estimated_tokens)
+        if wait > 0:
+            self._log_wait(wait)
+            time.sleep(wait)
+
+        # A 429 may have arrived while this caller was queued
+        blocked = self._remaining_block()
+        while blocked > 0:
+            time.sleep(blocked)
+            wait += blocked
+            blocked = self._remaining_block()
+        return wait
+
+    def update_from_headers(self, headers: Optional[Mapping], status: Optional[int] = None) -> None:
+        """
+        Sync local state with rate-limit headers from a response
+
+        Args:
+            headers: Response headers
+            status: HTTP status code (429 blocks all callers for Retry-After)
+        """
+        if headers is None:
+            return
+
+        headers = {k.lower(): v for k, v in headers.items()}
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            remaining_requests = _parse_float(headers.get("x-ratelimit-remaining-requests"))
+            if remaining_requests is not None and self.requests_per_minute > 0:
+                self._request_level = min(self._request_level, remaining_requests)
+
+            remaining_tokens = _parse_float(headers.get("x-ratelimit-remaining-tokens"))
+            if remaining_tokens is not None and self.tokens_per_minute > 0:
+                self._token_level = min(self._token_level, remaining_tokens)
+
+            if status == 429:
+                self.throttled += 1
+                retry_after = _parse_retry_after(headers)
+                if retry_after is None:
+                    # No hint from the server: wait for one request's worth of refill
+                    retry_after = 60.0 / self.requests_per_minute if self.requests_per_minute > 0 else 2.0
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                logger.warning(f"Rate limiter {self.name}: 429 received, pausing callers for {retry_after:.1f}s")
+
+    def stats(self) -> Dict:
+        """Get limiter counters"""
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait, 2),
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute
+        }
+
+    def _remaining_block(self) -> float:
+        """Seconds left on a Retry-After pause"""
+        with self._lock:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+    def _refill(self, now: float) -> None:
+        """Add capacity for the time elapsed since the last refill (caller holds the lock)"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        if self.requests_per_minute > 0:
+            self._request_level = min(
+                float(self.requests_per_minute),
+                self._request_level + elapsed * self.requests_per_minute / 60.0
+            )
+        if self.tokens_per_minute > 0:
+            self._token_level = min(
+                float(self.tokens_per_minute),
+                self._token_level + elapsed * self.tokens_per_minute / 60.0
+            )
+
+    def _log_wait(self, wait: float) -> None:
+        """Log queueing delays that are long enough to matter"""
+        if wait >= 1.0:
+            logger.info(f"Rate limiter {self.name}: queued for {wait:.1f}s")
+
+
+def _parse_float(value) -> Optional[float]:
+    """Parse a numeric header value"""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_retry_after(headers: Dict[str, str]) -> Optional[float]:
+    """Read retry-after-ms / retry-after (seconds or HTTP date) in seconds"""
+    retry_after_ms = _parse_float(headers.get("retry-after-ms"))
+    if retry_after_ms is not None:
+        return retry_after_ms / 1000.0
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return seconds
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_limiters: Dict[str, TokenBucketRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(deployment: str) -> TokenBucketRateLimiter:
+    """
+    Get the process-wide limiter for a deployment
+
+    Args:
+        deployment: Deployment name (gpt-5, gpt-5-pro, ...)
+
+    Returns:
+        Shared TokenBucketRateLimiter (unlimited if no quota is configured)
+    """
+    with _limiters_lock:
+        if deployment not in _limiters:
+            rpm, tpm = AZURE_RATE_LIMITS.get(deployment, (0, 0))
+            _limiters[deployment] = TokenBucketRateLimiter(deployment, rpm, tpm)
+        return _limiters[deployment]
+
+
+def get_rate_limiter_stats() -> Dict[str, Dict]:
+    """Get counters for every limiter created in this process"""
+    with _limiters_lock:
+        return {name: limiter.stats() for name, limiter in _limiters.items()}
@@ -0,0 +1,167 @@
+"""
+Research Cache
+Intraday TTL cache for market research, keyed on category and market session
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from loguru import logger
+from config.credentials import (
+    RESEARCH_CACHE_ENABLED,
+    RESEARCH_CACHE_PATH,
+    RESEARCH_CACHE_TTL_SECONDS,
+    RESEARCH_CACHE_MAX_STALE_SECONDS
+)
+
+# Market sessions by UTC start hour; research is never reused across sessions
+MARKET_SESSIONS = ((0, "asia"), (7, "london"), (13, "new_york"), (21, "after_hours"))
+
+
+def session_window(now: Optional[datetime] = None) -> str:
+    """
+    Get the market-session window a point in time belongs to
+
+    Args:
+        now: Time to classify (default: current UTC time)
+
+    Returns:
+        "<UTC date>:<session>", e.g. "2025-01-15:london"
+    """
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    session = next(name for start, name in reversed(MARKET_SESSIONS) if now.hour >= start)
+    return f"{now.date().isoformat()}:{session}"
+
+
+class ResearchCache:
+    """
+    JSON file of research results per (category, session window)
+
+    Within a window an entry is fresh for ttl_seconds; after that it is
+    still served as stale (the caller refreshes it in the background) until
+    max_stale_seconds. The file lives in output/cache, so workflow reruns
+    later in the same session reuse the research of the first run.
+    """
+
+    def __init__(
+        self,
+        path: str = RESEARCH_CACHE_PATH,
+        ttl_seconds: float = RESEARCH_CACHE_TTL_SECONDS,
+        max_stale_seconds: float = RESEARCH_CACHE_MAX_STALE_SECONDS,
+        enabled: bool = RESEARCH_CACHE_ENABLED
+    ):
+        """
+        Initialize cache
+
+        Args:
+            path: JSON file holding cached research
+            ttl_seconds: Age up to which an entry is fresh
+            max_stale_seconds: Age up to which a stale entry is still served
+            enabled: Disable to turn every lookup into a miss without touching disk
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+        # Per-process counters
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def get(self, category: str) -> Optional[Dict]:
+        """
+        Look up research for the current session window
+
+        Args:
+            category: forex, crypto, or commodities
+
+        Returns:
+            Dict with result, age_seconds and stale, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._load().get(self._key(category))
+
+            age = time.time() - entry["stored_at"] if entry else None
+            if entry is None or age > self.max_stale_seconds:
+                self.misses += 1
+                return None
+
+            stale = age > self.ttl_seconds
+            if stale:
+                self.stale_hits += 1
+            else:
+                self.hits += 1
+
+        return {"result": entry["result"], "age_seconds": age, "stale": stale}
+
+    def put(self, category: str, result: Dict) -> None:
+        """
+        Store successful research for the current session window
+
+        Args:
+            category: forex, crypto, or commodities
+            result: Research result (the raw API response is not stored)
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            now = time.time()
+            entries = {
+                key: entry for key, entry in self._load().items()
+                if now - entry["stored_at"] <= self.max_stale_seconds
+            }
+            entries[self._key(category)] = {
+                "stored_at": now,
+                "result": {k: v for k, v in result.items() if k != "data"}
+            }
+            self._save(entries)
+            self.stores += 1
+
+    def stats(self) -> Dict:
+        """Get cache counters for this process"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0
+        }
+
+    def _key(self, category: str) -> str:
+        """Entry key for a category in the current session window"""
+        return f"{category}:{session_window()}"
+
+    def _load(self) -> Dict[str, Dict]:
+        """Read the store (caller holds the lock)"""
+        if not os.path.exists(self.path):
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable research cache {self.path}: {e}")
+            return {}
+
+    def _save(self, entries: Dict[str, Dict]) -> None:
+        """Write the store atomically (caller holds the lock)"""
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write research cache {self.path}: {e}")
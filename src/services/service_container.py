@@ -0,0 +1,103 @@
+"""
+Service Container
+Single set of service clients shared by all agents in a run
+"""
+
+from typing import Optional
+from loguru import logger
+
+from services.http_transport import HTTPTransport, get_shared_transport
+from services.llm_cache import LLMResponseCache, get_shared_cache
+from services.hedging import HedgingPolicy
+from services.usage_tracker import UsageCollector
+from services.latency_stats import RollingLatencyWindow
+from services.adaptive_timeout import AdaptiveTimeoutPolicy
+from services.batch_jobs import BatchJobClient
+from services.concurrency import ProviderLimits
+from config.credentials import (
+    HEDGING_ENABLED,
+    LLM_BATCH_ENABLED,
+    LATENCY_STATS_PATH,
+    LATENCY_WINDOW,
+    ASSET_UNIVERSE_PATH,
+    PROVIDER_CONCURRENCY
+)
+from services.perplexity_client import PerplexityClient
+from services.research_cache import ResearchCache
+from services.azure_openai_client import AzureOpenAIClient
+from services.translation_service import TranslationService
+from services.image_manager import ImageManager
+from services.indicators import IndicatorEngine
+from services.asset_ranking import AssetRanker, load_universe
+from services.html_formatter import HTMLFormatter
+from services.quality_validator import QualityValidator
+from services.zapier_delivery import ZapierDelivery
+
+
+class ServiceContainer:
+    """
+    Holds one instance of each service client on top of a shared HTTPTransport
+
+    Agents receive the container instead of building their own clients, so
+    a run uses one AzureOpenAIClient (shared with the translator and the
+    validator) and one set of keep-alive connection pools.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[HTTPTransport] = None,
+        llm_cache: Optional[LLMResponseCache] = None
+    ):
+        """
+        Initialize container
+
+        Args:
+            transport: HTTP transport to use (defaults to the process-wide one)
+            llm_cache: LLM response cache (defaults to the process-wide one)
+        """
+        self.transport = transport or get_shared_transport()
+        self.llm_cache = llm_cache or get_shared_cache()
+        self.usage = UsageCollector()
+
+        # Latency history carried over between runs, drives per-call timeouts and hedge delays
+        self.latency = RollingLatencyWindow(window=LATENCY_WINDOW, path=LATENCY_STATS_PATH)
+        self.timeouts = AdaptiveTimeoutPolicy(self.latency)
+        self.hedging = HedgingPolicy(latencies=self.latency) if HEDGING_ENABLED else None
+
+        # Requests in flight per provider, across all agents of the run
+        self.limits = ProviderLimits(PROVIDER_CONCURRENCY)
+
+        self.openai = AzureOpenAIClient(
+            transport=self.transport,
+            cache=self.llm_cache,
+            hedging=self.hedging,
+            usage=self.usage,
+            timeouts=self.timeouts,
+            limits=self.limits
+        )
+        self.research_cache = ResearchCache()
+        self.perplexity = PerplexityClient(transport=self.transport, cache=self.research_cache)
+        self.translator = TranslationService(openai_client=self.openai)
+        self.validator = QualityValidator(openai_client=self.openai)
+
+        # Batch mode: translations and their reviews go through offline batch jobs
+        self.batch = BatchJobClient(self.openai) if LLM_BATCH_ENABLED else None
+        self.translation_client = self.batch or self.openai
+        self.translation_validator = QualityValidator(openai_client=self.batch) if self.batch else self.validator
+        self.image_manager = ImageManager(transport=self.transport)
+
+        # Price-based indicators and subject ranking over the instrument universe
+        self.universe = load_universe(ASSET_UNIVERSE_PATH, self.image_manager.asset_folders)
+        self.indicators = IndicatorEngine({
+            asset: spec["slug"] for assets in self.universe.values() for asset, spec in assets.items()
+        })
+        self.ranker = AssetRanker(self.universe, self.indicators)
+        self.html_formatter = HTMLFormatter()
+        self.zapier = ZapierDelivery(transport=self.transport)
+
+        logger.debug("Initialized shared service container")
+
+    async def close(self) -> None:
+        """Persist latency history and close the async connection pool (sync pools are kept for the process)"""
+        self.latency.save()
+        await self.transport.aclose()
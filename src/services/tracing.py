@@ -0,0 +1,224 @@
+"""
+Tracing
+Nested timing spans (run, agent, phase, provider call, HTTP attempt) exported as OTLP JSON
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from loguru import logger
+from config.credentials import TRACE_ENABLED
+
+# Innermost open span of the current task (children started in gathered tasks inherit it)
+_current_span: ContextVar[Optional["Span"]] = ContextVar("trace_span", default=None)
+
+SERVICE_NAME = "seekapa-blog"
+
+
+class Span:
+    """One timed operation; attributes are flat str/int/float/bool values"""
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self.set(**attributes)
+
+    def set(self, **attributes: Any) -> "Span":
+        """Add attributes (None values are skipped)"""
+        self.attributes.update({key: value for key, value in attributes.items() if value is not None})
+        return self
+
+    def elapsed(self) -> float:
+        """Seconds since the span started"""
+        return (time.time_ns() - self.start_ns) / 1e9
+
+    def fail(self, error: str) -> None:
+        """Mark the span as failed"""
+        self.error = error
+
+    def to_otlp(self) -> Dict:
+        """Span in OTLP/JSON encoding"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1}
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class Tracer:
+    """
+    Collects finished spans of this process
+
+    `with tracer.span("phase", phase="seo"):` makes the span current for the
+    block, so spans opened inside it (also in tasks created inside it) become
+    its children. A span without a parent starts a new trace. Exceptions
+    leaving the block mark the span as failed.
+    """
+
+    def __init__(self, enabled: bool = TRACE_ENABLED):
+        """
+        Initialize tracer
+
+        Args:
+            enabled: False keeps the API working but records nothing
+        """
+        self.enabled = enabled
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start(self, name: str, parent: Optional[Span] = None, **attributes: Any) -> Span:
+        """
+        Open a span without making it current (for work spread over async generator steps)
+
+        Args:
+            name: Span name
+            parent: Parent span (defaults to the current span)
+            **attributes: Span attributes
+
+        Returns:
+            Open span; close it with end()
+        """
+        parent = parent or _current_span.get()
+        if parent is None:
+            return Span(name, secrets.token_hex(16), None, attributes)
+        return Span(name, parent.trace_id, parent.span_id, attributes)
+
+    def end(self, span: Span) -> None:
+        """Close a span and keep it for export"""
+        span.end_ns = time.time_ns()
+        if self.enabled:
+            with self._lock:
+                self._spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Time the block as a child of the current span
+
+        Args:
+            name: Span name
+            **attributes: Span attributes
+        """
+        span = self.start(name, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.fail(repr(e))
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end(span)
+
+    @contextmanager
+    def child(self, parent: Span, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        Time the block under an explicit parent, without making it current
+
+        For blocks that yield from an async generator, where a context
+        variable set inside would leak into the consumer between steps.
+
+        Args:
+            parent: Parent span
+            name: Span name
+            **attributes: Span attributes
+        """
+        span = self.start(name, parent=parent, **attributes)
+        try:
+            yield span
+        except BaseException as e:
+            span.fail(repr(e))
+            raise
+        finally:
+            self.end(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """Get finished spans (of one trace, or all)"""
+        with self._lock:
+            return [s for s in self._spans if trace_id is None or s.trace_id == trace_id]
+
+    def export(self, path: str, trace_id: Optional[str] = None) -> str:
+        """
+        Write finished spans as an OTLP/JSON ExportTraceServiceRequest and forget them
+
+        Args:
+            path: Trace file path
+            trace_id: Only export (and forget) this trace
+
+        Returns:
+            Path written
+        """
+        spans = self.spans(trace_id)
+        request = {
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": _otlp_value(SERVICE_NAME)}]},
+                "scopeSpans": [{
+                    "scope": {"name": "services.tracing"},
+                    "spans": [s.to_otlp() for s in sorted(spans, key=lambda s: s.start_ns)]
+                }]
+            }]
+        }
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(request, f, default=str)
+
+        exported = set(map(id, spans))
+        with self._lock:
+            self._spans = [s for s in self._spans if id(s) not in exported]
+
+        logger.info(f"Trace ({len(spans)} spans) written to {path}")
+        return path
+
+
+_tracer: Optional[Tracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    global _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            _tracer = Tracer()
+        return _tracer
+
+
+def span(name: str, **attributes: Any):
+    """Shorthand for get_tracer().span(...)"""
+    return get_tracer().span(name, **attributes)
+
+
+def current_span() -> Optional[Span]:
+    """Get the innermost open span of the current task"""
+    return _current_span.get()
+
+
+def _otlp_value(value: Any) -> Dict:
+    """Attribute value in OTLP/JSON AnyValue encoding (64-bit ints are strings)"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
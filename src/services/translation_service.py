@@ -4,7 +4,7 @@ Implements SKILL_multilingual_content.md best practices
 Professional translations for GCC Arabic, Spanish, Portuguese
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from loguru import logger
 from services.azure_openai_client import AzureOpenAIClient
 
@@ -15,8 +15,8 @@ class TranslationService:
     Supports: English, GCC Arabic, Latin American Spanish, Brazilian Portuguese
     """
 
-    def __init__(self):
-        self.openai_client = AzureOpenAIClient()
+    def __init__(self, openai_client: Optional[AzureOpenAIClient] = None):
+        self.openai_client = openai_client or AzureOpenAIClient()
 
         # Language configurations from SKILL_multilingual_content.md
         self.languages = {
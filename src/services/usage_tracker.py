@@ -0,0 +1,236 @@
+"""
+Usage Tracker
+Per-call token, latency and cost accounting for LLM requests
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+from loguru import logger
+from config.credentials import LLM_PRICING, BATCH_PRICE_RATIO, CACHED_INPUT_PRICE_RATIO
+
+# Phase/category/language of the calls made in the current task
+_call_context: ContextVar[Dict[str, str]] = ContextVar("llm_call_context", default={})
+
+# Outermost call being tracked in the current task (nested calls fold into it)
+_active_call: ContextVar[Optional["TrackedCall"]] = ContextVar("active_llm_call", default=None)
+
+
+@contextmanager
+def call_context(**fields: str) -> Iterator[None]:
+    """
+    Label the LLM calls made inside the block
+
+    Args:
+        **fields: phase, category and/or language (merged over the enclosing labels)
+    """
+    token = _call_context.set({**_call_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _call_context.reset(token)
+
+
+def current_call_context() -> Dict[str, str]:
+    """Get the labels of the current task"""
+    return dict(_call_context.get())
+
+
+def note_attempt() -> None:
+    """Count an HTTP attempt against the call being tracked (no-op outside track())"""
+    call = _active_call.get()
+    if call is not None:
+        call.attempts += 1
+
+
+def estimate_cost(deployment: str, usage: Dict) -> float:
+    """
+    Estimate the USD cost of a response
+
+    Args:
+        deployment: Deployment that served the call
+        usage: Usage in Chat Completions field names
+
+    Returns:
+        Cost in USD (0.0 for deployments without configured pricing)
+    """
+    input_price, output_price = LLM_PRICING.get(deployment, (0.0, 0.0))
+    cached_tokens = usage.get("cached_tokens", 0)
+    # Prompt-cache hits bill at a discount; reasoning tokens are part of completion_tokens
+    return (
+        (usage.get("prompt_tokens", 0) - cached_tokens) * input_price
+        + cached_tokens * input_price * CACHED_INPUT_PRICE_RATIO
+        + usage.get("completion_tokens", 0) * output_price
+    ) / 1_000_000
+
+
+class TrackedCall:
+    """Handle for one logical LLM call (all retries and fallbacks included)"""
+
+    def __init__(self, deployment: str):
+        self.deployment = deployment
+        self.started = time.monotonic()
+        self.attempts = 0
+        self.result: Optional[Dict] = None
+
+    def finish(self, result: Dict) -> Dict:
+        """Store the final result (returned unchanged)"""
+        self.result = result
+        return result
+
+
+class UsageCollector:
+    """
+    Collects one record per LLM call and aggregates them per phase,
+    deployment, category and language
+    """
+
+    def __init__(self):
+        self._records: List[Dict] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, deployment: str) -> Iterator[TrackedCall]:
+        """
+        Time a call and record it on exit
+
+        Calls made while another one is tracked in the same task (fallback
+        reroutes, background mode delegating to a plain request) are folded
+        into the outer record.
+
+        Args:
+            deployment: Requested deployment
+        """
+        call = TrackedCall(deployment)
+        if _active_call.get() is not None:
+            yield call
+            return
+
+        token = _active_call.set(call)
+        try:
+            yield call
+        finally:
+            _active_call.reset(token)
+            self.record(
+                deployment=deployment,
+                result=call.result or {"success": False, "error": "interrupted"},
+                latency=time.monotonic() - call.started,
+                attempts=call.attempts
+            )
+
+    def record(self, deployment: str, result: Dict, latency: float, attempts: int) -> Dict:
+        """
+        Record a finished call
+
+        Args:
+            deployment: Requested deployment
+            result: Result dict returned by the client
+            latency: Wall time in seconds
+            attempts: HTTP attempts made (0 for cache hits)
+
+        Returns:
+            The stored record
+        """
+        usage = result.get("usage") or {}
+        served_by = result.get("deployment", deployment)
+        cached = bool(result.get("cached"))
+        cost = 0.0 if cached else estimate_cost(served_by, usage)
+        if result.get("batch"):
+            cost *= BATCH_PRICE_RATIO
+
+        record = {
+            **current_call_context(),
+            "deployment": served_by,
+            "requested_deployment": deployment,
+            "success": bool(result.get("success")),
+            "cached": cached,
+            "batch": bool(result.get("batch")),
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "cached_tokens": usage.get("cached_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "reasoning_tokens": usage.get("reasoning_tokens", 0),
+            "latency_seconds": round(latency, 3),
+            "retries": max(0, attempts - 1),
+            "cost_usd": round(cost, 6),
+            "time_to_first_token": result.get("time_to_first_token")
+        }
+
+        with self._lock:
+            self._records.append(record)
+        return record
+
+    def records(self) -> List[Dict]:
+        """Get a copy of all call records"""
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> Dict:
+        """
+        Aggregate the records
+
+        Returns:
+            Dict with totals plus by_phase, by_deployment, by_category and by_language breakdowns
+        """
+        records = self.records()
+        return {
+            "totals": _aggregate(records),
+            "by_phase": _group(records, "phase"),
+            "by_deployment": _group(records, "deployment"),
+            "by_category": _group(records, "category"),
+            "by_language": _group(records, "language")
+        }
+
+    def write_report(self, path: str, metadata: Optional[Dict] = None) -> str:
+        """
+        Write summary and raw records as JSON
+
+        Args:
+            path: Report file path
+            metadata: Extra run metadata to include
+
+        Returns:
+            Path written
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        report = {
+            "metadata": metadata or {},
+            "summary": self.summary(),
+            "calls": self.records()
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+
+        logger.info(f"Usage report written to {path}")
+        return path
+
+
+def _aggregate(records: List[Dict]) -> Dict:
+    """Sum a group of call records"""
+    prompt_tokens = sum(r["prompt_tokens"] for r in records)
+    cached_tokens = sum(r["cached_tokens"] for r in records)
+    return {
+        "calls": len(records),
+        "failures": sum(1 for r in records if not r["success"]),
+        "cached": sum(1 for r in records if r["cached"]),
+        "batched": sum(1 for r in records if r["batch"]),
+        "retries": sum(r["retries"] for r in records),
+        "prompt_tokens": prompt_tokens,
+        "cached_tokens": cached_tokens,
+        "prompt_cache_hit_rate": round(cached_tokens / prompt_tokens, 3) if prompt_tokens else 0.0,
+        "completion_tokens": sum(r["completion_tokens"] for r in records),
+        "reasoning_tokens": sum(r["reasoning_tokens"] for r in records),
+        "latency_seconds": round(sum(r["latency_seconds"] for r in records), 3),
+        "cost_usd": round(sum(r["cost_usd"] for r in records), 4)
+    }
+
+
+def _group(records: List[Dict], field: str) -> Dict[str, Dict]:
+    """Aggregate records per value of a field (missing = "unlabelled")"""
+    groups: Dict[str, List[Dict]] = {}
+    for record in records:
+        groups.setdefault(record.get(field) or "unlabelled", []).append(record)
+    return {name: _aggregate(group) for name, group in sorted(groups.items())}
@@ -3,19 +3,29 @@ Zapier Webhook Delivery Service
 Send article packages to Zapier for review and publishing
 """
 
+import asyncio
+import hashlib
 import requests
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import aiohttp
 from loguru import logger
 from config.credentials import ZAPIER_WEBHOOK_URL
+from services.http_transport import HTTPTransport, get_shared_transport
+from services.tracing import span
+from services.deadline import deadline_exceeded, remaining_timeout
 
 
 class ZapierDelivery:
     """Delivers article packages to Zapier webhook"""
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         self.webhook_url = ZAPIER_WEBHOOK_URL
 
+        # Shared keep-alive connection pools
+        self.transport = transport or get_shared_transport()
+
     def send_articles(
         self,
         articles: List[Dict],
@@ -43,11 +53,11 @@ class ZapierDelivery:
         try:
             logger.info(f"Sending {len(articles)} articles to Zapier webhook...")
 
-            response = requests.post(
+            response = self.transport.session.post(
                 self.webhook_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
-                timeout=30
+                timeout=remaining_timeout(30)
             )
 
             response.raise_for_status()
@@ -94,14 +104,127 @@ class ZapierDelivery:
             if result["success"]:
                 return result
 
+            if deadline_exceeded():
+                logger.error("Run deadline exceeded, giving up on delivery retries")
+                break
+
             if attempt < max_retries:
                 wait_time = attempt * 5  # Exponential backoff: 5s, 10s, 15s
                 logger.warning(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+                time.sleep(remaining_timeout(wait_time))
 
         logger.error(f"All {max_retries} delivery attempts failed")
         return result
 
+    @staticmethod
+    def idempotency_key(article: Dict, date_str: str) -> str:
+        """
+        Key identifying one article delivery (same date, category, asset and plan id = same key)
+
+        Args:
+            article: Article package
+            date_str: Run date (YYYY-MM-DD)
+
+        Returns:
+            Hex key, stable across retries and resumed runs
+        """
+        identity = f"{date_str}:{article.get('category', 'unknown')}:{article.get('asset', 'unknown')}"
+        if article.get("article_id"):
+            identity += f":{article['article_id']}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:32]
+
+    async def send_article_async(
+        self,
+        article: Dict,
+        idempotency_key: str,
+        metadata: Optional[Dict] = None,
+        max_retries: int = 3
+    ) -> Dict:
+        """
+        Deliver one article as soon as it is ready (incremental mode)
+
+        The payload keeps the batch shape (an "articles" list, here of one),
+        tagged with event "article" and the idempotency key, which is also
+        sent as the Idempotency-Key header so the Zap can drop duplicates.
+
+        Args:
+            article: Article package
+            idempotency_key: Key from idempotency_key()
+            metadata: Additional metadata
+            max_retries: Maximum attempts
+
+        Returns:
+            Dict with delivery status
+        """
+        payload = {
+            "event": "article",
+            "idempotency_key": idempotency_key,
+            "generated_at": article["generated_at"],
+            "articles": self._restructure_articles([article]),
+            "metadata": metadata or self._generate_metadata([article])
+        }
+        label = f"{article.get('category')} article ({article.get('asset')})"
+        return await self._post_with_retry_async(payload, idempotency_key, label, max_retries)
+
+    async def send_summary_async(self, summary: Dict, idempotency_key: str, max_retries: int = 3) -> Dict:
+        """
+        Close an incremental delivery with a summary event
+
+        Args:
+            summary: Run summary (delivered/failed keys, metadata)
+            idempotency_key: Key of the run's summary
+            max_retries: Maximum attempts
+
+        Returns:
+            Dict with delivery status
+        """
+        payload = {"event": "summary", "idempotency_key": idempotency_key, "articles": [], **summary}
+        return await self._post_with_retry_async(payload, idempotency_key, "delivery summary", max_retries)
+
+    async def _post_with_retry_async(self, payload: Dict, idempotency_key: str, label: str, max_retries: int) -> Dict:
+        """POST one event to the webhook, retrying with backoff"""
+        if not self.webhook_url:
+            logger.error(f"Zapier delivery of {label} skipped: ZAPIER_WEBHOOK_URL is not configured")
+            return {"success": False, "error": "ZAPIER_WEBHOOK_URL is not configured", "idempotency_key": idempotency_key}
+
+        session = await self.transport.get_async_session()
+        headers = {"Content-Type": "application/json", "Idempotency-Key": idempotency_key}
+        result = {"success": False, "error": "No delivery attempt made"}
+
+        for attempt in range(1, max_retries + 1):
+            try:
+                logger.info(f"Sending {label} to Zapier webhook (attempt {attempt}/{max_retries})...")
+                with span("http.attempt", provider="zapier", event=payload["event"], attempt=attempt) as attempt_span:
+                    async with session.post(
+                        self.webhook_url,
+                        json=payload,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=remaining_timeout(30))
+                    ) as response:
+                        attempt_span.set(status_code=response.status)
+                        text = await response.text()
+                        response.raise_for_status()
+
+                logger.success(f"Delivered {label} to Zapier (status: {response.status})")
+                return {
+                    "success": True,
+                    "status_code": response.status,
+                    "response": text,
+                    "idempotency_key": idempotency_key
+                }
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Zapier delivery of {label} failed: {e!r}")
+                result = {"success": False, "error": repr(e), "idempotency_key": idempotency_key}
+
+            if deadline_exceeded():
+                logger.error("Run deadline exceeded, giving up on delivery retries")
+                break
+
+            if attempt < max_retries:
+                await asyncio.sleep(remaining_timeout(attempt * 5))  # 5s, 10s, ...
+
+        return result
+
     def save_failed_delivery(
         self,
         articles: List[Dict],
@@ -173,7 +296,9 @@ class ZapierDelivery:
                 "article_type": article_type,
                 "specific_asset": specific_asset,
                 "image_url": image_url,
-                "languages": languages_data
+                "languages": languages_data,
+                "model_degradations": article.get("degraded_calls", []),
+                "skipped_phases": article.get("skipped_phases", [])
             }
 
             restructured.append(restructured_article)
@@ -275,7 +400,7 @@ class ZapierDelivery:
         return {
             "articles_generated": len(articles),
             "total_translations": total_languages - len(articles),  # Minus English originals
-            "languages_per_article": 4,  # EN + AR + ES + PT
+            "languages_per_article": max((len(article["languages"]) for article in articles), default=0),
             "average_quality_score": round(avg_quality, 2),
             "categories": [article["category"] for article in articles],
             "assets": [article["asset"] for article in articles]
@@ -395,7 +520,7 @@ class ZapierDelivery:
         }
 
         try:
-            response = requests.post(
+            response = self.transport.session.post(
                 self.webhook_url,
                 json=test_payload,
                 timeout=10
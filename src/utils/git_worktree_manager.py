@@ -29,13 +29,14 @@ class GitWorktreeManager:
         self.repo_path = repo_path
         self.worktrees: Dict[str, str] = {}
 
-    def create_worktrees(self, categories: List[str], date_str: str) -> Dict[str, str]:
+    def create_worktrees(self, categories: List[str], date_str: str, reuse_existing: bool = False) -> Dict[str, str]:
         """
         Create git worktrees for parallel agent work
 
         Args:
             categories: List of categories (forex, crypto, commodities)
             date_str: Date string (YYYY-MM-DD)
+            reuse_existing: Keep worktrees left behind by a failed run (resumed runs)
 
         Returns:
             Dict mapping category to worktree path
@@ -49,6 +50,11 @@ class GitWorktreeManager:
             worktree_path = os.path.join(repo_parent, f"{repo_name}-{category}")
             branch_name = f"daily/{category}-{date_str}"
 
+            if reuse_existing and os.path.isdir(worktree_path):
+                self.worktrees[category] = worktree_path
+                logger.info(f"Reusing worktree for {category} at {worktree_path}")
+                continue
+
             try:
                 # Create worktree with new branch
                 cmd = [
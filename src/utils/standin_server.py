@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+Local Stand-in Server
+Fake Azure OpenAI, Perplexity and Zapier endpoints for offline testing:
+- Chat Completions (incl. SSE streaming)
+- Responses API (incl. SSE streaming and background jobs with polling)
+- Perplexity chat completions (combined research answered per the JSON schema)
+- Zapier catch hook (records payloads, drops repeated Idempotency-Keys)
+- Log-normal latency per route, injected 503s, 429s (with Retry-After) and truncated 200 bodies
+- Streams that break off after a number of deltas
+
+Usage:
+    python src/utils/standin_server.py --port 8080
+    AZURE_OPENAI_ENDPOINT=http://127.0.0.1:8080/ \
+    PERPLEXITY_ENDPOINT=http://127.0.0.1:8080/chat/completions \
+    ZAPIER_WEBHOOK_URL=http://127.0.0.1:8080/hooks/zapier python src/main_orchestrator.py
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import math
+import random
+import time
+from typing import Callable, Dict, Optional
+
+from aiohttp import web
+from loguru import logger
+
+
+# Combined market research answer (shape of perplexity_client.RESEARCH_SCHEMA)
+RESEARCH_SAMPLE = {
+    "forex": {
+        "assets": [
+            {"name": "EUR/USD", "price": "1.0845", "change_pct": 0.32, "drivers": "ECB minutes, US CPI", "opportunity_score": 64},
+            {"name": "USD/JPY", "price": "151.20", "change_pct": -0.85, "drivers": "BoJ intervention talk", "opportunity_score": 81},
+            {"name": "GBP/USD", "price": "1.2710", "change_pct": 0.12, "drivers": "UK retail sales", "opportunity_score": 42}
+        ],
+        "sentiment": "neutral",
+        "key_events": ["US CPI release", "ECB minutes"],
+        "summary": "The yen led moves on intervention talk while the euro firmed ahead of US inflation data."
+    },
+    "crypto": {
+        "assets": [
+            {"name": "Bitcoin", "price": "$110,818", "change_pct": 2.5, "market_cap": "$2.2T", "drivers": "ETF inflows", "opportunity_score": 77},
+            {"name": "Ethereum", "price": "$3,950", "change_pct": 1.1, "market_cap": "$475B", "drivers": "Staking demand", "opportunity_score": 58},
+            {"name": "Solana", "price": "$182", "change_pct": 6.4, "market_cap": "$85B", "drivers": "Network upgrade", "opportunity_score": 71}
+        ],
+        "sentiment": "bullish",
+        "key_events": ["Spot ETF flows"],
+        "summary": "Bitcoin extended gains on steady ETF inflows, with Solana outperforming after its upgrade."
+    },
+    "commodities": {
+        "assets": [
+            {"name": "Gold", "price": "$2,650/oz", "change_pct": 1.2, "drivers": "Safe-haven demand", "opportunity_score": 74},
+            {"name": "WTI Crude Oil", "price": "$78.40/bbl", "change_pct": -1.9, "drivers": "OPEC+ supply outlook", "opportunity_score": 69}
+        ],
+        "sentiment": "mixed",
+        "key_events": ["OPEC+ meeting"],
+        "summary": "Gold rose on haven demand while oil slipped on supply concerns."
+    }
+}
+
+
+def default_responder(prompt: str) -> str:
+    """
+    Produce a plausible reply for the prompts this project sends
+
+    Args:
+        prompt: Full prompt text
+
+    Returns:
+        Response text (JSON for SEO/validation prompts, prose otherwise)
+    """
+    if "following the provided schema" in prompt:
+        return json.dumps(RESEARCH_SAMPLE)
+
+    if '"ACCEPT" or "RETRY"' in prompt:
+        return json.dumps({"quality_score": 88, "issues": [], "recommendation": "ACCEPT"})
+
+    if '"quality_score"' in prompt:
+        return json.dumps({"quality_score": 86, "issues": [], "strengths": [], "recommendation": "PUBLISH"})
+
+    if '"image_alt"' in prompt:
+        return json.dumps({
+            "title": "Stand-in Market Analysis | Seekapa",
+            "description": "Stand-in description for local testing of the blog pipeline.",
+            "keywords": ["trading", "analysis", "market", "Seekapa", "stand-in"],
+            "image_alt": "Stand-in trading chart"
+        })
+
+    if "Translate now:" in prompt:
+        # Echo the source text so length checks behave like a real translation
+        return prompt.split("Translate now:", 1)[1].strip() or "Traducción"
+
+    paragraph = (
+        "Markets traded in a measured range today as traders weighed fresh economic data "
+        "against shifting central bank expectations, with support and resistance levels in focus."
+    )
+    return "\n\n".join(paragraph for _ in range(20))
+
+
+class StandinServer:
+    """aiohttp application imitating the Azure OpenAI, Perplexity and Zapier endpoints the clients call"""
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        background_duration: float = 2.0,
+        responder: Callable[[str], str] = default_responder,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_sigma: float = 0.0,
+        route_latency: Optional[Dict[str, float]] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        malformed_rate: float = 0.0,
+        stream_cutoff: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Initialize stand-in
+
+        Args:
+            latency: Median seconds before a synchronous response is returned
+            background_duration: Seconds a background job stays queued/in progress
+            responder: Function mapping prompt text to response text
+            host: Bind address
+            port: Bind port (0 picks a free port)
+            latency_sigma: Log-normal spread of the latency (0 = always the median)
+            route_latency: Median latency per route (chat, responses, perplexity, zapier), overrides latency
+            error_rate: Fraction of requests answered with 503
+            throttle_rate: Fraction of requests answered with 429
+            retry_after: Retry-After seconds of injected 429s
+            malformed_rate: Fraction of requests answered 200 with a truncated JSON body
+            stream_cutoff: Deltas sent before every stream breaks off (None = complete streams)
+            seed: Seed for latency and fault injection (None = unseeded)
+        """
+        self.latency = latency
+        self.background_duration = background_duration
+        self.responder = responder
+        self.host = host
+        self.port = port
+        self.latency_sigma = latency_sigma
+        self.route_latency = route_latency or {}
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.malformed_rate = malformed_rate
+        self.stream_cutoff = stream_cutoff
+        self._random = random.Random(seed)
+
+        self.request_counts: Dict[str, int] = {}
+        self.injected: Dict[str, int] = {"429": 0, "503": 0, "malformed": 0, "stream_cut": 0}
+        self.background_jobs: Dict[str, Dict] = {}
+        self.webhook_events: list = []
+        self._idempotency_keys: set = set()
+        self._prompt_prefixes: set = set()
+        self._ids = itertools.count(1)
+        self._runner: Optional[web.AppRunner] = None
+
+        # Batch deliveries of large run plans exceed aiohttp's 1 MB default
+        self.app = web.Application(client_max_size=256 * 1024 * 1024)
+        self.app.router.add_post("/openai/deployments/{deployment}/chat/completions", self._chat_completions)
+        self.app.router.add_post("/openai/responses", self._create_response)
+        self.app.router.add_get("/openai/responses/{response_id}", self._get_response)
+        self.app.router.add_post("/chat/completions", self._perplexity)
+        self.app.router.add_post("/hooks/zapier", self._zapier)
+
+    async def start(self) -> str:
+        """
+        Start serving
+
+        Returns:
+            Endpoint base URL with trailing slash (use as AZURE_OPENAI_ENDPOINT)
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        self.port = site._server.sockets[0].getsockname()[1]
+        logger.info(f"Stand-in server listening on http://{self.host}:{self.port}/")
+        return f"http://{self.host}:{self.port}/"
+
+    async def stop(self) -> None:
+        """Stop serving"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _count(self, route: str) -> None:
+        """Count a request per route"""
+        self.request_counts[route] = self.request_counts.get(route, 0) + 1
+
+    def _latency(self, route: str) -> float:
+        """Sample a response latency for a route (log-normal around its median)"""
+        median = self.route_latency.get(route, self.latency)
+        if not self.latency_sigma:
+            return median
+        return median * math.exp(self._random.gauss(0.0, self.latency_sigma))
+
+    def _fault(self) -> Optional[web.Response]:
+        """Injected 429, 503 or truncated 200 for this request, if any"""
+        roll = self._random.random()
+        if roll < self.throttle_rate:
+            self.injected["429"] += 1
+            return web.json_response(
+                {"error": {"code": "429", "message": "Rate limit is exceeded"}},
+                status=429,
+                headers={"Retry-After": f"{self.retry_after:g}"}
+            )
+        if roll < self.throttle_rate + self.error_rate:
+            self.injected["503"] += 1
+            return web.json_response({"error": {"code": "503", "message": "Service unavailable"}}, status=503)
+        if roll < self.throttle_rate + self.error_rate + self.malformed_rate:
+            self.injected["malformed"] += 1
+            return web.Response(text='{"id": "resp_truncated", "choices": [{"mess', content_type="application/json")
+        return None
+
+    def stats(self) -> Dict:
+        """Requests per route, injected faults and recorded webhook events"""
+        return {
+            "requests": dict(self.request_counts),
+            "injected": dict(self.injected),
+            "webhook_events": len(self.webhook_events)
+        }
+
+    def _usage(self, prompt: str, text: str) -> Dict:
+        """Usage with cached_tokens from a simulated provider prompt cache"""
+        return _usage(prompt, text, self._cached_tokens(prompt))
+
+    def _cached_tokens(self, prompt: str) -> int:
+        """
+        Imitate provider prompt caching: prefixes of 1024+ tokens are cached in
+        128-token steps, and the longest previously seen prefix is a hit
+        """
+        step, minimum = 128 * 4, 1024 * 4  # In characters (~4 per token)
+        cached = 0
+        for end in range(minimum, len(prompt) + 1, step):
+            digest = hashlib.sha256(prompt[:end].encode("utf-8")).digest()
+            if digest in self._prompt_prefixes:
+                cached = end
+            self._prompt_prefixes.add(digest)
+        return cached // 4
+
+    async def _chat_completions(self, request: web.Request) -> web.StreamResponse:
+        """POST /openai/deployments/{deployment}/chat/completions"""
+        self._count("chat")
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        body = await request.json()
+        prompt = "\n\n".join(m.get("content", "") for m in body.get("messages", []))
+        text = self.responder(prompt)
+        usage = self._usage(prompt, text)
+
+        await asyncio.sleep(self._latency("chat"))
+
+        if body.get("stream"):
+            chunks = [
+                {"choices": [{"delta": {"content": piece}}]}
+                for piece in _split(text)
+            ]
+            chunks.append({"choices": [], "usage": usage})
+            if self.stream_cutoff is not None:
+                # Connection drops mid-stream
+                self.injected["stream_cut"] += 1
+                return await _sse(request, [(None, chunk) for chunk in chunks[:self.stream_cutoff]], done=False, cut=True)
+            return await _sse(request, [(None, chunk) for chunk in chunks], done=True)
+
+        return web.json_response(chat_completion_body(prompt, text, usage))
+
+    async def _create_response(self, request: web.Request) -> web.StreamResponse:
+        """POST /openai/responses"""
+        self._count("responses")
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        body = await request.json()
+        prompt = body.get("input", "")
+        if isinstance(prompt, list):
+            prompt = json.dumps(prompt)
+        text = self.responder(prompt)
+        usage = self._usage(body.get("instructions", "") + "\n\n" + prompt, text)
+        response_id = f"resp_{next(self._ids)}"
+
+        if body.get("background"):
+            self.background_jobs[response_id] = {
+                "created": time.monotonic(),
+                "text": text,
+                "usage": usage
+            }
+            return web.json_response({"id": response_id, "status": "queued"})
+
+        await asyncio.sleep(self._latency("responses"))
+
+        if body.get("stream"):
+            events = [("response.created", {"type": "response.created"})]
+            events += [
+                ("response.output_text.delta", {"type": "response.output_text.delta", "delta": piece})
+                for piece in _split(text)
+            ]
+            if self.stream_cutoff is not None:
+                # Server-side failure reported mid-stream
+                self.injected["stream_cut"] += 1
+                events = events[:self.stream_cutoff + 1]
+                events.append(("response.failed", {
+                    "type": "response.failed",
+                    "response": {"id": response_id, "status": "failed", "error": {"code": "server_error", "message": "Stream interrupted"}}
+                }))
+                return await _sse(request, events, done=False)
+            events.append(("response.completed", {
+                "type": "response.completed",
+                "response": _response_body(response_id, "completed", text, usage)
+            }))
+            return await _sse(request, events, done=False)
+
+        return web.json_response(_response_body(response_id, "completed", text, usage))
+
+    async def _get_response(self, request: web.Request) -> web.Response:
+        """GET /openai/responses/{response_id}"""
+        self._count("responses_poll")
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        response_id = request.match_info["response_id"]
+        job = self.background_jobs.get(response_id)
+        if job is None:
+            return web.json_response({"error": {"message": "Not found"}}, status=404)
+
+        elapsed = time.monotonic() - job["created"]
+        if elapsed < self.background_duration / 2:
+            return web.json_response({"id": response_id, "status": "queued"})
+        if elapsed < self.background_duration:
+            return web.json_response({"id": response_id, "status": "in_progress"})
+
+        return web.json_response(_response_body(response_id, "completed", job["text"], job["usage"]))
+
+    async def _perplexity(self, request: web.Request) -> web.Response:
+        """POST /chat/completions (Perplexity)"""
+        self._count("perplexity")
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        body = await request.json()
+        prompt = "\n\n".join(m.get("content", "") for m in body.get("messages", []))
+        text = self.responder(prompt)
+
+        await asyncio.sleep(self._latency("perplexity"))
+        return web.json_response(chat_completion_body(prompt, text))
+
+    async def _zapier(self, request: web.Request) -> web.Response:
+        """POST /hooks/zapier (catch hook; a repeated Idempotency-Key is acknowledged but not recorded)"""
+        self._count("zapier")
+        fault = self._fault()
+        if fault is not None:
+            return fault
+        body = await request.json()
+        await asyncio.sleep(self._latency("zapier"))
+        key = request.headers.get("Idempotency-Key")
+        if key not in self._idempotency_keys:
+            if key:
+                self._idempotency_keys.add(key)
+            self.webhook_events.append({"received": time.monotonic(), "idempotency_key": key, "body": body})
+        return web.json_response({"status": "success", "attempt": key or "none"})
+
+
+def chat_completion_body(prompt: str, text: str, usage: Optional[Dict] = None) -> Dict:
+    """
+    Build a Chat Completions response body
+
+    Args:
+        prompt: Prompt text (for approximate usage)
+        text: Assistant reply
+        usage: Usage to report (approximated from prompt and text if omitted)
+
+    Returns:
+        Response body as returned by the API
+    """
+    return {
+        "choices": [{"message": {"role": "assistant", "content": text}}],
+        "usage": usage or _usage(prompt, text)
+    }
+
+
+async def batch_responder(body: Dict) -> Dict:
+    """
+    Answer a batch request line the way the server would, without HTTP
+
+    For LocalBatchBackend in tests.
+
+    Args:
+        body: Chat Completions request body
+
+    Returns:
+        Response body
+    """
+    prompt = "\n\n".join(m.get("content", "") for m in body.get("messages", []))
+    return chat_completion_body(prompt, default_responder(prompt))
+
+
+def _usage(prompt: str, text: str, cached_tokens: int = 0) -> Dict:
+    """Approximate token usage in Chat Completions field names"""
+    prompt_tokens = len(prompt) // 4
+    completion_tokens = len(text) // 4
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": min(cached_tokens, prompt_tokens)}
+    }
+
+
+def _response_body(response_id: str, status: str, text: str, usage: Dict) -> Dict:
+    """Build a Responses API response object"""
+    return {
+        "id": response_id,
+        "status": status,
+        "output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}],
+        "usage": {
+            "input_tokens": usage["prompt_tokens"],
+            "input_tokens_details": usage["prompt_tokens_details"],
+            "output_tokens": usage["completion_tokens"],
+            "total_tokens": usage["total_tokens"]
+        }
+    }
+
+
+def _split(text: str, size: int = 64) -> list:
+    """Split text into stream-sized pieces"""
+    return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+
+async def _sse(request: web.Request, events: list, done: bool, cut: bool = False) -> web.StreamResponse:
+    """Write (event name, payload) pairs as server-sent events (cut = drop the connection instead of ending the body)"""
+    response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+    await response.prepare(request)
+
+    for name, payload in events:
+        prefix = f"event: {name}\n" if name else ""
+        await response.write(f"{prefix}data: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+    if done:
+        await response.write(b"data: [DONE]\n\n")
+    if cut:
+        request.transport.close()
+        return response
+    await response.write_eof()
+    return response
+
+
+async def _serve_forever(args: argparse.Namespace) -> None:
+    """Run the stand-in until interrupted"""
+    server = StandinServer(
+        latency=args.latency,
+        background_duration=args.background_duration,
+        host=args.host,
+        port=args.port,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        malformed_rate=args.malformed_rate,
+        stream_cutoff=args.stream_cutoff,
+        seed=args.seed
+    )
+    await server.start()
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Azure OpenAI, Perplexity and Zapier stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05, help="Median seconds per synchronous response")
+    parser.add_argument("--latency-sigma", type=float, default=0.0, help="Log-normal latency spread")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds of injected 429s")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of requests answered 200 with a truncated body")
+    parser.add_argument("--stream-cutoff", type=int, default=None, help="Deltas sent before every stream breaks off")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency and fault injection")
+    parser.add_argument("--background-duration", type=float, default=2.0, help="Seconds per background job")
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
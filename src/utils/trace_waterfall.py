@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Trace Waterfall
+Render a run trace (OTLP JSON written by services/tracing.py) as a text waterfall
+
+Usage:
+    python src/utils/trace_waterfall.py                        # latest trace in output/traces
+    python src/utils/trace_waterfall.py output/traces/trace_20261017_060000.json --depth 3
+    python src/utils/trace_waterfall.py --min-seconds 1 --width 100
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+# Run from anywhere: make src/ importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.credentials import TRACE_DIR
+
+# Attribute that best identifies a span of each name (shown next to the name)
+LABEL_ATTRIBUTES = ["step", "article", "deployment", "phase", "language", "provider", "request"]
+
+
+def load_spans(path: str) -> List[Dict]:
+    """
+    Read the spans of an OTLP/JSON trace file
+
+    Args:
+        path: Trace file
+
+    Returns:
+        Spans with id, parent, name, start/end (seconds since epoch), attributes and error
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        request = json.load(f)
+
+    spans = []
+    for resource_spans in request.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span in scope_spans.get("spans", []):
+                status = span.get("status", {})
+                spans.append({
+                    "id": span["spanId"],
+                    "parent": span.get("parentSpanId") or None,
+                    "name": span["name"],
+                    "start": int(span["startTimeUnixNano"]) / 1e9,
+                    "end": int(span["endTimeUnixNano"]) / 1e9,
+                    "attributes": {a["key"]: _attribute_value(a["value"]) for a in span.get("attributes", [])},
+                    "error": status.get("message") if status.get("code") == 2 else None
+                })
+    return spans
+
+
+def render(spans: List[Dict], width: int = 60, max_depth: Optional[int] = None, min_seconds: float = 0.0) -> str:
+    """
+    Render spans as an indented waterfall, children under their parents in start order
+
+    Args:
+        spans: Spans from load_spans()
+        width: Bar width in characters
+        max_depth: Deepest nesting level shown (None = all)
+        min_seconds: Hide spans shorter than this (their children too)
+
+    Returns:
+        Waterfall text
+    """
+    if not spans:
+        return "(empty trace)"
+
+    ids = {span["id"] for span in spans}
+    children: Dict[Optional[str], List[Dict]] = {}
+    for span in spans:
+        # Spans whose parent was not exported are shown as roots
+        parent = span["parent"] if span["parent"] in ids else None
+        children.setdefault(parent, []).append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda span: span["start"])
+
+    origin = min(span["start"] for span in spans)
+    total = max(span["end"] for span in spans) - origin or 1e-9
+    rows = []
+
+    def walk(span: Dict, depth: int) -> None:
+        seconds = span["end"] - span["start"]
+        if seconds < min_seconds or (max_depth is not None and depth > max_depth):
+            return
+        label = ("  " * depth + _label(span))[:40]
+        first = int((span["start"] - origin) / total * width)
+        length = max(1, round(seconds / total * width))
+        bar = " " * first + "█" * min(length, width - first)
+        marker = " ✗ " + span["error"][:60] if span["error"] else ""
+        rows.append(f"{label:<40} |{bar:<{width}}| {seconds:8.2f}s{marker}")
+        for child in children.get(span["id"], []):
+            walk(child, depth + 1)
+
+    for root in children.get(None, []):
+        walk(root, 0)
+
+    header = f"{'':<40} |0s{'':<{width - 2 - len(f'{total:.1f}s')}}{total:.1f}s|"
+    return "\n".join([header] + rows)
+
+
+def summarize(spans: List[Dict]) -> str:
+    """
+    Time per span type (name + label attribute), longest total first
+
+    Args:
+        spans: Spans from load_spans()
+
+    Returns:
+        Table text
+    """
+    groups: Dict[str, List[float]] = {}
+    for span in spans:
+        groups.setdefault(_label(span), []).append(span["end"] - span["start"])
+
+    rows = [f"{'span':<40} {'count':>6} {'total':>10} {'max':>9}"]
+    for label, durations in sorted(groups.items(), key=lambda item: -sum(item[1])):
+        rows.append(f"{label[:40]:<40} {len(durations):>6} {sum(durations):>9.2f}s {max(durations):>8.2f}s")
+    return "\n".join(rows)
+
+
+def latest_trace(directory: str = TRACE_DIR) -> Optional[str]:
+    """Most recent trace file in a directory"""
+    paths = sorted(glob.glob(os.path.join(directory, "trace_*.json")))
+    return paths[-1] if paths else None
+
+
+def _label(span: Dict) -> str:
+    """Span name plus its identifying attribute, e.g. 'phase generation' or 'http.attempt #2'"""
+    attributes = span["attributes"]
+    label = span["name"]
+    for key in LABEL_ATTRIBUTES:
+        if key in attributes:
+            label += f" {attributes[key]}"
+            break
+    if "attempt" in attributes:
+        label += f" #{attributes['attempt']}"
+    return label
+
+
+def _attribute_value(value: Dict):
+    """Decode an OTLP/JSON AnyValue"""
+    if "intValue" in value:
+        return int(value["intValue"])
+    for key in ("stringValue", "doubleValue", "boolValue"):
+        if key in value:
+            return value[key]
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a run trace as a waterfall")
+    parser.add_argument("trace", nargs="?", help="Trace file (default: latest in TRACE_DIR)")
+    parser.add_argument("--width", type=int, default=60, help="Bar width in characters")
+    parser.add_argument("--depth", type=int, default=None, help="Deepest nesting level shown")
+    parser.add_argument("--min-seconds", type=float, default=0.0, help="Hide spans shorter than this")
+    parser.add_argument("--no-summary", action="store_true", help="Skip the time-per-span-type table")
+    args = parser.parse_args()
+
+    path = args.trace or latest_trace()
+    if not path:
+        sys.exit(f"No trace files in {TRACE_DIR}")
+
+    trace_spans = load_spans(path)
+    print(f"{path} ({len(trace_spans)} spans)\n")
+    print(render(trace_spans, width=args.width, max_depth=args.depth, min_seconds=args.min_seconds))
+    if not args.no_summary:
+        print()
+        print(summarize(trace_spans))
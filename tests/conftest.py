@@ -0,0 +1,72 @@
+"""
+Shared fixtures: isolated output paths, the local stand-in server and per-test HTTP pools
+"""
+
+import os
+import tempfile
+
+# Configuration is read from the environment at import time, so point every
+# on-disk store at a scratch directory before any project module is imported
+_SCRATCH = tempfile.mkdtemp(prefix="blog-tests-")
+os.environ.update({
+    "AZURE_OPENAI_KEY": "test",
+    "PERPLEXITY_API_KEY": "test",
+    "ZAPIER_WEBHOOK_URL": "",
+    "LLM_CACHE_ENABLED": "false",
+    "LLM_CACHE_PATH": os.path.join(_SCRATCH, "llm_responses.sqlite3"),
+    "LATENCY_STATS_PATH": os.path.join(_SCRATCH, "latency_stats.json"),
+    "BACKGROUND_JOBS_PATH": os.path.join(_SCRATCH, "background_jobs.json"),
+    "BATCH_LOCAL_DIR": os.path.join(_SCRATCH, "batches"),
+    "CHECKPOINT_DIR": os.path.join(_SCRATCH, "checkpoints"),
+    "TRACE_DIR": os.path.join(_SCRATCH, "traces"),
+    "RESEARCH_CACHE_PATH": os.path.join(_SCRATCH, "research_cache.json"),
+    "REPORTS_DIR": os.path.join(_SCRATCH, "reports"),
+    "GPT5_RPM": "0",
+    "GPT5_TPM": "0",
+    "GPT5_PRO_RPM": "0",
+    "GPT5_PRO_TPM": "0",
+    "RUN_DEADLINE_SECONDS": "0"
+})
+
+import pytest
+
+from services import circuit_breaker
+from services.http_transport import HTTPTransport
+from utils.standin_server import StandinServer
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Breakers are process-wide; every test starts with closed circuits"""
+    circuit_breaker._breakers.clear()
+    yield
+    circuit_breaker._breakers.clear()
+
+
+@pytest.fixture
+async def standin():
+    """
+    Factory starting stand-in servers on free ports (stopped after the test)
+
+    Usage: server, url = await standin(throttle_rate=1.0)
+    """
+    servers = []
+
+    async def start(**options):
+        server = StandinServer(latency=options.pop("latency", 0.0), **options)
+        servers.append(server)
+        return server, await server.start()
+
+    yield start
+
+    for server in servers:
+        await server.stop()
+
+
+@pytest.fixture
+async def transport():
+    """Connection pools bound to this test's event loop"""
+    pool = HTTPTransport()
+    yield pool
+    await pool.aclose()
+    pool.close()
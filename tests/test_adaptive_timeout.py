@@ -0,0 +1,81 @@
+"""Adaptive timeouts and the rolling latency window behind them"""
+
+import json
+
+from services import service_container
+from services.adaptive_timeout import AdaptiveTimeoutPolicy
+from services.latency_stats import RollingLatencyWindow
+from services.service_container import ServiceContainer
+
+
+def policy(samples, **options):
+    window = RollingLatencyWindow()
+    for seconds in samples:
+        window.record("gpt-5:generation", seconds)
+    return AdaptiveTimeoutPolicy(window, enabled=True, percentile=0.9, headroom=2.0,
+                                 min_samples=10, min_seconds=5, max_seconds=100, **options)
+
+
+def test_cold_start_keeps_the_fixed_timeout():
+    assert policy([]).timeout("gpt-5:generation", 180) == 180
+    assert policy([1.0] * 9).timeout("gpt-5:generation", 180) == 180
+    assert policy([1.0] * 50).timeout("gpt-5:translation", 180) == 180
+
+
+def test_disabled_policy_keeps_the_fixed_timeout():
+    window = RollingLatencyWindow()
+    for _ in range(50):
+        window.record("gpt-5:generation", 1.0)
+    assert AdaptiveTimeoutPolicy(window, enabled=False).timeout("gpt-5:generation", 180) == 180
+
+
+def test_timeout_follows_the_percentile_within_floor_and_ceiling():
+    # p90 of 1..20 is 18s, x2 headroom
+    assert policy(range(1, 21)).timeout("gpt-5:generation", 180) == 36
+    # Fast calls are held at the floor, slow ones at the ceiling
+    assert policy([0.5] * 20).timeout("gpt-5:generation", 180) == 5
+    assert policy([80.0] * 20).timeout("gpt-5:generation", 180) == 100
+
+
+def test_retries_double_the_timeout_up_to_the_ceiling():
+    timeouts = policy(range(1, 21))
+    assert [timeouts.timeout("gpt-5:generation", 180, attempt) for attempt in range(3)] == [36, 72, 100]
+
+
+def test_window_keeps_the_most_recent_samples():
+    window = RollingLatencyWindow(window=3)
+    for seconds in (100, 1, 2, 3):
+        window.record("gpt-5:seo", seconds)
+
+    assert window.count("gpt-5:seo") == 3
+    assert window.percentile("gpt-5:seo", 1.0) == 3
+    assert window.percentile("gpt-5:missing", 0.5) is None
+
+
+def test_window_round_trips_through_its_file(tmp_path):
+    path = str(tmp_path / "latency_stats.json")
+    window = RollingLatencyWindow(path=path)
+    window.record("gpt-5:seo", 1.5)
+    window.save()
+
+    assert RollingLatencyWindow(path=path).percentile("gpt-5:seo", 0.5) == 1.5
+
+    (tmp_path / "latency_stats.json").write_text("{not json")
+    assert RollingLatencyWindow(path=path).keys() == []
+
+
+async def test_container_reloads_latency_history_from_the_stats_path(monkeypatch, tmp_path, transport):
+    path = tmp_path / "latency_stats.json"
+    monkeypatch.setattr(service_container, "LATENCY_STATS_PATH", str(path))
+
+    first = ServiceContainer(transport=transport)
+    assert first.timeouts.timeout("gpt-5:generation", 180) == 180
+    for _ in range(first.timeouts.min_samples):
+        first.timeouts.record("gpt-5:generation", 40.0)
+    await first.close()
+    assert len(json.loads(path.read_text())["gpt-5:generation"]) == first.timeouts.min_samples
+
+    # The next run starts from the persisted window instead of cold
+    second = ServiceContainer(transport=transport)
+    assert second.latency.count("gpt-5:generation") == first.timeouts.min_samples
+    assert second.timeouts.timeout("gpt-5:generation", 180) == 40.0 * second.timeouts.headroom
@@ -0,0 +1,92 @@
+"""Asset ranking: per-category z-scores, weighting, mentions and missing price data"""
+
+import json
+
+import numpy as np
+
+from services.asset_ranking import AssetRanker, _group_zscore, _mention_pattern, load_universe, rank_scores
+from services.indicators import IndicatorEngine
+
+WEIGHTS = {"volatility": 1.0, "volume": 0.5, "gap": 0.5, "mentions": 1.0}
+
+
+def test_group_zscore_is_per_category():
+    values = np.array([1.0, 3.0, 100.0, 300.0, np.nan])
+    groups = np.array([0, 0, 1, 1, 1])
+
+    z = _group_zscore(values, groups)
+
+    assert z.tolist() == [-1.0, 1.0, -1.0, 1.0, 0.0]
+
+
+def test_constant_group_scores_zero():
+    assert _group_zscore(np.array([5.0, 5.0]), np.array([0, 0])).tolist() == [0.0, 0.0]
+
+
+def bars(close: np.ndarray, spread: float, volume: float = 100.0):
+    """(1 x n) OHLCV rows with a fixed high-low spread"""
+    n = len(close)
+    return close, close + spread / 2, close - spread / 2, close, np.full(n, volume)
+
+
+def test_volatile_asset_ranks_first_and_missing_prices_count_as_average():
+    close = np.full(30, 100.0)
+    rows = [bars(close, 1.0), bars(close, 5.0), bars(close, 1.0)]
+    open_, high, low, close_, volume = (np.vstack(column) for column in zip(*rows))
+    has_prices = np.array([True, True, False])
+
+    scores = rank_scores(
+        open_, high, low, close_, volume,
+        has_prices=has_prices, mentions=np.zeros(3), groups=np.zeros(3, dtype=int), weights=WEIGHTS
+    )
+
+    assert scores["volatility"][1] > scores["volatility"][0]
+    assert np.isnan(scores["volatility"][2])
+    assert scores["z_volatility"][2] == 0.0
+    assert np.argmax(scores["score"]) == 1
+
+
+def test_mentions_weight_can_be_disabled():
+    close = np.full((2, 30), 100.0)
+    args = (close, close + 1, close - 1, close, np.ones((2, 30)))
+    options = {"has_prices": np.array([True, True]), "mentions": np.array([0, 5]), "groups": np.array([0, 0])}
+
+    assert np.argmax(rank_scores(*args, weights=WEIGHTS, **options)["score"]) == 1
+    assert rank_scores(*args, weights={**WEIGHTS, "mentions": 0.0}, **options)["score"].tolist() == [0.0, 0.0]
+
+
+def test_mention_pattern_matches_aliases_and_whole_words():
+    pattern = _mention_pattern(["EUR/USD"])
+    assert len(pattern.findall("EUR/USD and eurusd rose; EUR/USDX did not")) == 2
+
+    pattern = _mention_pattern(["Bitcoin", "BTC"])
+    assert len(pattern.findall("BTC led, bitcoin followed, BTCUSD is another symbol")) == 2
+
+
+def test_load_universe_accepts_slugs_or_specs(tmp_path):
+    path = tmp_path / "universe.json"
+    path.write_text(json.dumps({"crypto": {"Bitcoin": "bitcoin", "Solana": {"slug": "sol", "aliases": ["SOL"]}}}))
+
+    universe = load_universe(str(path), {})
+
+    assert universe == {"crypto": {
+        "Bitcoin": {"slug": "bitcoin", "aliases": []},
+        "Solana": {"slug": "sol", "aliases": ["SOL"]}
+    }}
+    assert "forex" in load_universe(str(tmp_path / "missing.json"), {})
+
+
+def test_ranker_orders_each_category_by_research_mentions(tmp_path):
+    universe = {
+        "crypto": {"Bitcoin": {"slug": "bitcoin", "aliases": ["BTC"]}, "Ethereum": {"slug": "ethereum", "aliases": []}},
+        "commodities": {"Gold": {"slug": "gold", "aliases": []}}
+    }
+    engine = IndicatorEngine({}, data_dir=str(tmp_path), max_age_hours=0)
+    ranker = AssetRanker(universe, engine, weights=WEIGHTS)
+
+    ranking = ranker.rank("Ethereum upgrade lifts Ethereum; BTC flat", top_n=2)
+
+    assert [entry["asset"] for entry in ranking["crypto"]] == ["Ethereum", "Bitcoin"]
+    assert ranking["crypto"][0]["mentions"] == 2
+    assert ranking["crypto"][0]["volatility_pct"] is None
+    assert [entry["asset"] for entry in ranker.top("commodities")] == ["Gold"]
@@ -0,0 +1,35 @@
+"""Azure OpenAI client: retries on malformed 200 responses"""
+
+from services.azure_openai_client import AzureOpenAIClient
+from services.circuit_breaker import get_circuit_breaker
+
+
+async def test_truncated_200_body_is_retried(standin, transport):
+    # Seed 1: the first request gets a truncated body, the second a normal one
+    server, url = await standin(malformed_rate=0.5, seed=1)
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+
+    result = await client.generate_article_async("Write about gold.", "gpt-5", max_tokens=100)
+
+    assert result["success"]
+    assert server.injected["malformed"] == 1
+    assert server.request_counts["chat"] == 2
+    assert get_circuit_breaker("gpt-5").stats()["consecutive_failures"] == 0
+
+
+async def test_background_poll_survives_truncated_body(monkeypatch, standin, transport, tmp_path):
+    from services import azure_openai_client
+    from services.background_jobs import BackgroundJobStore
+
+    monkeypatch.setattr(azure_openai_client, "BACKGROUND_POLL_INTERVAL", 0.01)
+    # Seed 15: the submission goes through, the first poll gets a truncated body
+    server, url = await standin(background_duration=0.05, malformed_rate=0.5, seed=15)
+    client = AzureOpenAIClient(transport=transport, job_store=BackgroundJobStore(str(tmp_path / "jobs.json")))
+    client.endpoint = url
+
+    result = await client.generate_article_background("Write about gold.", "gpt-5-pro", max_tokens=100)
+
+    assert result["success"]
+    assert server.injected["malformed"] >= 1
+    assert server.request_counts["responses"] == 1
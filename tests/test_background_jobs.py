@@ -0,0 +1,68 @@
+"""Background jobs: the job store and resuming a submitted job from a new client"""
+
+import pytest
+
+from services import azure_openai_client
+from services.azure_openai_client import AzureOpenAIClient
+from services.background_jobs import BackgroundJobStore
+
+PROMPT = "Write a deep-dive on gold."
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(azure_openai_client, "BACKGROUND_POLL_INTERVAL", 0.01)
+
+
+def make_client(url, transport, path):
+    client = AzureOpenAIClient(transport=transport, job_store=BackgroundJobStore(str(path)))
+    client.endpoint = url
+    return client
+
+
+def test_job_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "jobs.json")
+    BackgroundJobStore(path).put("key-1", "resp_1", "gpt-5-pro")
+
+    store = BackgroundJobStore(path)
+    assert store.get("key-1")["response_id"] == "resp_1"
+    store.remove("key-1")
+    assert BackgroundJobStore(path).pending() == {}
+
+    (tmp_path / "jobs.json").write_text("{not json")
+    assert BackgroundJobStore(path).get("key-1") is None
+
+
+async def test_new_client_resumes_polling_the_stored_job(monkeypatch, standin, transport, tmp_path):
+    server, url = await standin(background_duration=0.5)
+    path = tmp_path / "jobs.json"
+
+    # The first run gives up while the job is still running (e.g. the process is stopped)
+    monkeypatch.setattr(azure_openai_client, "BACKGROUND_MAX_WAIT_SECONDS", 0.05)
+    first = await make_client(url, transport, path).generate_article_background(PROMPT, "gpt-5-pro", max_tokens=100)
+    assert not first["success"]
+    [job] = BackgroundJobStore(str(path)).pending().values()
+    assert job["response_id"] == first["response_id"]
+
+    monkeypatch.setattr(azure_openai_client, "BACKGROUND_MAX_WAIT_SECONDS", 10)
+    resumed = await make_client(url, transport, path).generate_article_background(PROMPT, "gpt-5-pro", max_tokens=100)
+
+    assert resumed["success"]
+    assert resumed["response_id"] == first["response_id"]
+    assert server.request_counts["responses"] == 1
+    assert BackgroundJobStore(str(path)).pending() == {}
+
+
+async def test_job_unknown_to_the_server_is_resubmitted(standin, transport, tmp_path):
+    server, url = await standin(background_duration=0.05)
+    path = tmp_path / "jobs.json"
+    client = make_client(url, transport, path)
+    cache_key = client._cache_key("gpt-5-pro", client._build_request(PROMPT, "gpt-5-pro", 100, None)[1], 100, None)
+    client.job_store.put(cache_key, "resp_expired", "gpt-5-pro")
+
+    result = await client.generate_article_background(PROMPT, "gpt-5-pro", max_tokens=100)
+
+    assert result["success"]
+    assert result["response_id"] != "resp_expired"
+    assert server.request_counts["responses"] == 1
+    assert client.job_store.pending() == {}
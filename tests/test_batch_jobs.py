@@ -0,0 +1,95 @@
+"""Batch jobs: collecting requests into one batch, error lines, cancellation and the local backend"""
+
+import asyncio
+
+from services.azure_openai_client import AzureOpenAIClient
+from services.batch_jobs import BatchJobClient, LocalBatchBackend, interactive_responder
+from utils.standin_server import batch_responder
+
+
+async def failing_responder(body):
+    raise RuntimeError("line rejected")
+
+
+def make_batch_client(tmp_path, transport, url, responder=batch_responder, collect_seconds=0.05) -> BatchJobClient:
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+    backend = LocalBatchBackend(responder, directory=str(tmp_path), duration=0)
+    return BatchJobClient(client, backend=backend, collect_seconds=collect_seconds, poll_interval=0.01)
+
+
+async def test_requests_in_window_share_one_batch(tmp_path, standin, transport):
+    server, url = await standin()
+    batch = make_batch_client(tmp_path, transport, url)
+
+    results = await asyncio.gather(
+        batch.translate_content_async("Gold rallied.", "spanish", "commodities"),
+        batch.translate_content_async("Gold rallied.", "spanish", "commodities"),
+        batch.translate_content_async("Oil slipped.", "portuguese", "commodities")
+    )
+
+    assert all(result["success"] and result["batch"] for result in results)
+    assert results[0]["content"] == results[1]["content"]
+    # Identical requests share a line; nothing went to the interactive endpoint
+    assert batch.stats() == {"batches_submitted": 1, "requests_batched": 2, "requests_served": 2, "fallbacks": 0}
+    assert server.request_counts == {}
+
+
+async def test_failed_line_falls_back_to_interactive_call(tmp_path, standin, transport):
+    server, url = await standin()
+    batch = make_batch_client(tmp_path, transport, url, responder=failing_responder)
+
+    result = await batch.translate_content_async("Gold rallied.", "spanish", "commodities")
+
+    assert result["success"] and not result.get("batch")
+    assert batch.fallbacks == 1
+    assert server.request_counts == {"chat": 1}
+
+
+async def test_non_batched_deployment_runs_interactively(tmp_path, standin, transport):
+    server, url = await standin()
+    batch = make_batch_client(tmp_path, transport, url)
+
+    result = await batch.generate_article_async("Write about gold.", "gpt-5-pro", max_tokens=100)
+
+    assert result["success"]
+    assert batch.batches_submitted == 0
+    assert server.request_counts == {"responses": 1}
+
+
+async def test_cancelled_batch_resolves_every_waiting_caller(tmp_path, standin, transport):
+    server, url = await standin()
+    batch = make_batch_client(tmp_path, transport, url, collect_seconds=10)
+
+    callers = [
+        asyncio.ensure_future(batch.translate_content_async(text, "spanish", "forex"))
+        for text in ("EUR/USD rose.", "USD/JPY fell.")
+    ]
+    await asyncio.sleep(0.05)
+    batch._flush_task.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*callers), timeout=5)
+
+    assert all(result["success"] for result in results)
+    assert batch.fallbacks == 2
+    assert batch._pending == {} and batch._flush_task is None
+
+    # The next request starts a fresh batch
+    batch.collect_seconds = 0.01
+    assert (await batch.translate_content_async("Gold rallied.", "spanish", "commodities"))["batch"]
+
+
+async def test_interactive_responder_answers_lines_through_endpoint(tmp_path, standin, transport):
+    server, url = await standin()
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+    batch = BatchJobClient(
+        client,
+        backend=LocalBatchBackend(interactive_responder(client), directory=str(tmp_path), duration=0),
+        collect_seconds=0.01,
+        poll_interval=0.01
+    )
+
+    result = await batch.generate_article_async("Write about gold.", max_tokens=100)
+
+    assert result["success"] and result["batch"]
+    assert server.request_counts == {"chat": 1}
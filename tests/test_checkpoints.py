@@ -0,0 +1,143 @@
+"""Checkpoints: input fingerprints, resume hits, stale phases and retention"""
+
+import json
+import os
+
+from agents.content_generation_agent import ContentGenerationAgent
+from agents.pipeline import Pipeline, Provisional
+from services.checkpoints import CheckpointStore, fingerprint
+from services.service_container import ServiceContainer
+from utils.standin_server import default_responder
+
+
+def test_fingerprint_ignores_key_order_and_tracks_values():
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test_checkpoints_are_only_read_when_resuming(tmp_path):
+    CheckpointStore("2026-10-17", root=str(tmp_path)).scope("forex-EUR/USD").save("research", "h1", {"x": 1})
+
+    assert CheckpointStore("2026-10-17", root=str(tmp_path)).scope("forex-EUR/USD").load("research", "h1") is None
+
+    resumed = CheckpointStore("2026-10-17", resume=True, root=str(tmp_path))
+    assert resumed.scope("forex-EUR/USD").load("research", "h1") == {"value": {"x": 1}}
+    assert resumed.scope("forex-EUR/USD").load("research", "h2") is None
+    assert resumed.stats()["hits"] == 1 and resumed.stats()["misses"] == 1
+
+
+def test_old_run_folders_are_pruned(tmp_path):
+    (tmp_path / "2020-01-01").mkdir()
+    (tmp_path / "notes").mkdir()
+
+    CheckpointStore("2026-10-17", root=str(tmp_path), retention_days=7)
+
+    assert sorted(os.listdir(tmp_path)) == ["notes"]
+
+
+def counting(result, calls, name):
+    async def run(**inputs):
+        calls.append(name)
+        return result(**inputs) if callable(result) else result
+    return run
+
+
+def build(store, calls, research="gold up"):
+    return (
+        Pipeline(store.scope("commodities-gold"))
+        .add("research", counting(research, calls, "research"))
+        .add("article", counting(lambda research: f"article on {research}", calls, "article"), requires=["research"])
+    )
+
+
+async def test_resumed_run_skips_phases_with_unchanged_inputs(tmp_path):
+    calls = []
+    await build(CheckpointStore("run", root=str(tmp_path), retention_days=0), calls).run()
+    assert calls == ["research", "article"]
+
+    calls.clear()
+    pipeline = build(CheckpointStore("run", resume=True, root=str(tmp_path), retention_days=0), calls)
+    results = await pipeline.run()
+
+    assert calls == []
+    assert results["article"] == "article on gold up"
+    assert pipeline.timings["article"]["resumed"]
+
+
+async def test_changed_upstream_result_invalidates_downstream_checkpoints(tmp_path):
+    calls = []
+    await build(CheckpointStore("run", root=str(tmp_path), retention_days=0), calls).run()
+
+    # Research is redone (e.g. its checkpoint was deleted) and comes back different
+    os.remove(tmp_path / "run" / "commodities-gold" / "research.json")
+    calls.clear()
+    results = await build(
+        CheckpointStore("run", resume=True, root=str(tmp_path), retention_days=0), calls, research="gold down"
+    ).run()
+
+    assert calls == ["research", "article"]
+    assert results["article"] == "article on gold down"
+
+
+async def test_provisional_result_is_redone_on_resume(tmp_path):
+    calls = []
+    outcomes = iter([{"success": False}, {"success": True}])
+
+    async def translation():
+        calls.append("translation")
+        result = next(outcomes)
+        return result if result["success"] else Provisional(result)
+
+    def build_translation(resume):
+        store = CheckpointStore("run", resume=resume, root=str(tmp_path), retention_days=0)
+        return Pipeline(store.scope("forex-eur-usd")).add("translation", translation)
+
+    first = build_translation(resume=False)
+    assert (await first.run())["translation"] == {"success": False}
+    assert first.timings["translation"]["provisional"]
+
+    assert (await build_translation(resume=True).run())["translation"] == {"success": True}
+    assert calls == ["translation", "translation"]
+
+
+def rejecting_spanish(prompt: str) -> str:
+    """Stand-in responder whose reviews reject every Spanish translation"""
+    if '"ACCEPT" or "RETRY"' in prompt and "LANGUAGE: spanish" in prompt:
+        return json.dumps({"quality_score": 40, "issues": ["untranslated terms"], "recommendation": "RETRY"})
+    return default_responder(prompt)
+
+
+async def run_agent(url, transport, tmp_path, resume):
+    services = ServiceContainer(transport=transport)
+    services.openai.endpoint = url
+    services.perplexity.endpoint = f"{url}chat/completions"
+    store = CheckpointStore("run", resume=resume, root=str(tmp_path / "checkpoints"), retention_days=0)
+    agent = ContentGenerationAgent(
+        "commodities",
+        worktree_path=str(tmp_path),
+        services=services,
+        asset="Gold",
+        languages=["spanish", "portuguese"],
+        checkpoints=store.scope("commodities-gold")
+    )
+    return await agent.generate_article()
+
+
+async def test_resumed_agent_retries_failed_translation(tmp_path, standin, transport):
+    server, url = await standin(responder=rejecting_spanish)
+    first = await run_agent(url, transport, tmp_path, resume=False)
+    assert first["success"]
+    assert not first["package"]["languages"].get("es", {}).get("html")
+    requests_before = dict(server.request_counts)
+
+    server.responder = default_responder
+    resumed = await run_agent(url, transport, tmp_path, resume=True)
+
+    assert resumed["success"]
+    phases = resumed["package"]["pipeline"]["phases"]
+    assert phases["generation"]["resumed"] and phases["seo"]["resumed"]
+    assert not phases["translation"].get("resumed")
+    assert resumed["package"]["languages"]["es"]["html"]
+    # Only the translations and their reviews were sent again
+    assert server.request_counts["responses"] == requests_before["responses"]
+    assert server.request_counts["chat"] > requests_before["chat"]
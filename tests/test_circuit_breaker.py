@@ -0,0 +1,89 @@
+"""Circuit breaker: state transitions, which statuses count, and rerouting to the fallback deployment"""
+
+import time
+
+from services.azure_openai_client import AzureOpenAIClient
+from services.circuit_breaker import CircuitBreaker, get_circuit_breaker
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_half_open_probe_closes_or_reopens():
+    breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()  # One probe at a time
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 2
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_throttling_and_server_errors_count_client_errors_do_not():
+    client = AzureOpenAIClient()
+    breaker = CircuitBreaker("test", failure_threshold=100)
+
+    for status in (429, 408, 500, 503):
+        client._record_health(breaker, status)
+    assert breaker.stats()["consecutive_failures"] == 4
+
+    for status in (400, 401, 404):
+        client._record_health(breaker, status)
+    assert breaker.stats()["consecutive_failures"] == 4
+
+    client._record_health(breaker, 200)
+    assert breaker.stats()["consecutive_failures"] == 0
+
+
+async def test_throttled_deployment_opens_circuit_and_fails_fast(standin, transport):
+    server, url = await standin(throttle_rate=1.0, retry_after=0.01)
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+
+    first = await client.generate_article_async("Write about gold.", "gpt-5", max_tokens=100)
+    assert not first["success"]
+    assert get_circuit_breaker("gpt-5").state == CircuitBreaker.OPEN
+    assert server.request_counts["chat"] == 3
+
+    # GPT-5 has no fallback: refused without a request
+    second = await client.generate_article_async("Write about gold.", "gpt-5", max_tokens=100)
+    assert second["circuit_open"]
+    assert server.request_counts["chat"] == 3
+
+
+async def test_open_circuit_reroutes_to_fallback(standin, transport):
+    server, url = await standin()
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+    breaker = get_circuit_breaker("gpt-5-pro")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    result = await client.generate_article_async("Write about gold.", "gpt-5-pro", max_tokens=100)
+
+    assert result["success"]
+    assert result["deployment"] == "gpt-5"
+    assert result["degraded_from"] == "gpt-5-pro"
+    assert server.request_counts == {"chat": 1}
@@ -0,0 +1,90 @@
+"""Run deadline: per-call timeout capping and optional phases dropped near the end of the budget"""
+
+import asyncio
+import time
+
+from agents.content_generation_agent import ContentGenerationAgent
+from config.credentials import DEADLINE_OPTIONAL_PHASE_SECONDS
+from services.azure_openai_client import AzureOpenAIClient
+from services.deadline import (
+    MIN_CALL_TIMEOUT,
+    Deadline,
+    deadline_exceeded,
+    deadline_scope,
+    has_budget,
+    remaining_timeout,
+)
+from services.perplexity_client import PerplexityClient
+from services.service_container import ServiceContainer
+
+
+def test_remaining_timeout_is_capped_by_the_deadline():
+    assert remaining_timeout(60) == 60
+    with deadline_scope(Deadline(10)):
+        assert 9 < remaining_timeout(60) <= 10
+        assert remaining_timeout(5) == 5
+    with deadline_scope(Deadline(-1)):
+        assert remaining_timeout(60) == MIN_CALL_TIMEOUT
+        assert deadline_exceeded()
+    assert not deadline_exceeded()
+
+
+def test_reserve_and_has_budget():
+    run = Deadline(100)
+    generation = run.reserve(30)
+    assert 69 < generation.remaining() <= 70
+    with deadline_scope(generation):
+        assert has_budget(60)
+        assert not has_budget(80)
+    assert has_budget(10 ** 6)
+
+
+async def test_azure_call_times_out_at_the_deadline(standin, transport):
+    server, url = await standin(route_latency={"chat": 2.5})
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+
+    started = time.monotonic()
+    with deadline_scope(Deadline(1.5)):
+        result = await client.generate_article_async("Write about gold.", "gpt-5", max_tokens=100)
+    elapsed = time.monotonic() - started
+
+    # The per-call timeout was cut to the 1.5s left, and no retry followed
+    assert result["deadline_exceeded"]
+    assert elapsed < 3
+    assert server.request_counts["chat"] == 1
+
+
+async def test_perplexity_call_times_out_at_the_deadline(standin, transport):
+    server, url = await standin(route_latency={"perplexity": 2.5})
+    client = PerplexityClient(transport=transport)
+    client.endpoint = f"{url}chat/completions"
+
+    started = time.monotonic()
+    with deadline_scope(Deadline(1.5)):
+        result = await asyncio.to_thread(client._query, "Gold market today?")
+
+    assert not result["success"]
+    assert time.monotonic() - started < 3
+
+
+async def test_optional_phases_are_skipped_when_the_budget_runs_low(tmp_path, standin, transport):
+    server, url = await standin()
+    services = ServiceContainer(transport=transport)
+    services.openai.endpoint = url
+    services.perplexity.endpoint = f"{url}chat/completions"
+    agent = ContentGenerationAgent(
+        "commodities",
+        worktree_path=str(tmp_path),
+        services=services,
+        asset="Gold",
+        languages=["spanish"]
+    )
+
+    with deadline_scope(Deadline(DEADLINE_OPTIONAL_PHASE_SECONDS / 2)):
+        result = await agent.generate_article()
+
+    assert result["success"]
+    skipped = result["package"]["skipped_phases"]
+    assert skipped == ["validation", "improvement", "translation_validation:spanish"]
+    assert result["package"]["languages"]["es"]["html"]
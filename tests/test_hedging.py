@@ -0,0 +1,156 @@
+"""Request hedging: when a duplicate is fired, which result wins, and the hedge budget"""
+
+import asyncio
+
+from services import service_container
+from services.adaptive_timeout import AdaptiveTimeoutPolicy
+from services.azure_openai_client import AzureOpenAIClient
+from services.hedging import HedgingPolicy
+from services.latency_stats import RollingLatencyWindow
+from services.service_container import ServiceContainer
+from services.usage_tracker import call_context
+
+KEY = "gpt-5:translation"
+
+
+def warmed_policy(**options) -> HedgingPolicy:
+    """Policy whose p90 for KEY is 50 ms"""
+    latencies = RollingLatencyWindow()
+    for _ in range(50):
+        latencies.record(KEY, 0.05)
+    return HedgingPolicy(percentile=0.9, min_samples=5, latencies=latencies, **options)
+
+
+def calls_taking(*durations: float):
+    """make_call factory whose n-th invocation takes durations[n] seconds"""
+    started = []
+    cancelled = []
+
+    async def call():
+        index = len(started)
+        started.append(index)
+        try:
+            await asyncio.sleep(durations[index])
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return {"success": True, "content": f"call {index}"}
+
+    return call, started, cancelled
+
+
+async def test_no_hedge_before_enough_samples():
+    policy = HedgingPolicy(min_samples=5)
+    call, started, _ = calls_taking(0.1)
+
+    result = await policy.run(KEY, call)
+
+    assert result["content"] == "call 0"
+    assert started == [0]
+    assert policy.latencies.count(KEY) == 1
+
+
+async def test_fast_call_is_not_hedged():
+    policy = warmed_policy(max_hedge_ratio=1.0)
+    call, started, _ = calls_taking(0.01)
+
+    await policy.run(KEY, call)
+
+    assert started == [0]
+    assert policy.hedges_fired == 0
+
+
+async def test_slow_call_is_hedged_and_loser_cancelled():
+    policy = warmed_policy(max_hedge_ratio=1.0)
+    call, started, cancelled = calls_taking(1.0, 0.01)
+
+    result = await policy.run(KEY, call)
+
+    assert result["content"] == "call 1"
+    assert started == [0, 1]
+    assert cancelled == [0]
+    assert policy.stats()["hedges_won"] == 1
+
+
+async def test_min_budget_allows_first_hedge_below_ratio():
+    # 0.1 * 1 call would round the budget down to no hedge at all
+    policy = warmed_policy(max_hedge_ratio=0.1, min_budget=1)
+
+    call, started, _ = calls_taking(1.0, 0.01)
+    await policy.run(KEY, call)
+    assert started == [0, 1]
+
+    call, started, _ = calls_taking(0.2, 0.01)
+    result = await policy.run(KEY, call)
+    assert started == [0]
+    assert result["content"] == "call 0"
+    assert policy.stats()["hedges_fired"] == 1
+    assert policy.stats()["hedges_skipped_budget"] == 1
+
+
+async def test_without_min_budget_ratio_applies_from_first_call():
+    policy = warmed_policy(max_hedge_ratio=0.1, min_budget=0)
+    call, started, _ = calls_taking(0.2, 0.01)
+
+    await policy.run(KEY, call)
+
+    assert started == [0]
+    assert policy.hedges_skipped_budget == 1
+
+
+async def test_ratio_caps_hedges_after_min_budget():
+    policy = warmed_policy(max_hedge_ratio=0.5, min_budget=1)
+
+    fired = []
+    for _ in range(4):
+        call, started, _ = calls_taking(0.1, 0.01)
+        await policy.run(KEY, call)
+        fired.append(len(started) == 2)
+
+    # Free first hedge, then one hedge per two calls
+    assert fired == [True, False, False, True]
+
+
+async def test_failed_hedge_falls_back_to_primary():
+    policy = warmed_policy(max_hedge_ratio=1.0)
+    invocations = []
+
+    async def call():
+        invocations.append(len(invocations))
+        if len(invocations) == 2:
+            return {"success": False, "error": "503"}
+        await asyncio.sleep(0.2)
+        return {"success": True, "content": "primary"}
+
+    result = await policy.run(KEY, call)
+
+    assert result == {"success": True, "content": "primary"}
+    assert policy.hedges_won == 0
+
+
+def test_container_hedges_on_the_persisted_latency_window(monkeypatch, transport):
+    monkeypatch.setattr(service_container, "HEDGING_ENABLED", True)
+
+    services = ServiceContainer(transport=transport)
+
+    assert services.hedging.latencies is services.latency
+    assert services.openai.hedging is services.hedging
+
+
+async def test_first_seo_call_hedges_from_recorded_history(standin, transport):
+    server, url = await standin(route_latency={"chat": 0.3})
+    latencies = RollingLatencyWindow()
+    for _ in range(5):
+        latencies.record("gpt-5:seo", 0.05)
+    policy = HedgingPolicy(percentile=0.9, min_samples=5, max_hedge_ratio=0.0, min_budget=1, latencies=latencies)
+    client = AzureOpenAIClient(transport=transport, hedging=policy, timeouts=AdaptiveTimeoutPolicy(latencies))
+    client.endpoint = url
+
+    with call_context(phase="seo"):
+        result = await client.generate_seo_metadata_async("Gold rallied.", "commodities", "Gold")
+
+    assert result["success"]
+    assert policy.hedges_fired == 1
+    assert server.request_counts["chat"] == 2
+    # The client records the winning attempt; the policy does not add a second sample
+    assert latencies.count("gpt-5:seo") == 6
@@ -0,0 +1,102 @@
+"""Technical indicators: moving averages, RSI bounds, daily pivots and the engine over price files"""
+
+import numpy as np
+import pytest
+
+from services.indicators import IndicatorEngine, load_ohlc, match_asset, pivot_levels, rsi, sma
+
+DAY = 86400
+
+
+def test_sma_is_nan_until_period_is_filled():
+    result = sma(np.array([[1.0, 2.0, 3.0, 4.0]]), 2)
+
+    assert np.isnan(result[0, 0])
+    assert result[0, 1:].tolist() == [1.5, 2.5, 3.5]
+
+
+def test_rsi_stays_within_bounds():
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(size=(3, 300)), axis=-1)
+    close[1] = np.linspace(100, 200, 300)  # Only gains
+    close[2] = 100.0  # Flat
+
+    values = rsi(close)
+
+    assert np.all((values >= 0) & (values <= 100))
+    assert values[1, -1] == 100.0
+    assert values[2, -1] == 50.0
+
+
+def test_pivots_use_previous_daily_session_not_previous_bar():
+    # Hourly bars: yesterday ranges 40-52 and closes at 49, today's bars are ignored
+    time = np.array([DAY + 3600 * i for i in range(24)] + [2 * DAY + 3600 * i for i in range(3)], dtype=float)
+    high = np.full(time.shape, 50.0)
+    low = np.full(time.shape, 45.0)
+    close = np.full(time.shape, 47.0)
+    high[5], low[10], close[23] = 52.0, 40.0, 49.0
+    high[24:], low[24:], close[24:] = 90.0, 10.0, 60.0
+
+    levels = pivot_levels(time, high, low, close)
+
+    pivot = (52.0 + 40.0 + 49.0) / 3
+    assert levels["pivot"] == pytest.approx(pivot)
+    assert levels["resistance_1"] == pytest.approx(2 * pivot - 40.0)
+    assert levels["support_2"] == pytest.approx(pivot - 12.0)
+
+
+def test_pivots_skip_days_without_bars():
+    # Friday and Monday bars only: Monday's pivots come from Friday
+    time = np.array([4 * DAY, 4 * DAY + 3600, 7 * DAY], dtype=float)
+    levels = pivot_levels(time, np.array([11.0, 12.0, 99.0]), np.array([9.0, 8.0, 1.0]), np.array([10.0, 9.0, 50.0]))
+
+    assert levels["pivot"] == pytest.approx((12.0 + 8.0 + 9.0) / 3)
+
+
+def test_pivots_need_an_earlier_session():
+    time = np.array([[DAY, DAY + 60.0]])
+    levels = pivot_levels(time, np.ones((1, 2)), np.ones((1, 2)), np.ones((1, 2)))
+
+    assert np.isnan(levels["pivot"][0])
+
+
+def write_csv(path, times, closes):
+    rows = ["timestamp,open,high,low,close,volume"]
+    rows += [f"{t},{c},{c + 1},{c - 1},{c},1000" for t, c in zip(times, closes)]
+    path.write_text("\n".join(rows) + "\n")
+
+
+def test_load_ohlc_sorts_bars_and_fills_missing_volume(tmp_path):
+    path = tmp_path / "gold.csv"
+    path.write_text("Date,Open,High,Low,Close\n2026-10-16,2,3,1,2.5\n2026-10-15,1,2,0.5,1.5\n")
+
+    ohlc = load_ohlc(str(path))
+
+    assert ohlc["close"].tolist() == [1.5, 2.5]
+    assert ohlc["time"][1] - ohlc["time"][0] == DAY
+    assert np.isnan(ohlc["volume"]).all()
+
+
+def test_engine_reports_missing_history_as_none(tmp_path):
+    hours = [DAY * 20000 + 3600 * i for i in range(60)]
+    write_csv(tmp_path / "gold.csv", hours, np.linspace(2000, 2100, 60))
+    write_csv(tmp_path / "bitcoin.csv", hours[-30:], np.linspace(60000, 61000, 30))
+    engine = IndicatorEngine({"Gold": "gold", "Bitcoin": "bitcoin", "Silver": "silver"}, data_dir=str(tmp_path), max_age_hours=0)
+
+    results = engine.compute_all()
+
+    assert set(results) == {"Gold", "Bitcoin"}
+    assert results["Gold"]["price"] == 2100.0
+    assert results["Gold"]["sma_50"] is not None
+    assert results["Bitcoin"]["bars"] == 30
+    assert results["Bitcoin"]["sma_50"] is None
+    assert results["Bitcoin"]["sma_20"] is not None
+    assert engine.for_asset("Bitcoin (BTC)") is results["Bitcoin"]
+
+
+def test_match_asset_accepts_longer_research_names():
+    known = ["Gold", "Oil", "EUR/USD"]
+
+    assert match_asset("WTI Crude Oil", known) == "Oil"
+    assert match_asset("eur/usd", known) == "EUR/USD"
+    assert match_asset("Platinum", known) is None
@@ -0,0 +1,94 @@
+"""LLM response cache: TTL expiry, LRU eviction and invalidation of rejected translations"""
+
+import time
+
+from services.azure_openai_client import AzureOpenAIClient
+from services.llm_cache import LLMResponseCache
+
+
+def make_cache(tmp_path, **options) -> LLMResponseCache:
+    return LLMResponseCache(path=str(tmp_path / "cache.sqlite3"), enabled=True, **options)
+
+
+def test_hit_after_set(tmp_path):
+    cache = make_cache(tmp_path)
+    key = cache.make_key("gpt-5", "chat", "prompt", 100, None)
+    cache.set(key, "content", {"total_tokens": 42})
+
+    assert cache.get(key) == {"content": "content", "usage": {"total_tokens": 42}}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["tokens_saved"] == 42
+
+
+def test_key_covers_every_request_field(tmp_path):
+    base = ("gpt-5", "chat", "prompt", 100, None)
+    keys = {
+        LLMResponseCache.make_key(*base),
+        LLMResponseCache.make_key("gpt-5-pro", *base[1:]),
+        LLMResponseCache.make_key(base[0], "responses", *base[2:]),
+        LLMResponseCache.make_key(*base[:2], "other prompt", *base[3:]),
+        LLMResponseCache.make_key(*base[:3], 200, None),
+        LLMResponseCache.make_key(*base[:4], 0.7)
+    }
+    assert len(keys) == 6
+
+
+def test_entry_expires_after_ttl(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("short", "content", {}, ttl_seconds=0.05)
+    cache.set("long", "content", {})
+
+    time.sleep(0.1)
+
+    assert cache.get("short") is None
+    assert cache.get("long") is not None
+    assert cache.stats()["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=25)
+    cache.set("a", "x" * 10, {})
+    cache.set("b", "x" * 10, {})
+    time.sleep(0.01)
+    assert cache.get("a") is not None  # "b" is now the least recently used
+
+    cache.set("c", "x" * 10, {})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_disabled_cache_never_hits(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.enabled = False
+    cache.set("key", "content", {})
+
+    assert cache.get("key") is None
+    assert not (tmp_path / "cache.sqlite3").exists()
+
+
+def test_invalidate_removes_entry(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("key", "content", {})
+    cache.invalidate("key")
+
+    assert cache.get("key") is None
+
+
+async def test_rejected_translation_is_translated_afresh(tmp_path, standin, transport):
+    server, url = await standin()
+    client = AzureOpenAIClient(transport=transport, cache=make_cache(tmp_path))
+    client.endpoint = url
+
+    first = await client.translate_content_async("Gold rallied.", "spanish", "commodities")
+    cached = await client.translate_content_async("Gold rallied.", "spanish", "commodities")
+    assert first["success"] and cached.get("cached")
+    assert server.request_counts["chat"] == 1
+
+    client.forget_translation("Gold rallied.", "spanish", "commodities")
+    retried = await client.translate_content_async("Gold rallied.", "spanish", "commodities")
+
+    assert retried["success"] and not retried.get("cached")
+    assert server.request_counts["chat"] == 2
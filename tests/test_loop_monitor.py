@@ -0,0 +1,29 @@
+"""Event loop stall monitor: blocking calls are reported with their stack, awaits are not"""
+
+import asyncio
+import time
+
+from services.loop_monitor import LoopStallMonitor
+
+
+def blocking_call():
+    time.sleep(0.3)
+
+
+async def test_blocking_call_is_reported_with_its_stack():
+    async with LoopStallMonitor(threshold=0.1) as monitor:
+        blocking_call()
+        await asyncio.sleep(0.1)
+
+    assert len(monitor.stalls) == 1
+    assert "blocking_call" in monitor.stalls[0]["stack"]
+    assert monitor.stalls[0]["seconds"] >= 0.1
+    assert "blocking_call" in monitor.stats()["locations"][0]
+
+
+async def test_awaiting_does_not_stall():
+    async with LoopStallMonitor(threshold=0.1) as monitor:
+        await asyncio.sleep(0.3)
+
+    assert monitor.stalls == []
+    assert monitor.stats()["stalls"] == 0
@@ -0,0 +1,76 @@
+"""Perplexity combined research: schema-constrained parsing, per-category fallback and retry"""
+
+import asyncio
+import json
+
+from services.perplexity_client import PerplexityClient, _parse_market
+from utils.standin_server import RESEARCH_SAMPLE, default_responder
+
+
+def make_client(url, transport):
+    client = PerplexityClient(transport=transport)
+    client.endpoint = f"{url}chat/completions"
+    return client
+
+
+def is_combined(prompt: str) -> bool:
+    return "following the provided schema" in prompt
+
+
+async def test_combined_research_is_parsed_and_shared_across_categories(standin, transport):
+    server, url = await standin()
+    client = make_client(url, transport)
+
+    commodities = await asyncio.to_thread(client.research_market, "commodities")
+    crypto = await asyncio.to_thread(client.research_market, "crypto")
+
+    assert commodities["combined"] and commodities["market"] == RESEARCH_SAMPLE["commodities"]
+    assert crypto["market"] == RESEARCH_SAMPLE["crypto"]
+    assert server.request_counts["perplexity"] == 1
+
+    selected = client.select_best_asset(crypto, "crypto")
+    assert selected["asset"] == "Bitcoin"
+    assert selected["change"] == "+2.50%" and selected["sentiment"] == "bullish"
+
+
+async def test_category_missing_from_combined_research_is_queried_separately(standin, transport):
+    per_category = [{"commodity_name": "Silver", "price": "$31.20", "change_pct": 2.1, "significance_score": 80}]
+
+    def responder(prompt):
+        if is_combined(prompt):
+            return json.dumps({**RESEARCH_SAMPLE, "commodities": {"assets": []}})
+        return f"```json\n{json.dumps(per_category)}\n```"
+
+    server, url = await standin(responder=responder)
+    client = make_client(url, transport)
+
+    result = await asyncio.to_thread(client.research_market, "commodities")
+
+    assert result["success"] and not result.get("combined")
+    assert server.request_counts["perplexity"] == 2
+    assert _parse_market(result["content"]) == {"assets": per_category}
+    assert client.select_best_asset(result, "commodities")["asset"] == "Silver"
+
+
+async def test_failed_combined_research_is_retried_by_the_next_agent(standin, transport):
+    combined_calls = []
+
+    def responder(prompt):
+        if is_combined(prompt):
+            combined_calls.append(prompt)
+            # First answer is not JSON; later ones follow the schema
+            return "Markets were mixed today." if len(combined_calls) == 1 else json.dumps(RESEARCH_SAMPLE)
+        return default_responder(prompt)
+
+    server, url = await standin(responder=responder)
+    client = make_client(url, transport)
+
+    forex = await asyncio.to_thread(client.research_market, "forex")
+    crypto = await asyncio.to_thread(client.research_market, "crypto")
+    commodities = await asyncio.to_thread(client.research_market, "commodities")
+
+    # The failed combined call fell back to a forex query and was not kept
+    assert forex["success"] and not forex.get("combined")
+    assert crypto["combined"] and commodities["combined"]
+    assert len(combined_calls) == 2
+    assert server.request_counts["perplexity"] == 3
@@ -0,0 +1,89 @@
+"""Phase pipeline: dependency order, concurrency, failures and the critical path"""
+
+import asyncio
+import time
+
+import pytest
+
+from agents.pipeline import PhaseFailed, Pipeline
+
+
+def phase(result, seconds=0.0, log=None):
+    async def run(**inputs):
+        if log is not None:
+            log.append(("start", result, sorted(inputs)))
+        await asyncio.sleep(seconds)
+        return result
+    return run
+
+
+async def test_phases_receive_their_inputs_in_dependency_order():
+    log = []
+    pipeline = (
+        Pipeline()
+        .add("research", phase("r", log=log))
+        .add("article", phase("a", log=log), requires=["research"])
+        .add("seo", phase("s", log=log), requires=["article", "research"])
+    )
+
+    results = await pipeline.run()
+
+    assert results == {"research": "r", "article": "a", "seo": "s"}
+    assert log == [("start", "r", []), ("start", "a", ["research"]), ("start", "s", ["article", "research"])]
+
+
+async def test_independent_phases_run_concurrently():
+    pipeline = (
+        Pipeline()
+        .add("article", phase("a"))
+        .add("spanish", phase("es", 0.2), requires=["article"])
+        .add("arabic", phase("ar", 0.2), requires=["article"])
+        .add("portuguese", phase("pt", 0.2), requires=["article"])
+    )
+
+    started = time.monotonic()
+    await pipeline.run()
+
+    assert time.monotonic() - started < 0.5
+
+
+def test_unknown_requirement_is_rejected():
+    with pytest.raises(ValueError):
+        Pipeline().add("seo", phase("s"), requires=["article"])
+
+
+async def test_failing_phase_cancels_running_phases():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    async def failing():
+        raise PhaseFailed("translation rejected")
+
+    pipeline = Pipeline().add("slow", slow).add("failing", failing)
+
+    with pytest.raises(PhaseFailed, match="translation rejected"):
+        await pipeline.run()
+    assert cancelled == ["slow"]
+
+
+async def test_critical_path_follows_the_slowest_inputs():
+    pipeline = (
+        Pipeline()
+        .add("research", phase("r", 0.05))
+        .add("image", phase("i", 0.01))
+        .add("article", phase("a", 0.1), requires=["research"])
+        .add("package", phase("p"), requires=["article", "image"])
+    )
+    await pipeline.run()
+
+    report = pipeline.report()
+
+    assert report["critical_path"] == ["research", "article", "package"]
+    assert report["phases"]["package"]["requires"] == ["article", "image"]
+    assert report["total_seconds"] >= 0.15
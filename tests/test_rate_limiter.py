@@ -0,0 +1,81 @@
+"""Token-bucket rate limiter: queueing at the quota and Retry-After handling"""
+
+import time
+
+import pytest
+
+from services import rate_limiter
+from services.azure_openai_client import AzureOpenAIClient
+from services.rate_limiter import TokenBucketRateLimiter, _parse_retry_after
+
+
+def test_burst_within_quota_does_not_wait():
+    limiter = TokenBucketRateLimiter("test", requests_per_minute=60, tokens_per_minute=0)
+
+    assert [limiter.reserve(100) for _ in range(60)] == [0.0] * 60
+
+
+def test_requests_over_quota_queue_in_arrival_order():
+    limiter = TokenBucketRateLimiter("test", requests_per_minute=60, tokens_per_minute=0)
+    for _ in range(60):
+        limiter.reserve(0)
+
+    waits = [limiter.reserve(0) for _ in range(3)]
+
+    assert waits == pytest.approx([1.0, 2.0, 3.0], abs=0.05)
+
+
+def test_token_quota_counts_estimated_tokens():
+    limiter = TokenBucketRateLimiter("test", requests_per_minute=0, tokens_per_minute=6000)
+
+    assert limiter.reserve(6000) == 0.0
+    assert limiter.reserve(3000) == pytest.approx(30.0, abs=0.1)
+
+
+def test_remaining_headers_lower_local_budget():
+    limiter = TokenBucketRateLimiter("test", requests_per_minute=60, tokens_per_minute=0)
+    limiter.update_from_headers({"x-ratelimit-remaining-requests": "0"}, 200)
+
+    assert limiter.reserve(0) == pytest.approx(1.0, abs=0.05)
+
+
+def test_429_pauses_every_caller_for_retry_after():
+    limiter = TokenBucketRateLimiter("test", requests_per_minute=0, tokens_per_minute=0)
+    limiter.update_from_headers({"Retry-After": "5"}, 429)
+
+    assert limiter.reserve(0) == pytest.approx(5.0, abs=0.05)
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_retry_after_formats():
+    assert _parse_retry_after({"retry-after-ms": "1500", "retry-after": "9"}) == 1.5
+    assert _parse_retry_after({"retry-after": "2"}) == 2.0
+    assert _parse_retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert _parse_retry_after({}) is None
+
+
+async def test_acquire_sleeps_until_capacity_refills():
+    limiter = TokenBucketRateLimiter("test", requests_per_minute=600, tokens_per_minute=0)
+    for _ in range(600):
+        limiter.reserve(0)
+
+    started = time.monotonic()
+    await limiter.acquire(0)
+
+    assert time.monotonic() - started >= 0.09
+
+
+async def test_throttled_deployment_waits_for_retry_after(monkeypatch, standin, transport):
+    monkeypatch.setattr(rate_limiter, "_limiters", {})
+    server, url = await standin(throttle_rate=1.0, retry_after=0.2)
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+
+    started = time.monotonic()
+    result = await client.generate_article_async("Write about gold.", "gpt-5", max_tokens=100)
+
+    assert not result["success"]
+    limiter = rate_limiter.get_rate_limiter("gpt-5")
+    assert limiter.throttled == server.injected["429"] == 3
+    # Two retries, each held back by the server's Retry-After
+    assert time.monotonic() - started >= 0.4
@@ -0,0 +1,82 @@
+"""Research cache: fresh and stale hits, background refresh and session-keyed expiry"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from services import research_cache
+from services.perplexity_client import PerplexityClient
+from services.research_cache import ResearchCache, session_window
+from utils.standin_server import RESEARCH_SAMPLE
+
+OLD_RESULT = {"success": True, "content": "old research", "market": {"assets": []}}
+
+
+def make_cache(tmp_path):
+    return ResearchCache(path=str(tmp_path / "research.json"), ttl_seconds=60, max_stale_seconds=600, enabled=True)
+
+
+def age_entries(cache, seconds):
+    """Move every stored entry `seconds` into the past"""
+    with open(cache.path, encoding="utf-8") as f:
+        entries = json.load(f)
+    for entry in entries.values():
+        entry["stored_at"] -= seconds
+    with open(cache.path, "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+
+
+def test_session_windows_follow_market_hours():
+    assert session_window(datetime(2026, 10, 17, 6, 59, tzinfo=timezone.utc)) == "2026-10-17:asia"
+    assert session_window(datetime(2026, 10, 17, 7, 0, tzinfo=timezone.utc)) == "2026-10-17:london"
+    assert session_window(datetime(2026, 10, 17, 13, 30, tzinfo=timezone.utc)) == "2026-10-17:new_york"
+    assert session_window(datetime(2026, 10, 17, 23, 0, tzinfo=timezone.utc)) == "2026-10-17:after_hours"
+
+
+def test_entries_are_fresh_then_stale_then_expired(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("forex", {**OLD_RESULT, "data": {"raw": "response"}})
+
+    fresh = cache.get("forex")
+    assert not fresh["stale"] and "data" not in fresh["result"]
+
+    age_entries(cache, 120)
+    assert cache.get("forex")["stale"]
+
+    age_entries(cache, 600)
+    assert cache.get("forex") is None
+    assert cache.stats() == {"enabled": True, "hits": 1, "stale_hits": 1, "misses": 1, "stores": 1, "hit_rate": 0.667}
+
+
+def test_entries_do_not_carry_over_into_the_next_session(monkeypatch, tmp_path):
+    cache = make_cache(tmp_path)
+    monkeypatch.setattr(research_cache, "session_window", lambda: "2026-10-17:london")
+    cache.put("forex", OLD_RESULT)
+    assert cache.get("forex")
+
+    monkeypatch.setattr(research_cache, "session_window", lambda: "2026-10-17:new_york")
+    assert cache.get("forex") is None
+
+
+async def test_stale_research_is_served_and_refreshed_in_the_background(standin, transport, tmp_path):
+    server, url = await standin(latency=0.1)
+    cache = make_cache(tmp_path)
+    cache.put("forex", OLD_RESULT)
+    age_entries(cache, 120)
+    client = PerplexityClient(transport=transport, cache=cache)
+    client.endpoint = f"{url}chat/completions"
+
+    served = await asyncio.to_thread(client.research_market, "forex")
+
+    # Answered from the stale entry without waiting for Perplexity
+    assert served["stale"] and served["content"] == "old research"
+    for _ in range(100):
+        if not client._refreshing:
+            break
+        await asyncio.sleep(0.02)
+
+    assert server.request_counts["perplexity"] == 1
+    # One combined refresh fills every category
+    for category in ("forex", "crypto", "commodities"):
+        entry = cache.get(category)
+        assert not entry["stale"] and entry["result"]["market"] == RESEARCH_SAMPLE[category]
@@ -0,0 +1,34 @@
+"""Run plan: ranked picks per category, plan ids and unsupported languages"""
+
+import json
+
+from agents.scheduler import RunPlan, load_run_plan
+
+UNIVERSE = {
+    "forex": {"EUR/USD": {}, "USD/JPY": {}},
+    "crypto": {"Bitcoin": {}}
+}
+
+
+def test_default_plan_ranks_each_category_up_to_its_universe():
+    plan = load_run_plan(None, UNIVERSE, categories=["forex", "crypto"], per_category=2, languages=["spanish"])
+
+    assert [(a["category"], a["rank"]) for a in plan.articles] == [("forex", 0), ("forex", 1), ("crypto", 0)]
+    assert [RunPlan.article_key(a) for a in plan.articles] == ["forex-ranked-1", "forex-ranked-2", "crypto-ranked-1"]
+
+
+def test_plan_file_ids_keep_repeated_assets_apart(tmp_path):
+    path = tmp_path / "plan.json"
+    path.write_text(json.dumps({
+        "articles": [
+            {"category": "crypto", "asset": "Bitcoin", "id": "btc-morning"},
+            {"category": "crypto", "asset": "Bitcoin", "id": "btc-evening"},
+            {"category": "forex", "asset": "EUR/USD"}
+        ],
+        "languages": ["spanish", "klingon"]
+    }))
+
+    plan = load_run_plan(str(path), UNIVERSE)
+
+    assert [RunPlan.article_key(a) for a in plan.articles] == ["crypto-btc-morning", "crypto-btc-evening", "forex-EUR/USD"]
+    assert plan.languages == ["spanish"]
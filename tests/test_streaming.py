@@ -0,0 +1,70 @@
+"""ArticleStream: SSE parsing for Chat Completions and Responses, and streams that break off"""
+
+import pytest
+
+from services.azure_openai_client import AzureOpenAIClient
+
+ARTICLE = " ".join(f"Gold held its range in session {i}." for i in range(20))
+
+
+def article_responder(prompt: str) -> str:
+    return ARTICLE
+
+
+@pytest.fixture
+def client(transport):
+    return AzureOpenAIClient(transport=transport)
+
+
+async def consume(stream):
+    return [delta async for delta in stream]
+
+
+@pytest.mark.parametrize("deployment, route", [("gpt-5", "chat"), ("gpt-5-pro", "responses")])
+async def test_stream_yields_deltas_and_final_usage(client, standin, deployment, route):
+    server, url = await standin(responder=article_responder)
+    client.endpoint = url
+
+    stream = client.stream_article("Write about gold.", deployment, max_tokens=500)
+    deltas = await consume(stream)
+    result = stream.result()
+
+    assert len(deltas) > 1
+    assert result["success"]
+    assert result["content"] == "".join(deltas) == ARTICLE
+    assert result["usage"]["completion_tokens"] > 0 and result["usage"]["prompt_tokens"] > 0
+    assert result["time_to_first_token"] is not None
+    assert server.request_counts[route] == 1
+
+
+@pytest.mark.parametrize("deployment, route", [("gpt-5", "chat"), ("gpt-5-pro", "responses")])
+async def test_stream_broken_off_keeps_partial_content_without_retrying(client, standin, deployment, route):
+    # Chat Completions drops the connection, Responses sends response.failed
+    server, url = await standin(responder=article_responder, stream_cutoff=2)
+    client.endpoint = url
+
+    stream = client.stream_article("Write about gold.", deployment, max_tokens=500)
+    deltas = await consume(stream)
+    result = stream.result()
+
+    assert len(deltas) == 2
+    assert not result["success"]
+    assert result["content"] == "".join(deltas) == ARTICLE[:128]
+    assert "Stream interrupted" in result["error"]
+    # Deltas were already handed out, so the call is not replayed
+    assert server.request_counts[route] == 1
+    [record] = client.usage.records()
+    assert not record["success"] and record["retries"] == 0
+
+
+def test_stream_events_are_parsed_per_api(client):
+    chat_delta = {"choices": [{"delta": {"content": "Gold"}}]}
+    chat_usage = {"choices": [], "usage": {"prompt_tokens": 5, "completion_tokens": 7, "total_tokens": 12}}
+    assert client._parse_stream_event(chat_delta, False) == ("Gold", None, None)
+    assert client._parse_stream_event(chat_usage, False)[1]["completion_tokens"] == 7
+
+    text_delta = {"type": "response.output_text.delta", "delta": "Gold"}
+    failed = {"type": "response.failed", "response": {"error": {"message": "boom"}}}
+    assert client._parse_stream_event(text_delta, True) == ("Gold", None, None)
+    assert client._parse_stream_event({"type": "response.created"}, True) == ("", None, None)
+    assert "boom" in client._parse_stream_event(failed, True)[2]
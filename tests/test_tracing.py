@@ -0,0 +1,101 @@
+"""Tracing: span nesting across tasks, failures, OTLP export and the waterfall view"""
+
+import asyncio
+
+import pytest
+
+from services.azure_openai_client import AzureOpenAIClient
+from services.tracing import Tracer, get_tracer
+from utils.trace_waterfall import load_spans, render, summarize
+
+
+async def test_spans_nest_across_gathered_tasks():
+    tracer = Tracer(enabled=True)
+
+    async def agent(name):
+        with tracer.span("agent", article=name):
+            with tracer.span("phase", phase="research"):
+                await asyncio.sleep(0)
+
+    with tracer.span("run") as run:
+        await asyncio.gather(agent("gold"), agent("oil"))
+
+    agents = [s for s in tracer.spans() if s.name == "agent"]
+    phases = [s for s in tracer.spans() if s.name == "phase"]
+    assert len(tracer.spans()) == 5
+    assert all(s.trace_id == run.trace_id for s in tracer.spans())
+    assert all(s.parent_id == run.span_id for s in agents)
+    assert sorted(s.parent_id for s in phases) == sorted(s.span_id for s in agents)
+
+
+def test_exception_marks_span_failed():
+    tracer = Tracer(enabled=True)
+
+    with pytest.raises(ValueError):
+        with tracer.span("phase", phase="seo"):
+            raise ValueError("bad json")
+
+    assert tracer.spans()[0].error == "ValueError('bad json')"
+    assert tracer.spans()[0].to_otlp()["status"] == {"code": 2, "message": "ValueError('bad json')"}
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+    with tracer.span("run"):
+        pass
+
+    assert tracer.spans() == []
+
+
+def test_export_round_trips_through_waterfall(tmp_path):
+    tracer = Tracer(enabled=True)
+    with tracer.span("run", step="daily") as run:
+        with tracer.span("http.attempt", deployment="gpt-5", attempt=2, status_code=200):
+            pass
+        tracer.start("unfinished", parent=run)  # Never ended: not exported
+
+    path = tracer.export(str(tmp_path / "trace.json"))
+    spans = load_spans(path)
+
+    assert tracer.spans() == []
+    assert [s["name"] for s in spans] == ["run", "http.attempt"]
+    assert spans[1]["parent"] == spans[0]["id"]
+    assert spans[1]["attributes"] == {"deployment": "gpt-5", "attempt": 2, "status_code": 200}
+
+    waterfall = render(spans, width=20)
+    assert "run daily" in waterfall
+    assert "  http.attempt gpt-5 #2" in waterfall
+    assert "http.attempt gpt-5 #2" in summarize(spans)
+
+
+def test_waterfall_shows_orphans_as_roots_and_hides_short_spans():
+    spans = [
+        {"id": "a", "parent": "gone", "name": "agent", "start": 0.0, "end": 2.0, "attributes": {}, "error": None},
+        {"id": "b", "parent": "a", "name": "phase", "start": 0.0, "end": 0.1, "attributes": {}, "error": None},
+        {"id": "c", "parent": "a", "name": "phase", "start": 0.1, "end": 2.0, "attributes": {"phase": "seo"}, "error": "timeout"}
+    ]
+
+    waterfall = render(spans, width=20, min_seconds=0.5)
+
+    assert waterfall.splitlines()[1].startswith("agent")
+    assert "phase seo" in waterfall and "✗ timeout" in waterfall
+    assert waterfall.count("phase") == 1
+    assert render([]) == "(empty trace)"
+
+
+async def test_provider_call_records_http_attempts(standin, transport):
+    server, url = await standin()
+    client = AzureOpenAIClient(transport=transport)
+    client.endpoint = url
+    tracer = get_tracer()
+
+    with tracer.span("agent", article="gold") as agent:
+        result = await client.generate_article_async("Write about gold.", "gpt-5", max_tokens=100)
+
+    assert result["success"]
+    spans = tracer.spans(agent.trace_id)
+    attempts = [s for s in spans if s.name == "http.attempt"]
+    assert len(attempts) == 1
+    assert attempts[0].attributes["status_code"] == 200
+    call = next(s for s in spans if s.span_id == attempts[0].parent_id)
+    assert call.parent_id == agent.span_id
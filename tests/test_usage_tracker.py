@@ -0,0 +1,83 @@
+"""Usage tracker: per-call tokens, retries and cost attributed through the call context"""
+
+import asyncio
+
+import pytest
+
+from services.azure_openai_client import AzureOpenAIClient
+from services.usage_tracker import UsageCollector, call_context, current_call_context, estimate_cost
+
+
+def test_cost_discounts_cached_prompt_tokens():
+    # gpt-5 at $1.25 / $10 per million tokens, cached input at 10%
+    assert estimate_cost("gpt-5", {"prompt_tokens": 1_000_000, "completion_tokens": 100_000}) == pytest.approx(2.25)
+    assert estimate_cost(
+        "gpt-5", {"prompt_tokens": 1_000_000, "cached_tokens": 800_000, "completion_tokens": 0}
+    ) == pytest.approx(0.35)
+    assert estimate_cost("unpriced", {"prompt_tokens": 1000, "completion_tokens": 1000}) == 0.0
+
+
+def test_nested_contexts_merge_labels():
+    with call_context(category="forex"):
+        with call_context(phase="translation", language="spanish"):
+            assert current_call_context() == {"category": "forex", "phase": "translation", "language": "spanish"}
+        assert current_call_context() == {"category": "forex"}
+    assert current_call_context() == {}
+
+
+def test_cached_and_batched_calls_are_priced_accordingly():
+    usage = UsageCollector()
+    tokens = {"prompt_tokens": 1_000_000, "completion_tokens": 0}
+    usage.record("gpt-5", {"success": True, "usage": tokens}, latency=1.0, attempts=1)
+    usage.record("gpt-5", {"success": True, "usage": tokens, "batch": True}, latency=1.0, attempts=1)
+    usage.record("gpt-5", {"success": True, "usage": tokens, "cached": True}, latency=0.0, attempts=0)
+
+    assert [r["cost_usd"] for r in usage.records()] == [1.25, 0.625, 0.0]
+
+
+async def test_calls_are_attributed_to_their_agent_and_phase(standin, transport):
+    server, url = await standin()
+    client = AzureOpenAIClient(transport=transport, usage=UsageCollector())
+    client.endpoint = url
+
+    async def agent(category, language):
+        with call_context(category=category):
+            with call_context(phase="generation"):
+                await client.generate_article_async(f"Write about {category}.", "gpt-5", max_tokens=100)
+            with call_context(phase="translation", language=language):
+                await client.translate_content_async(f"{category} text", language)
+
+    # Concurrent agents must not see each other's labels
+    await asyncio.gather(agent("forex", "spanish"), agent("crypto", "arabic"))
+
+    records = client.usage.records()
+    assert sorted((r["category"], r["phase"], r.get("language")) for r in records) == [
+        ("crypto", "generation", None),
+        ("crypto", "translation", "arabic"),
+        ("forex", "generation", None),
+        ("forex", "translation", "spanish"),
+    ]
+    summary = client.usage.summary()
+    assert summary["by_category"]["forex"]["calls"] == 2
+    assert summary["by_language"]["unlabelled"]["calls"] == 2
+    assert summary["by_phase"]["generation"]["prompt_tokens"] > 0
+    assert summary["totals"]["cost_usd"] == pytest.approx(sum(r["cost_usd"] for r in records), abs=1e-4)
+
+
+async def test_retries_are_counted_on_the_phase_that_made_them(standin, transport):
+    # Seed 1: the first request is throttled, the retry succeeds
+    server, url = await standin(throttle_rate=0.5, retry_after=0.01, seed=1)
+    client = AzureOpenAIClient(transport=transport, usage=UsageCollector())
+    client.endpoint = url
+
+    with call_context(category="commodities", phase="seo"):
+        result = await client.generate_article_async("Write SEO metadata for gold.", "gpt-5", max_tokens=100)
+    with call_context(category="commodities", phase="generation"):
+        await client.generate_article_async("Write about gold.", "gpt-5", max_tokens=100)
+
+    assert result["success"]
+    assert server.injected["429"] == 1
+    summary = client.usage.summary()
+    assert summary["by_phase"]["seo"]["retries"] == 1
+    assert summary["by_phase"]["generation"]["retries"] == 0
+    assert summary["totals"]["calls"] == 2 and summary["totals"]["failures"] == 0
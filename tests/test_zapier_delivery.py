@@ -0,0 +1,73 @@
+"""Incremental Zapier delivery: idempotency keys, duplicate handling and a missing webhook URL"""
+
+from services.zapier_delivery import ZapierDelivery
+
+
+def article(asset="Gold", article_id=None):
+    package = {
+        "category": "commodities",
+        "asset": asset,
+        "generated_at": "2026-10-17T06:00:00",
+        "image": {},
+        "languages": {"en": {"html": "<p>Gold rallied.</p>", "seo": {"title": "Gold rallies"}, "quality_score": 90}}
+    }
+    if article_id:
+        package["article_id"] = article_id
+    return package
+
+
+def test_idempotency_key_identifies_one_article_delivery():
+    key = ZapierDelivery.idempotency_key(article(), "2026-10-17")
+
+    assert key == ZapierDelivery.idempotency_key(article(), "2026-10-17")
+    assert len(key) == 32
+    assert key != ZapierDelivery.idempotency_key(article(), "2026-10-18")
+    assert key != ZapierDelivery.idempotency_key(article("Silver"), "2026-10-17")
+
+
+def test_repeated_asset_gets_distinct_keys_per_plan_id():
+    first = ZapierDelivery.idempotency_key(article(article_id="gold-1"), "2026-10-17")
+    second = ZapierDelivery.idempotency_key(article(article_id="gold-2"), "2026-10-17")
+
+    assert first != second
+
+
+async def test_redelivery_with_same_key_is_dropped_by_the_hook(standin, transport):
+    server, url = await standin()
+    zapier = ZapierDelivery(transport=transport)
+    zapier.webhook_url = f"{url}hooks/zapier"
+    key = ZapierDelivery.idempotency_key(article(), "2026-10-17")
+
+    first = await zapier.send_article_async(article(), key)
+    retried = await zapier.send_article_async(article(), key)
+
+    assert first["success"] and retried["success"]
+    assert server.request_counts["zapier"] == 2
+    assert len(server.webhook_events) == 1
+    event = server.webhook_events[0]
+    assert event["idempotency_key"] == key
+    assert event["body"]["event"] == "article"
+    assert event["body"]["articles"][0]["specific_asset"] == "Gold"
+
+
+async def test_summary_closes_the_delivery(standin, transport):
+    server, url = await standin()
+    zapier = ZapierDelivery(transport=transport)
+    zapier.webhook_url = f"{url}hooks/zapier"
+
+    result = await zapier.send_summary_async({"delivered": ["k1"], "failed": []}, "summary-2026-10-17")
+
+    assert result["success"]
+    assert server.webhook_events[0]["body"]["event"] == "summary"
+    assert server.webhook_events[0]["body"]["delivered"] == ["k1"]
+
+
+async def test_missing_webhook_url_fails_without_posting(standin, transport):
+    server, _ = await standin()
+    zapier = ZapierDelivery(transport=transport)
+    zapier.webhook_url = None
+
+    result = await zapier.send_article_async(article(), "key")
+
+    assert result == {"success": False, "error": "ZAPIER_WEBHOOK_URL is not configured", "idempotency_key": "key"}
+    assert server.request_counts == {}